@@ -0,0 +1,504 @@
+"""
+Synthetic, schema-faithful F1 dataset generator for benchmarks.
+
+Writes drivers.csv, constructors.csv, races.csv, results.csv,
+constructor_results.csv, constructor_standings.csv, driver_standings.csv,
+sprint_results.csv, qualifying.csv, weather.csv, lap_times.csv and
+pit_stops.csv with the same columns, "\\N" missing values and value formats
+as the bundled data, so the files can be loaded by pointing
+F1_ANALYTICS_DATA_PATH at the output directory.
+
+    python -m benchmarks.generator --scale 10 --output /tmp/f1_10x
+    python -m benchmarks.generator --seasons 300 --weather-interval 10 --output /tmp/f1_long
+"""
+import argparse
+import os
+import numpy as np
+import pandas as pd
+
+LAST_SEASON = 2023
+# Races are dated, so seasons must stay within the datetime64[ns] range.
+FIRST_POSSIBLE_SEASON = 1678
+POINTS = np.array([25, 18, 15, 12, 10, 8, 6, 4, 2, 1], dtype=float)
+SPRINT_POINTS = np.array([8, 7, 6, 5, 4, 3, 2, 1], dtype=float)
+# Sprints are held from this season on, in every fourth round
+SPRINTS_FROM = 2021
+# Qualifying results are recorded from this season on
+QUALIFYING_FROM = 1994
+NATIONALITIES = [
+    "British", "German", "Brazilian", "French", "Italian", "Finnish",
+    "Spanish", "Dutch", "Australian", "American", "Austrian", "Mexican",
+]
+FORENAMES = [
+    "Lewis", "Max", "Sebastian", "Fernando", "Kimi", "Michael", "Nico",
+    "Jenson", "Mark", "Felipe", "Daniel", "Carlos", "Charles", "Lando",
+    "George", "Pierre", "Esteban", "Valtteri", "Sergio", "Lance",
+]
+SURNAMES = [
+    "Hamilton", "Verstappen", "Vettel", "Alonso", "Raikkonen", "Schumacher",
+    "Rosberg", "Button", "Webber", "Massa", "Ricciardo", "Sainz", "Leclerc",
+    "Norris", "Russell", "Gasly", "Ocon", "Bottas", "Perez", "Stroll",
+]
+
+
+class DatasetGenerator:
+    """
+    Generates a synthetic dataset.
+
+    scale multiplies the number of rounds of every season, seasons sets how
+    many seasons (ending in 2023) are generated and weather_interval is the
+    number of seconds between weather samples.
+    """
+
+    def __init__(
+        self,
+        scale: int = 1,
+        seasons: int = 74,
+        grid_size: int = 24,
+        rookies_per_season: int = 8,
+        weather_from: int = 2018,
+        weather_interval: float = 60.0,
+        race_duration: float = 6600.0,
+        lap_times_from: int = 1996,
+        seed: int = 0,
+    ) -> None:
+        if LAST_SEASON - seasons + 1 < FIRST_POSSIBLE_SEASON:
+            raise ValueError(
+                f"At most {LAST_SEASON - FIRST_POSSIBLE_SEASON + 1} seasons are supported"
+            )
+        self._rounds = 15 * scale
+        self._seasons = np.arange(LAST_SEASON - seasons + 1, LAST_SEASON + 1)
+        self._grid_size = grid_size
+        self._rookies = rookies_per_season
+        self._weather_from = weather_from
+        self._weather_interval = weather_interval
+        self._race_duration = race_duration
+        self._lap_times_from = lap_times_from
+        self._rng = np.random.default_rng(seed)
+
+    def generate(self, output_dir: str) -> dict[str, int]:
+        """
+        Write the CSV files, returns the number of rows of each file
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        races = self._generate_races()
+        results = self._generate_results(races)
+        lap_times, pit_stops = self._generate_lap_times(races, results)
+        drivers = self._generate_drivers()
+        weather = self._generate_weather(races)
+        constructor_results = self._generate_constructor_results(results)
+        tables = {
+            "drivers.csv": drivers,
+            "constructors.csv": self._generate_constructors(),
+            "races.csv": races,
+            "results.csv": results,
+            "constructor_results.csv": constructor_results,
+            "constructor_standings.csv": self._generate_standings(
+                races, results, constructor_results, "constructorId", "constructorStandingsId"
+            ),
+            "driver_standings.csv": self._generate_standings(
+                races, results, results, "driverId", "driverStandingsId"
+            ),
+            "weather.csv": weather,
+            "lap_times.csv": lap_times,
+            "pit_stops.csv": pit_stops,
+            "sprint_results.csv": self._generate_sprint_results(races, results),
+            "qualifying.csv": self._generate_qualifying(races, results),
+        }
+        for filename, table in tables.items():
+            table.to_csv(os.path.join(output_dir, filename), index=False, na_rep="\\N")
+        return {filename: len(table) for filename, table in tables.items()}
+
+    def _generate_drivers(self) -> pd.DataFrame:
+        count = len(self._seasons) * self._rookies + self._grid_size
+        ids = np.arange(1, count + 1)
+        forenames = np.array(FORENAMES)[ids % len(FORENAMES)]
+        surnames = np.char.add(
+            np.array(SURNAMES)[(ids // len(FORENAMES)) % len(SURNAMES)],
+            np.char.add(" ", ids.astype(str)),
+        )
+        numbers = pd.array(self._rng.integers(1, 100, count), dtype="Int64")
+        numbers[self._rng.random(count) < 0.7] = pd.NA
+        refs = np.char.lower(np.char.replace(surnames, " ", "_"))
+        return pd.DataFrame(
+            {
+                "driverId": ids,
+                "driverRef": refs,
+                "number": numbers,
+                "code": np.char.upper(np.array([ref[:3] for ref in refs])),
+                "forename": forenames,
+                "surname": surnames,
+                "dob": pd.to_datetime("1960-01-01")
+                + pd.to_timedelta(self._rng.integers(0, 15000, count), unit="D"),
+                "nationality": self._rng.choice(NATIONALITIES, count),
+                "url": np.char.add("http://en.wikipedia.org/wiki/", refs),
+            }
+        )
+
+    def _generate_constructors(self) -> pd.DataFrame:
+        count = (self._grid_size + 1) // 2
+        ids = np.arange(1, count + 1)
+        names = np.char.add(
+            np.array(SURNAMES)[(ids - 1) % len(SURNAMES)],
+            np.char.add(" Racing ", ids.astype(str)),
+        )
+        refs = np.char.lower(np.char.replace(names, " ", "_"))
+        return pd.DataFrame(
+            {
+                "constructorId": ids,
+                "constructorRef": refs,
+                "name": names,
+                "nationality": self._rng.choice(NATIONALITIES, count),
+                "url": np.char.add("http://en.wikipedia.org/wiki/", refs),
+            }
+        )
+
+    def _generate_races(self) -> pd.DataFrame:
+        years = np.repeat(self._seasons, self._rounds)
+        rounds = np.tile(np.arange(1, self._rounds + 1), len(self._seasons))
+        count = len(years)
+        day_offsets = pd.to_timedelta(60 + (rounds - 1) * 270 // self._rounds, unit="D")
+        dates = pd.to_datetime(pd.Series(years).astype(str) + "-01-01") + day_offsets
+        missing = np.full(count, None)
+        return pd.DataFrame(
+            {
+                "raceId": np.arange(1, count + 1),
+                "year": years,
+                "round": rounds,
+                "circuitId": self._rng.integers(1, 78, count),
+                "name": np.char.add("Grand Prix ", (rounds % 25 + 1).astype(str)),
+                "date": dates.dt.strftime("%Y-%m-%d"),
+                "time": "14:00:00",
+                "url": "http://en.wikipedia.org/wiki/Grand_Prix",
+                **{
+                    column: missing
+                    for column in (
+                        "fp1_date", "fp1_time", "fp2_date", "fp2_time",
+                        "fp3_date", "fp3_time", "quali_date", "quali_time",
+                        "sprint_date", "sprint_time",
+                    )
+                },
+            }
+        )
+
+    def _generate_results(self, races: pd.DataFrame) -> pd.DataFrame:
+        race_count = len(races)
+        grid = self._grid_size
+        count = race_count * grid
+
+        season_index = np.repeat(races["year"].to_numpy() - self._seasons[0], grid)
+        slot = np.tile(np.arange(grid), race_count)
+        order = np.argsort(self._rng.random((race_count, grid)), axis=1)
+        position_order = (np.argsort(order, axis=1) + 1).ravel()
+        grid_position = (np.argsort(self._rng.random((race_count, grid)), axis=1) + 1).ravel()
+
+        finished = self._rng.random(count) > 0.12
+        # Classified drivers take the top positions, the rest retire
+        position_order = np.where(finished, position_order, position_order + grid)
+        position_order = (
+            np.argsort(np.argsort(position_order.reshape(race_count, grid), axis=1), axis=1) + 1
+        ).ravel()
+        finished = position_order <= finished.reshape(race_count, grid).sum(axis=1).repeat(grid)
+
+        points = np.where(
+            finished & (position_order <= len(POINTS)),
+            POINTS[np.minimum(position_order, len(POINTS)) - 1],
+            0.0,
+        )
+        laps = np.where(finished, 58, self._rng.integers(1, 58, count))
+        milliseconds = 5_400_000 + (position_order - 1) * 4_321 + self._rng.integers(0, 1000, count)
+        fastest_ms = self._rng.integers(78_000, 95_000, count)
+
+        position = pd.array(position_order, dtype="Int64")
+        position[~finished] = pd.NA
+        race_time = pd.array(
+            [
+                f"{ms // 3_600_000}:{ms // 60000 % 60:02d}:{ms // 1000 % 60:02d}.{ms % 1000:03d}"
+                for ms in milliseconds.tolist()
+            ],
+            dtype="string",
+        )
+        race_time[~finished] = pd.NA
+        race_ms = pd.array(milliseconds, dtype="Int64")
+        race_ms[~finished] = pd.NA
+
+        return pd.DataFrame(
+            {
+                "resultId": np.arange(1, count + 1),
+                "raceId": np.repeat(races["raceId"].to_numpy(), grid),
+                "driverId": season_index * self._rookies + slot + 1,
+                "constructorId": slot // 2 + 1,
+                "number": slot + 1,
+                "grid": grid_position,
+                "position": position,
+                "positionText": np.where(finished, position_order.astype(str), "R"),
+                "positionOrder": position_order,
+                "points": points,
+                "laps": laps,
+                "time": race_time,
+                "milliseconds": race_ms,
+                "fastestLap": self._rng.integers(1, 59, count),
+                "rank": (np.argsort(self._rng.random((race_count, grid)), axis=1) + 1).ravel(),
+                "fastestLapTime": [
+                    f"{ms // 60000}:{ms // 1000 % 60:02d}.{ms % 1000:03d}"
+                    for ms in fastest_ms.tolist()
+                ],
+                "fastestLapSpeed": np.round(5_000_000 / fastest_ms * 3.6, 3),
+                "statusId": np.where(finished, 1, self._rng.integers(3, 140, count)),
+            }
+        )
+
+    def _generate_sprint_results(self, races: pd.DataFrame, results: pd.DataFrame) -> pd.DataFrame:
+        """
+        Sprint results of the sprint rounds, the field of the race finishing
+        in a random order, every driver is classified
+        """
+        sprint_races = races[(races["year"] >= SPRINTS_FROM) & (races["round"] % 4 == 2)]
+        entries = results[results["raceId"].isin(sprint_races["raceId"])]
+        race_count = len(sprint_races)
+        grid = self._grid_size
+        count = len(entries)
+
+        position_order = (np.argsort(self._rng.random((race_count, grid)), axis=1) + 1).ravel()
+        milliseconds = 1_500_000 + (position_order - 1) * 1_234 + self._rng.integers(0, 1000, count)
+        fastest_ms = self._rng.integers(78_000, 95_000, count)
+        return pd.DataFrame(
+            {
+                "resultId": np.arange(1, count + 1),
+                "raceId": entries["raceId"].to_numpy(),
+                "driverId": entries["driverId"].to_numpy(),
+                "constructorId": entries["constructorId"].to_numpy(),
+                "number": entries["number"].to_numpy(),
+                "grid": entries["grid"].to_numpy(),
+                "position": position_order,
+                "positionText": position_order.astype(str),
+                "positionOrder": position_order,
+                "points": np.where(
+                    position_order <= len(SPRINT_POINTS),
+                    SPRINT_POINTS[np.minimum(position_order, len(SPRINT_POINTS)) - 1],
+                    0.0,
+                ),
+                "laps": 17,
+                "time": [
+                    f"{ms // 60000}:{ms // 1000 % 60:02d}.{ms % 1000:03d}"
+                    for ms in milliseconds.tolist()
+                ],
+                "milliseconds": milliseconds,
+                "fastestLap": self._rng.integers(1, 18, count),
+                "fastestLapTime": [
+                    f"{ms // 60000}:{ms // 1000 % 60:02d}.{ms % 1000:03d}"
+                    for ms in fastest_ms.tolist()
+                ],
+                "statusId": 1,
+            }
+        )
+
+    def _generate_qualifying(self, races: pd.DataFrame, results: pd.DataFrame) -> pd.DataFrame:
+        """
+        Qualifying results of the races, the qualifying position is the grid
+        position; Q2 and Q3 times only for the drivers who reached them
+        """
+        entries = results[
+            results["raceId"].isin(races.loc[races["year"] >= QUALIFYING_FROM, "raceId"])
+        ]
+        count = len(entries)
+        position = entries["grid"].to_numpy()
+        # Every session is a little faster than the previous one
+        q1_ms = 80_000 + position * 150 + self._rng.integers(0, 300, count)
+        sessions = {}
+        for session, (session_ms, cutoff) in {
+            "q1": (q1_ms, len(position)),
+            "q2": (q1_ms - 400, 15),
+            "q3": (q1_ms - 800, 10),
+        }.items():
+            times = pd.array(
+                [
+                    f"{ms // 60000}:{ms // 1000 % 60:02d}.{ms % 1000:03d}"
+                    for ms in session_ms.tolist()
+                ],
+                dtype="string",
+            )
+            times[position > cutoff] = pd.NA
+            sessions[session] = times
+        return pd.DataFrame(
+            {
+                "qualifyId": np.arange(1, count + 1),
+                "raceId": entries["raceId"].to_numpy(),
+                "driverId": entries["driverId"].to_numpy(),
+                "constructorId": entries["constructorId"].to_numpy(),
+                "number": entries["number"].to_numpy(),
+                "position": position,
+                **sessions,
+            }
+        )
+
+    def _generate_constructor_results(self, results: pd.DataFrame) -> pd.DataFrame:
+        """
+        Points of each constructor in each race, the sum of its cars
+        """
+        constructor_results = (
+            results.groupby(["raceId", "constructorId"], sort=True)["points"].sum().reset_index()
+        )
+        constructor_results.insert(
+            0, "constructorResultsId", np.arange(1, len(constructor_results) + 1)
+        )
+        constructor_results["status"] = None
+        return constructor_results
+
+    def _generate_standings(
+        self,
+        races: pd.DataFrame,
+        results: pd.DataFrame,
+        points_rows: pd.DataFrame,
+        id_column: str,
+        id_name: str,
+    ) -> pd.DataFrame:
+        """
+        Championship standings of the drivers or constructors after every
+        race, from their points rows
+        """
+        wins = results[results["positionOrder"] == 1].groupby(["raceId", id_column]).size()
+        standings = points_rows[["raceId", id_column, "points"]].copy()
+        standings["wins"] = (
+            wins.reindex(pd.MultiIndex.from_frame(standings[["raceId", id_column]]))
+            .fillna(0)
+            .to_numpy(dtype=np.int64)
+        )
+        standings["year"] = races.set_index("raceId")["year"].reindex(standings["raceId"]).to_numpy()
+        season = standings.groupby(["year", id_column], sort=False)
+        standings["points"] = season["points"].cumsum()
+        standings["wins"] = season["wins"].cumsum()
+        standings["position"] = (
+            standings.sort_values(["raceId", "points", "wins"], ascending=[True, False, False])
+            .groupby("raceId")
+            .cumcount()
+            + 1
+        )
+        return pd.DataFrame(
+            {
+                id_name: np.arange(1, len(standings) + 1),
+                "raceId": standings["raceId"],
+                id_column: standings[id_column],
+                "points": standings["points"],
+                "position": standings["position"],
+                "positionText": standings["position"].astype(str),
+                "wins": standings["wins"],
+            }
+        )
+
+    def _generate_weather(self, races: pd.DataFrame) -> pd.DataFrame:
+        races = races[races["year"] >= self._weather_from]
+        samples = int(self._race_duration // self._weather_interval)
+        count = len(races) * samples
+
+        seconds = np.tile(np.arange(samples) * self._weather_interval, len(races))
+        seconds = np.round(seconds + self._rng.random(count), 3)
+        race_air = np.repeat(self._rng.uniform(12, 35, len(races)), samples)
+        race_rain = np.repeat(self._rng.random(len(races)) < 0.15, samples)
+
+        return pd.DataFrame(
+            {
+                "Time": pd.to_timedelta(seconds, unit="s").astype(str),
+                "AirTemp": np.round(race_air + self._rng.normal(0, 0.5, count), 1),
+                "Humidity": np.round(self._rng.uniform(20, 95, count), 1),
+                "Pressure": np.round(self._rng.uniform(975, 1030, count), 1),
+                "Rainfall": race_rain & (self._rng.random(count) < 0.5),
+                "TrackTemp": np.round(race_air + 10 + self._rng.normal(0, 2, count), 1),
+                "WindDirection": self._rng.integers(0, 360, count),
+                "WindSpeed": np.round(self._rng.gamma(2, 1.5, count), 1),
+                "Round Number": np.repeat(races["round"].to_numpy(), samples),
+                "Year": np.repeat(races["year"].to_numpy(), samples),
+            }
+        )
+
+    def _generate_lap_times(
+        self,
+        races: pd.DataFrame,
+        results: pd.DataFrame,
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Laps of every result from lap_times_from on, with one or two pit
+        stops per driver adding 20 seconds to the in-lap
+        """
+        timed_races = races.loc[races["year"] >= self._lap_times_from, "raceId"]
+        results = results[results["raceId"].isin(timed_races)]
+        laps = results["laps"].to_numpy()
+        count = int(laps.sum())
+
+        result_index = np.repeat(np.arange(len(results)), laps)
+        lap = np.arange(count) - np.repeat(np.cumsum(laps) - laps, laps) + 1
+        race_pace = self._rng.integers(75_000, 100_000, len(results))
+        driver_offset = (results["positionOrder"].to_numpy() - 1) * 60
+        milliseconds = (
+            np.repeat(race_pace + driver_offset, laps)
+            + self._rng.normal(0, 400, count).astype(np.int64)
+            + np.where(lap == 1, 6_000, 0)
+        )
+
+        stops = self._rng.integers(1, 3, len(results))
+        stop_laps = np.stack(
+            [laps * 2 // 5, laps * 3 // 4 + self._rng.integers(-3, 4, len(results))],
+            axis=1,
+        )
+        has_stop = (np.arange(2) < stops[:, None]) & (stop_laps >= 1) & (stop_laps < laps[:, None])
+        stop_result, stop_number = np.nonzero(has_stop)
+        stop_lap = stop_laps[stop_result, stop_number]
+        stop_duration = self._rng.integers(20_000, 30_000, len(stop_result))
+
+        stop_rows = (np.cumsum(laps) - laps)[stop_result] + stop_lap - 1
+        milliseconds[stop_rows] += stop_duration
+
+        lap_times = pd.DataFrame(
+            {
+                "raceId": results["raceId"].to_numpy()[result_index],
+                "driverId": results["driverId"].to_numpy()[result_index],
+                "lap": lap,
+                "position": results["positionOrder"].to_numpy()[result_index],
+                "time": [
+                    f"{ms // 60000}:{ms // 1000 % 60:02d}.{ms % 1000:03d}"
+                    for ms in milliseconds.tolist()
+                ],
+                "milliseconds": milliseconds,
+            }
+        )
+        pit_stops = pd.DataFrame(
+            {
+                "raceId": results["raceId"].to_numpy()[stop_result],
+                "driverId": results["driverId"].to_numpy()[stop_result],
+                "stop": stop_number + 1,
+                "lap": stop_lap,
+                "time": "14:30:00",
+                "duration": [f"{ms / 1000:.3f}" for ms in stop_duration.tolist()],
+                "milliseconds": stop_duration,
+            }
+        ).sort_values(["raceId", "lap", "driverId"], kind="stable")
+        return lap_times, pit_stops
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", required=True, help="Directory to write the CSV files to")
+    parser.add_argument("--scale", type=int, default=1, help="Multiplies the rounds of every season")
+    parser.add_argument("--seasons", type=int, default=74, help="Number of seasons ending in 2023")
+    parser.add_argument("--grid-size", type=int, default=24)
+    parser.add_argument("--weather-from", type=int, default=2018, help="First season with weather samples")
+    parser.add_argument("--weather-interval", type=float, default=60.0, help="Seconds between weather samples")
+    parser.add_argument("--lap-times-from", type=int, default=1996, help="First season with lap times")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    generator = DatasetGenerator(
+        scale=args.scale,
+        seasons=args.seasons,
+        grid_size=args.grid_size,
+        weather_from=args.weather_from,
+        weather_interval=args.weather_interval,
+        lap_times_from=args.lap_times_from,
+        seed=args.seed,
+    )
+    for filename, rows in generator.generate(args.output).items():
+        print(f"{filename}: {rows} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+Load test of the analytics query server.
+
+Every client keeps one keep-alive connection and sends its requests one
+after another, the paths are used round robin. Reported: requests per
+second, latency percentiles, response statuses and the coalescing counters
+of the server (/stats).
+
+    python -m formula1_analytics.server --port 8050 &
+    python -m benchmarks.load_test --port 8050 --concurrency 50 --requests 2000 \\
+        --path '/drivers/season-performance?season=2021'
+
+With --spawn the server is started in a subprocess for the duration of the
+test.
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+
+SRC_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+DEFAULT_PATHS = [
+    "/drivers/season-performance?season=2021",
+    "/drivers/most-wins?count=10",
+    "/drivers/weather-performance?season=2021&weather_type=air_temp",
+]
+
+
+class Client:
+    """
+    HTTP/1.1 client over one keep-alive connection
+    """
+
+    def __init__(self, host: str, port: int) -> None:
+        self._host = host
+        self._port = port
+        self._reader = None
+        self._writer = None
+
+    async def get(self, path: str) -> tuple[int, bytes]:
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(
+                self._host, self._port
+            )
+        self._writer.write(
+            f"GET {path} HTTP/1.1\r\nHost: {self._host}\r\n\r\n".encode("latin-1")
+        )
+        await self._writer.drain()
+
+        head = (await self._reader.readuntil(b"\r\n\r\n")).decode("latin-1")
+        lines = head.split("\r\n")
+        status = int(lines[0].split(" ")[1])
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            if name:
+                headers[name.strip().lower()] = value.strip()
+        body = await self._reader.readexactly(int(headers.get("content-length", 0)))
+        if headers.get("connection", "").lower() == "close":
+            await self.close()
+        return status, body
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._reader = self._writer = None
+
+
+async def _run_client(
+    client: Client,
+    paths: list[str],
+    counter: list[int],
+    total: int,
+    latencies: list[float],
+    statuses: Counter,
+) -> None:
+    while counter[0] < total:
+        index = counter[0]
+        counter[0] += 1
+        start = time.perf_counter()
+        try:
+            status, _ = await client.get(paths[index % len(paths)])
+        except (ConnectionError, asyncio.IncompleteReadError) as e:
+            statuses[type(e).__name__] += 1
+            await client.close()
+            continue
+        latencies.append(time.perf_counter() - start)
+        statuses[status] += 1
+    await client.close()
+
+
+async def run_load_test(
+    host: str,
+    port: int,
+    paths: list[str],
+    concurrency: int,
+    requests: int,
+) -> dict:
+    """
+    Description
+    -----------
+    Send the requests from concurrent clients and measure the throughput.
+
+    Parameters
+    ----------
+    host : str
+        Host of the server.
+    port : int
+        Port of the server.
+    paths : list[str]
+        Request paths (with query strings), used round robin.
+    concurrency : int
+        Number of clients sending requests at the same time.
+    requests : int
+        Total number of requests.
+
+    Returns
+    -------
+    dict
+        Requests per second, latency percentiles in milliseconds, response
+        statuses and the server counters.
+    """
+    latencies = []
+    statuses = Counter()
+    counter = [0]
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            _run_client(Client(host, port), paths, counter, requests, latencies, statuses)
+            for _ in range(concurrency)
+        )
+    )
+    seconds = time.perf_counter() - start
+
+    stats_client = Client(host, port)
+    _, stats = await stats_client.get("/stats")
+    await stats_client.close()
+
+    latencies.sort()
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "seconds": round(seconds, 3),
+        "requests_per_second": round(len(latencies) / seconds, 1),
+        "latency_ms": {
+            "mean": round(statistics.fmean(latencies) * 1000, 2) if latencies else None,
+            **{
+                f"p{percentile}": round(_get_percentile(latencies, percentile) * 1000, 2)
+                for percentile in (50, 95, 99)
+            },
+            "max": round(latencies[-1] * 1000, 2) if latencies else None,
+        },
+        "statuses": {str(status): count for status, count in statuses.items()},
+        "server": json.loads(stats),
+    }
+
+
+def _get_percentile(values: list[float], percentile: float) -> float:
+    if not values:
+        return float("nan")
+    return values[min(len(values) - 1, int(len(values) * percentile / 100))]
+
+
+def _spawn_server(host: str, port: int, workers: int | None) -> subprocess.Popen:
+    command = [sys.executable, "-m", "formula1_analytics.server", "--host", host, "--port", str(port)]
+    if workers:
+        command += ["--workers", str(workers)]
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [SRC_PATH, env.get("PYTHONPATH")]))
+    return subprocess.Popen(command, env=env)
+
+
+async def _wait_for_server(host: str, port: int, timeout: float) -> None:
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            client = Client(host, port)
+            status, _ = await client.get("/health")
+            await client.close()
+            if status == 200:
+                return
+        except OSError:
+            pass
+        if time.perf_counter() > deadline:
+            raise TimeoutError(f"Server on {host}:{port} did not start")
+        await asyncio.sleep(0.2)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8050)
+    parser.add_argument(
+        "--path",
+        action="append",
+        dest="paths",
+        help="request path, may be repeated (default: a mix of JSON endpoints)",
+    )
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--spawn", action="store_true", help="start the server")
+    parser.add_argument("--workers", type=int, help="threads of the spawned server")
+    args = parser.parse_args()
+
+    server = _spawn_server(args.host, args.port, args.workers) if args.spawn else None
+    try:
+        asyncio.run(_wait_for_server(args.host, args.port, timeout=120))
+        report = asyncio.run(
+            run_load_test(
+                args.host,
+                args.port,
+                args.paths or DEFAULT_PATHS,
+                args.concurrency,
+                args.requests,
+            )
+        )
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
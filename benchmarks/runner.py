@@ -0,0 +1,387 @@
+"""
+Benchmark runner for the analytics entry points.
+
+Every entry point runs in a fresh subprocess, so the table loading is part of
+its cold call and the peak RSS belongs to that entry point only. The on-disk
+table cache is primed once before the measured runs, so cold calls do not
+depend on which entry points ran before. Reported per
+entry point: cold and warm wall time, peak RSS, peak traced allocations and
+the wall time of every pipeline step (the underscore methods of the analytics
+classes).
+
+    python -m benchmarks.runner --data-path /tmp/f1_10x --save-baseline base.json
+    python -m benchmarks.runner --data-path /tmp/f1_10x --compare base.json
+"""
+import argparse
+import functools
+import importlib
+import inspect
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from typing import Any, Callable
+
+SRC_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+# Module and class of every analytics class whose steps are timed
+STEP_CLASSES = [
+    ("formula1_analytics.common.entity_aggregation", "EntityAggregation"),
+    ("formula1_analytics.common.season_progression", "SeasonProgression"),
+    ("formula1_analytics.common.leaderboard", "Leaderboard"),
+    ("formula1_analytics.common.standings_index", "StandingsIndex"),
+    ("formula1_analytics.common.points_rescoring", "PointsRescoring"),
+    ("formula1_analytics.drivers.drivers_season_perf", "DriversSeasonPerf"),
+    ("formula1_analytics.drivers.drivers_most_wins", "DriversMostWins"),
+    ("formula1_analytics.drivers.drivers_leaderboard", "DriversLeaderboard"),
+    ("formula1_analytics.drivers.driver_weather_perf", "DriverWeatherPerf"),
+    ("formula1_analytics.drivers.drivers_plots", "DriversPlots"),
+    ("formula1_analytics.drivers.championship_simulator", "ChampionshipSimulator"),
+    ("formula1_analytics.drivers.teammates_head_to_head", "TeammatesHeadToHead"),
+    ("formula1_analytics.constructors.constructors_season_perf", "ConstructorsSeasonPerf"),
+    ("formula1_analytics.constructors.constructors_leaderboard", "ConstructorsLeaderboard"),
+]
+# Metrics compared against the baseline, lower is better for all of them
+COMPARED_METRICS = ["cold_s", "warm_s", "peak_rss_kb", "peak_alloc_bytes"]
+
+
+def _load_data(season: int) -> Any:
+    from formula1_analytics.common.data_loader import DataLoader
+    from formula1_analytics.config import config as cfg
+
+    for filename in (
+        cfg.DRIVERS_FILENAME,
+        cfg.RACES_FILENAME,
+        cfg.RESULTS_FILENAME,
+        cfg.WEATHER_FILENAME,
+    ):
+        DataLoader.load_data(filename)
+
+
+def _load_tables(season: int) -> Any:
+    from formula1_analytics.drivers.drivers import Drivers
+    from formula1_analytics.races.races import Races
+    from formula1_analytics.results.results import Results
+    from formula1_analytics.weather.weather import Weather
+
+    _reset_state()
+    for table in (Drivers, Races, Results, Weather):
+        table()
+
+
+def _drivers_season_perf(season: int) -> Any:
+    from formula1_analytics.drivers.drivers_season_perf import DriversSeasonPerf
+
+    return DriversSeasonPerf().get_data(season, None)
+
+
+def _drivers_most_wins(season: int) -> Any:
+    from formula1_analytics.drivers.drivers_most_wins import DriversMostWins
+
+    return DriversMostWins().get_data(30)
+
+
+def _driver_weather_perf(season: int) -> Any:
+    from formula1_analytics.drivers.driver_weather_perf import DriverWeatherPerf
+
+    return DriverWeatherPerf().get_data(season, None, "air_temp")
+
+
+def _constructors_season_perf(season: int) -> Any:
+    from formula1_analytics.constructors.constructors_season_perf import (
+        ConstructorsSeasonPerf,
+    )
+
+    return ConstructorsSeasonPerf().get_data(season, None)
+
+
+def _constructors_leaderboard(season: int) -> Any:
+    from formula1_analytics.constructors.constructors_leaderboard import (
+        ConstructorsLeaderboard,
+    )
+
+    return ConstructorsLeaderboard().get_top("points", 10)
+
+
+def _drivers_standings(season: int) -> Any:
+    from formula1_analytics.drivers.drivers_standings_index import DriversStandingsIndex
+
+    return DriversStandingsIndex().get_standings(season, 5)
+
+
+def _championship_simulator(season: int) -> Any:
+    from formula1_analytics.drivers.championship_simulator import ChampionshipSimulator
+
+    return ChampionshipSimulator().simulate(season, 5, 100_000, seed=0)
+
+
+def _drivers_points_rescoring(season: int) -> Any:
+    from formula1_analytics.common.points_rescoring import PointsSystem
+    from formula1_analytics.drivers.drivers_points_rescoring import DriversPointsRescoring
+
+    return DriversPointsRescoring().get_standings(
+        PointsSystem([25, 18, 15, 12, 10, 8, 6, 4, 2, 1], 1, 10, [8, 7, 6, 5, 4, 3, 2, 1]),
+        season,
+    )
+
+
+def _teammates_head_to_head(season: int) -> Any:
+    from formula1_analytics.drivers.teammates_head_to_head import TeammatesHeadToHead
+
+    return TeammatesHeadToHead().get_data()
+
+
+def _plot_season_performance(season: int) -> Any:
+    from formula1_analytics.drivers.drivers_plots import DriversPlots
+
+    return DriversPlots.plot_drivers_season_performance(season)
+
+
+def _plot_most_wins(season: int) -> Any:
+    from formula1_analytics.drivers.drivers_plots import DriversPlots
+
+    return DriversPlots.get_plot_drivers_most_wins(10)
+
+
+ENTRY_POINTS: dict[str, Callable[[int], Any]] = {
+    "load_data": _load_data,
+    "load_tables": _load_tables,
+    "drivers_season_perf": _drivers_season_perf,
+    "drivers_most_wins": _drivers_most_wins,
+    "driver_weather_perf": _driver_weather_perf,
+    "drivers_standings": _drivers_standings,
+    "championship_simulator": _championship_simulator,
+    "drivers_points_rescoring": _drivers_points_rescoring,
+    "teammates_head_to_head": _teammates_head_to_head,
+    "constructors_season_perf": _constructors_season_perf,
+    "constructors_leaderboard": _constructors_leaderboard,
+    "plot_season_performance": _plot_season_performance,
+    "plot_most_wins": _plot_most_wins,
+}
+
+
+class StepTimer:
+    """
+    Accumulates the wall time of the pipeline steps while installed
+    """
+
+    def __init__(self) -> None:
+        self.timings: dict[str, list[float]] = defaultdict(list)
+        self._originals: list[tuple[type, str, Any]] = []
+
+    def install(self) -> None:
+        for module_name, class_name in STEP_CLASSES:
+            cls = getattr(importlib.import_module(module_name), class_name)
+            for name, member in list(vars(cls).items()):
+                if not name.startswith("_") or name.startswith("__"):
+                    continue
+                function = getattr(member, "__func__", member)
+                if not inspect.isfunction(function):
+                    continue
+                self._originals.append((cls, name, member))
+                wrapped = self._wrap(f"{class_name}.{name}", function)
+                if isinstance(member, staticmethod):
+                    wrapped = staticmethod(wrapped)
+                elif isinstance(member, classmethod):
+                    wrapped = classmethod(wrapped)
+                setattr(cls, name, wrapped)
+
+    def uninstall(self) -> None:
+        for cls, name, member in reversed(self._originals):
+            setattr(cls, name, member)
+        self._originals.clear()
+
+    def reset(self) -> None:
+        self.timings.clear()
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        return {
+            step: {"calls": len(times), "total_s": round(sum(times), 6)}
+            for step, times in sorted(self.timings.items())
+        }
+
+    def _wrap(self, step: str, function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.timings[step].append(time.perf_counter() - start)
+
+        return wrapper
+
+
+def _reset_state() -> None:
+    """
+    Drop the tables and caches kept in memory, so a repeat is a cold call
+    """
+    from formula1_analytics.common.data_registry import DataRegistry
+
+    DataRegistry.invalidate()
+
+
+def run_entry_point(name: str, season: int, repeats: int) -> dict[str, Any]:
+    """
+    Measure the entry point in the current process
+    """
+    entry_point = ENTRY_POINTS[name]
+    timer = StepTimer()
+    timer.install()
+
+    start = time.perf_counter()
+    entry_point(season)
+    cold = time.perf_counter() - start
+    cold_steps = timer.summary()
+
+    timer.reset()
+    warm = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        entry_point(season)
+        warm.append(time.perf_counter() - start)
+    timer.uninstall()
+
+    peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak_rss_kb //= 1024
+
+    _reset_state()
+    tracemalloc.start()
+    entry_point(season)
+    _, peak_alloc = tracemalloc.get_traced_memory()
+    blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    tracemalloc.stop()
+
+    return {
+        "cold_s": round(cold, 6),
+        "warm_s": round(statistics.median(warm), 6) if warm else None,
+        "peak_rss_kb": peak_rss_kb,
+        "peak_alloc_bytes": peak_alloc,
+        "live_blocks": blocks,
+        "steps": cold_steps,
+    }
+
+
+def run_in_subprocess(
+    name: str,
+    season: int,
+    repeats: int,
+    data_path: str | None,
+    cache_dir: str,
+) -> dict[str, Any]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [SRC_PATH, env.get("PYTHONPATH")]))
+    env["F1_ANALYTICS_CACHE_DIR"] = cache_dir
+    if data_path:
+        env["F1_ANALYTICS_DATA_PATH"] = os.path.abspath(data_path)
+    command = [
+        sys.executable, "-m", "benchmarks.runner", "--child", name,
+        "--season", str(season), "--repeats", str(repeats),
+    ]
+    process = subprocess.run(
+        command,
+        cwd=os.path.dirname(SRC_PATH),
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if process.returncode != 0:
+        raise RuntimeError(f"Benchmark {name} failed:\n{process.stderr[-2000:]}")
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+
+def compare(
+    results: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float,
+) -> list[str]:
+    """
+    Get the metrics that got worse than the baseline by more than the tolerance
+    """
+    regressions = []
+    for name, metrics in results["entry_points"].items():
+        base_metrics = baseline["entry_points"].get(name)
+        if base_metrics is None:
+            continue
+        for metric in COMPARED_METRICS:
+            value, base_value = metrics.get(metric), base_metrics.get(metric)
+            if not value or not base_value:
+                continue
+            ratio = value / base_value
+            if ratio > 1 + tolerance:
+                regressions.append(
+                    f"{name}.{metric}: {base_value} -> {value} ({ratio - 1:+.0%})"
+                )
+    return regressions
+
+
+def _print_table(results: dict[str, Any]) -> None:
+    print(f"{'entry point':<26}{'cold s':>10}{'warm s':>10}{'rss MB':>10}{'alloc MB':>10}")
+    for name, metrics in results["entry_points"].items():
+        warm = metrics["warm_s"]
+        print(
+            f"{name:<26}{metrics['cold_s']:>10.3f}"
+            f"{warm if warm is None else round(warm, 3):>10}"
+            f"{metrics['peak_rss_kb'] / 1024:>10.1f}"
+            f"{metrics['peak_alloc_bytes'] / 2**20:>10.1f}"
+        )
+        for step, timing in metrics["steps"].items():
+            print(f"    {step:<50}{timing['total_s']:>10.3f} s  x{timing['calls']}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--data-path", help="Directory with generated CSV files, bundled data if not set")
+    parser.add_argument("--season", type=int, default=2021)
+    parser.add_argument("--repeats", type=int, default=3, help="Warm calls per entry point")
+    parser.add_argument("--only", nargs="+", choices=list(ENTRY_POINTS), help="Entry points to run")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument("--save-baseline", help="Write the results as a baseline JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file to compare the results with")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative slowdown")
+    parser.add_argument("--child", choices=list(ENTRY_POINTS), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_entry_point(args.child, args.season, args.repeats)))
+        return
+
+    results = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "data_path": args.data_path,
+        "season": args.season,
+        "entry_points": {},
+    }
+    with tempfile.TemporaryDirectory(prefix="f1_benchmark_cache_") as cache_dir:
+        run_in_subprocess("load_tables", args.season, 0, args.data_path, cache_dir)
+        for name in args.only or ENTRY_POINTS:
+            results["entry_points"][name] = run_in_subprocess(
+                name, args.season, args.repeats, args.data_path, cache_dir
+            )
+    _print_table(results)
+
+    for path in filter(None, [args.output, args.save_baseline]):
+        with open(path, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(results, json.load(file), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print("No regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Iterable
+import formula1_analytics.config.config as cfg
+from formula1_analytics.logger import get_logger
+
+LOGGER = get_logger(__name__)
+
+
+class TaskFailedError(Exception):
+    """
+    Stands in for an error of a worker which cannot be sent back to the
+    parent process
+    """
+
+    def __init__(self, error_type: str, message: str) -> None:
+        self.error_type = error_type
+        self.message = message
+        super().__init__(f"{error_type}: {message}")
+
+    def __reduce__(self):
+        return TaskFailedError, (self.error_type, self.message)
+
+
+class AnalyticRequest:
+    """
+    A call of an analytics method, for example
+    AnalyticRequest(DriversSeasonPerf, "get_data", 2021, None)
+    """
+
+    def __init__(self, analytic: type, method: str, *args, **kwargs) -> None:
+        self.analytic = analytic
+        self.method = method
+        self.args = args
+        self.kwargs = kwargs
+
+    def __repr__(self) -> str:
+        arguments = [repr(arg) for arg in self.args] + [
+            f"{name}={value!r}" for name, value in self.kwargs.items()
+        ]
+        return f"{self.analytic.__name__}.{self.method}({', '.join(arguments)})"
+
+
+class TaskResult:
+    """
+    Outcome of one request, either its value or the error it raised
+    """
+
+    def __init__(
+        self,
+        request: AnalyticRequest,
+        value: Any = None,
+        error: BaseException | None = None,
+        error_traceback: str | None = None,
+        seconds: float = 0.0,
+    ) -> None:
+        self.request = request
+        self.value = value
+        self.error = error
+        self.error_traceback = error_traceback
+        self.seconds = seconds
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def get(self) -> Any:
+        """
+        Get the value, raising the error of a failed request
+        """
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+    def __repr__(self) -> str:
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return f"TaskResult({self.request!r}, {status}, {self.seconds:.3f}s)"
+
+
+class BatchExecutor:
+    """
+    Runs batches of analytics requests on a process pool.
+
+    The tables are loaded into the DataRegistry before the pool starts, with
+    the fork start method the workers share them copy-on-write and nothing
+    is parsed again. Other start methods load them once per worker, from the
+    memory-mapped cache. Forking is only used while the parent runs a single
+    thread, a lock held by another thread at fork time would never be
+    released in the worker. Every worker keeps one instance of each analytics
+    class, so caches built by one task are reused by the next ones.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        tables: Iterable[type] | None = None,
+        chunksize: int = 1,
+        start_method: str | None = None,
+    ) -> None:
+        self._max_workers = max_workers or cfg.BATCH_MAX_WORKERS or os.cpu_count() or 1
+        self._tables = list(tables) if tables is not None else None
+        self._chunksize = chunksize
+        self._start_method = start_method or cfg.BATCH_START_METHOD
+
+    def run(self, requests: Iterable[AnalyticRequest]) -> list[TaskResult]:
+        """
+        Description
+        -----------
+        Run the requests and collect their results. An error raised by a
+        request is captured in its TaskResult, the other requests still run.
+
+        Parameters
+        ----------
+        requests : Iterable[AnalyticRequest]
+            The requests to run.
+
+        Returns
+        -------
+        list[TaskResult]
+            The result of every request, in request order.
+        """
+        requests = list(requests)
+        tables = self._get_tables()
+        _load_tables(tables)
+        if self._max_workers == 1 or len(requests) <= 1:
+            _instances.clear()
+            return [_run_request(request) for request in requests]
+
+        context = multiprocessing.get_context(self._get_start_method())
+        results = []
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(self._max_workers, len(requests)),
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(tables,),
+            ) as pool:
+                for result in pool.map(_run_request, requests, chunksize=self._chunksize):
+                    results.append(result)
+        except BrokenProcessPool as e:
+            LOGGER.error("Worker process died, %s requests not run", len(requests) - len(results))
+            results.extend(
+                TaskResult(request, error=e, error_traceback=traceback.format_exc())
+                for request in requests[len(results):]
+            )
+        return results
+
+    def _get_start_method(self) -> str | None:
+        if self._start_method is not None:
+            return self._start_method
+        start_methods = multiprocessing.get_all_start_methods()
+        if "fork" in start_methods and threading.active_count() == 1:
+            return "fork"
+        if "forkserver" in start_methods:
+            return "forkserver"
+        return "spawn"
+
+    def _get_tables(self) -> list[type]:
+        if self._tables is not None:
+            return self._tables
+        from formula1_analytics.drivers.drivers import Drivers
+        from formula1_analytics.races.races import Races
+        from formula1_analytics.results.results import Results
+        from formula1_analytics.weather.weather import Weather
+
+        return [Drivers, Races, Results, Weather]
+
+
+# Analytics instances of the current worker process, by class
+_instances: dict[type, Any] = {}
+
+
+def _load_tables(tables: list[type]) -> None:
+    for table in tables:
+        table()
+
+
+def _init_worker(tables: list[type]) -> None:
+    _instances.clear()
+    _load_tables(tables)
+
+
+def _run_request(request: AnalyticRequest) -> TaskResult:
+    start = time.perf_counter()
+    try:
+        analytic = _instances.get(request.analytic)
+        if analytic is None:
+            analytic = _instances[request.analytic] = request.analytic()
+        value = getattr(analytic, request.method)(*request.args, **request.kwargs)
+    except Exception as e:
+        return TaskResult(
+            request,
+            error=_get_transferable_error(e),
+            error_traceback=traceback.format_exc(),
+            seconds=time.perf_counter() - start,
+        )
+    return TaskResult(request, value=value, seconds=time.perf_counter() - start)
+
+
+def _get_transferable_error(error: Exception) -> Exception:
+    try:
+        pickle.loads(pickle.dumps(error))
+    except Exception:
+        return TaskFailedError(type(error).__name__, str(error))
+    return error
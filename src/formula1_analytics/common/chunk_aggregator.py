@@ -0,0 +1,168 @@
+from typing import Iterable
+import pandas as pd
+import formula1_analytics.config.config as cfg
+
+# How the partial result of each aggregation is computed on a chunk and how
+# partial results of several chunks are merged
+_PARTIAL_AGGREGATIONS = {
+    "sum": ("sum", "sum"),
+    "count": ("count", "sum"),
+    "size": ("size", "sum"),
+    "min": ("min", "min"),
+    "max": ("max", "max"),
+}
+
+
+class ChunkAggregator:
+    """
+    Group-by aggregations over a stream of chunks.
+
+    Every chunk is reduced to per group partial results. The partials are
+    merged into the running result every config.CHUNK_MERGE_INTERVAL
+    chunks, so every group is regrouped once per interval rather than once
+    per chunk, and memory use is bounded by the chunk size and the number
+    of groups, not by the size of the table.
+    """
+
+    @staticmethod
+    def groupby_sum(
+        chunks: Iterable[pd.DataFrame],
+        by: str | list[str],
+        columns: list[str],
+    ) -> pd.DataFrame:
+        return ChunkAggregator.groupby_agg(
+            chunks, by, {column: "sum" for column in columns}
+        )
+
+    @staticmethod
+    def groupby_count(
+        chunks: Iterable[pd.DataFrame],
+        by: str | list[str],
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame | pd.Series:
+        """
+        Count non-missing values of the columns, or the rows of each group
+        when no columns are given
+        """
+        if columns is None:
+            return ChunkAggregator.groupby_agg(chunks, by, {"size": "size"})["size"]
+        return ChunkAggregator.groupby_agg(
+            chunks, by, {column: "count" for column in columns}
+        )
+
+    @staticmethod
+    def groupby_min(
+        chunks: Iterable[pd.DataFrame],
+        by: str | list[str],
+        columns: list[str],
+    ) -> pd.DataFrame:
+        return ChunkAggregator.groupby_agg(
+            chunks, by, {column: "min" for column in columns}
+        )
+
+    @staticmethod
+    def groupby_max(
+        chunks: Iterable[pd.DataFrame],
+        by: str | list[str],
+        columns: list[str],
+    ) -> pd.DataFrame:
+        return ChunkAggregator.groupby_agg(
+            chunks, by, {column: "max" for column in columns}
+        )
+
+    @staticmethod
+    def groupby_agg(
+        chunks: Iterable[pd.DataFrame],
+        by: str | list[str],
+        aggregations: dict[str, str],
+    ) -> pd.DataFrame:
+        """
+        Description
+        -----------
+        Aggregate the chunks as if they were one table grouped by the given
+        columns.
+
+        Parameters
+        ----------
+        chunks : Iterable[pd.DataFrame]
+            The chunks, for example from DataLoader.iter_chunks.
+        by : str | list[str]
+            The columns (or index levels) to group by.
+        aggregations : dict[str, str]
+            The aggregation of each output column: sum, count, min, max or
+            mean. The output column is also the aggregated input column,
+            except for "size" which counts the rows of each group.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per group, sorted by the group keys.
+        """
+        partial_aggregations = {}
+        for column, aggregation in aggregations.items():
+            if aggregation == "mean":
+                partial_aggregations[f"{column}__sum"] = (column, "sum", "sum")
+                partial_aggregations[f"{column}__count"] = (column, "count", "sum")
+            elif aggregation in _PARTIAL_AGGREGATIONS:
+                partial_aggregations[column] = (
+                    column,
+                    *_PARTIAL_AGGREGATIONS[aggregation],
+                )
+            else:
+                raise ValueError(
+                    f"Aggregation must be one of: {', '.join([*_PARTIAL_AGGREGATIONS, 'mean'])}"
+                )
+
+        partials = []
+        for chunk in chunks:
+            partials.append(
+                ChunkAggregator._aggregate_chunk(chunk, by, partial_aggregations)
+            )
+            if len(partials) > cfg.CHUNK_MERGE_INTERVAL:
+                partials = [ChunkAggregator._merge_partials(partials, partial_aggregations)]
+
+        if not partials:
+            return pd.DataFrame(columns=list(aggregations))
+        result = ChunkAggregator._merge_partials(partials, partial_aggregations)
+
+        for column, aggregation in aggregations.items():
+            if aggregation == "mean":
+                total = result.pop(f"{column}__sum")
+                count = result.pop(f"{column}__count")
+                if pd.api.types.is_extension_array_dtype(total.dtype):
+                    count = count.astype("Int64")
+                result[column] = total / count.mask(count == 0)
+        return result[list(aggregations)].sort_index()
+
+    @staticmethod
+    def _aggregate_chunk(
+        chunk: pd.DataFrame,
+        by: str | list[str],
+        partial_aggregations: dict[str, tuple[str, str, str]],
+    ) -> pd.DataFrame:
+        grouped = chunk.groupby(by, sort=False, observed=True)
+        return pd.DataFrame(
+            {
+                name: (
+                    grouped.size()
+                    if chunk_aggregation == "size"
+                    else grouped[column].agg(chunk_aggregation)
+                )
+                for name, (column, chunk_aggregation, _) in partial_aggregations.items()
+            }
+        )
+
+    @staticmethod
+    def _merge_partials(
+        partials: list[pd.DataFrame],
+        partial_aggregations: dict[str, tuple[str, str, str]],
+    ) -> pd.DataFrame:
+        merged = pd.concat(partials)
+        levels = list(range(merged.index.nlevels))
+        grouped = merged.groupby(level=levels, sort=True)
+        return grouped.agg(
+            {
+                name: merge_aggregation
+                for name, (_, _, merge_aggregation) in partial_aggregations.items()
+            }
+        )
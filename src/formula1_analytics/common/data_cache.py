@@ -0,0 +1,160 @@
+import hashlib
+import json
+import os
+import pandas as pd
+import formula1_analytics.config.config as cfg
+from formula1_analytics.logger import get_logger
+
+try:
+    import pyarrow.feather as feather
+except ImportError:
+    feather = None
+
+LOGGER = get_logger(__name__)
+
+# Bump whenever the way tables are processed after parsing changes,
+# so caches written by older code are not picked up.
+CACHE_FORMAT_VERSION = 2
+
+
+class DataCache:
+    """
+    On-disk cache of fully processed tables.
+
+    Tables are stored as uncompressed Feather files (memory-mapped on read)
+    when pyarrow is installed, and as pickles otherwise. The cache key is a
+    hash of the source file content and the table schema, so editing the CSV
+    or the column types invalidates the cached file automatically. File names
+    start with the table name and a hash of the source directory, a new cache
+    entry replaces only the older entries of the same source file, so
+    datasets sharing the cache directory do not evict each other.
+    """
+
+    @staticmethod
+    def get_key(
+        content: bytes,
+        id_name: str | None,
+        column_types: dict[str, str],
+    ) -> str:
+        """
+        Build the cache key from the source content and the table schema
+        """
+        schema = json.dumps(
+            [CACHE_FORMAT_VERSION, pd.__version__, id_name, column_types],
+            sort_keys=True,
+        )
+        digest = hashlib.blake2b(content, digest_size=16)
+        digest.update(schema.encode("UTF-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def read(
+        filename: str,
+        key: str,
+        id_name: str | None,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame | None:
+        """
+        Read the cached table (or only the given columns of it),
+        returns None on cache miss
+        """
+        if not cfg.CACHE_ENABLED:
+            return None
+
+        path = DataCache._get_path(filename, key)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            if feather is not None:
+                data = feather.read_table(
+                    path, columns=columns, memory_map=True
+                ).to_pandas()
+            else:
+                data = pd.read_pickle(path)
+                if columns is not None:
+                    data = data[columns]
+        except Exception as e:
+            LOGGER.warning("Cannot read cached %s from %s: %s", filename, path, e)
+            return None
+
+        if id_name is not None:
+            data.set_index(id_name, inplace=True)
+        LOGGER.debug("Loaded %s from cache %s", filename, path)
+        return data
+
+    @staticmethod
+    def write(
+        filename: str,
+        key: str,
+        id_name: str | None,
+        data: pd.DataFrame,
+    ) -> None:
+        """
+        Write the processed table to the cache, replacing stale entries
+        """
+        if not cfg.CACHE_ENABLED:
+            return
+
+        path = DataCache._get_path(filename, key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(cfg.CACHE_DIR, exist_ok=True)
+            frame = data.reset_index() if id_name is not None else data
+            if feather is not None:
+                feather.write_feather(frame, tmp_path, compression="uncompressed")
+            else:
+                frame.to_pickle(tmp_path)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            LOGGER.warning("Cannot write cache for %s to %s: %s", filename, path, e)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+
+        DataCache.clear(filename, keep=path)
+        LOGGER.debug("Cached %s in %s", filename, path)
+
+    @staticmethod
+    def clear(filename: str | None = None, keep: str | None = None) -> None:
+        """
+        Remove cached files of the table read from its current source
+        directory (or of all tables)
+        """
+        if not os.path.isdir(cfg.CACHE_DIR):
+            return
+
+        prefix = f"{DataCache._get_stem(filename)}." if filename else ""
+        for entry in os.listdir(cfg.CACHE_DIR):
+            path = os.path.join(cfg.CACHE_DIR, entry)
+            if entry.endswith(".tmp") or not entry.startswith(prefix) or path == keep:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _get_path(filename: str, key: str) -> str:
+        extension = "feather" if feather is not None else "pkl"
+        return os.path.join(
+            cfg.CACHE_DIR, f"{DataCache._get_stem(filename)}.{key}.{extension}"
+        )
+
+    @staticmethod
+    def _get_stem(filename: str) -> str:
+        name = os.path.splitext(os.path.basename(filename))[0]
+        source_dir = DataCache._get_source_dir(filename)
+        digest = hashlib.blake2b(source_dir.encode("UTF-8"), digest_size=4)
+        return f"{name}-{digest.hexdigest()}"
+
+    @staticmethod
+    def _get_source_dir(filename: str) -> str:
+        """
+        Directory the source file is read from, see DataLoader.open_source
+        """
+        if os.path.dirname(filename):
+            return os.path.dirname(os.path.abspath(filename))
+        if cfg.DATA_PATH:
+            return os.path.abspath(cfg.DATA_PATH)
+        return f"formula1_analytics/{cfg.DATA_DIR}"
@@ -1,11 +1,197 @@
+import importlib.resources
 import io
+import os
+from typing import BinaryIO, Iterator
 import pandas as pd
 import pkgutil
 import formula1_analytics.config.config as cfg
+from formula1_analytics.common.data_cache import DataCache
+
+NA_VALUES = [r"\N"]
 
 
 class DataLoader:
     @staticmethod
     def load_data(filename) -> pd.DataFrame:
-        data = pkgutil.get_data("formula1_analytics", f"{cfg.DATA_DIR}{filename}")
-        return pd.read_csv(io.BytesIO(data), sep=",", encoding="UTF-8")
+        with DataLoader.open_source(filename) as source:
+            return DataLoader._parse(source)
+
+    @staticmethod
+    def read_bytes(filename) -> bytes:
+        if cfg.DATA_PATH:
+            with open(os.path.join(cfg.DATA_PATH, filename), "rb") as file:
+                return file.read()
+        return pkgutil.get_data("formula1_analytics", f"{cfg.DATA_DIR}{filename}")
+
+    @staticmethod
+    def open_source(filename: str) -> BinaryIO:
+        """
+        Open the file for streaming reads. Paths with a directory are opened
+        as they are, bare file names are looked up in config.DATA_PATH or in
+        the package data.
+        """
+        if os.path.dirname(filename):
+            return open(filename, "rb")
+        if cfg.DATA_PATH:
+            return open(os.path.join(cfg.DATA_PATH, filename), "rb")
+        return (
+            importlib.resources.files("formula1_analytics")
+            .joinpath(f"{cfg.DATA_DIR}{filename}")
+            .open("rb")
+        )
+
+    @staticmethod
+    def iter_chunks(
+        filename: str,
+        id_name: str | None,
+        column_types: dict[str, str],
+        usecols: list[str] | None = None,
+        chunksize: int | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Description
+        -----------
+        Stream the typed table in chunks of rows. The file is read
+        incrementally, so memory use is bounded by the chunk size instead of
+        the file size. Chunks are typed like the tables of load_table, they
+        are not cached.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the file in the data directory, or a path to a file.
+        id_name : str | None
+            The id column used as index, None keeps the default index.
+        column_types : dict[str, str]
+            The target type of each column.
+        usecols : list[str], optional
+            Only read these columns (the id column is always read),
+            by default all columns.
+        chunksize : int, optional
+            The number of rows of each chunk, by default config.CHUNK_SIZE.
+
+        Returns
+        -------
+        Iterator[pd.DataFrame]
+            The typed chunks, in file order.
+        """
+        if usecols is not None:
+            usecols = list(dict.fromkeys(([id_name] if id_name else []) + usecols))
+            column_types = {
+                column: dtype
+                for column, dtype in column_types.items()
+                if column in usecols
+            }
+
+        with DataLoader.open_source(filename) as source:
+            reader = DataLoader._parse(
+                source,
+                chunksize=chunksize or cfg.CHUNK_SIZE,
+                **DataLoader._get_parse_options(id_name, column_types, usecols),
+            )
+            with reader:
+                yield from reader
+
+    @staticmethod
+    def load_table(
+        filename: str,
+        id_name: str | None,
+        column_types: dict[str, str],
+        usecols: list[str] | None = None,
+        content: bytes | None = None,
+    ) -> pd.DataFrame:
+        """
+        Description
+        -----------
+        Load the typed table in a single parse pass. "\\N" cells are read as
+        missing values and every column listed in the schema is parsed
+        directly into its target type. The table is read from the on-disk
+        cache when the source file and schema did not change since it was
+        written, only the full table is written to the cache.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the file in the data directory.
+        id_name : str | None
+            The id column used as index, None keeps the default index.
+        column_types : dict[str, str]
+            The target type of each column.
+        usecols : list[str], optional
+            Only read these columns (the id column is always read),
+            by default all columns.
+        content : bytes, optional
+            The content of the file when it was already read,
+            by default it is read from the data directory.
+
+        Returns
+        -------
+        pd.DataFrame
+            The typed table.
+        """
+        if content is None:
+            content = DataLoader.read_bytes(filename)
+        key = DataCache.get_key(content, id_name, column_types)
+        if usecols is not None:
+            usecols = list(dict.fromkeys(([id_name] if id_name else []) + usecols))
+            column_types = {
+                column: dtype
+                for column, dtype in column_types.items()
+                if column in usecols
+            }
+
+        data = DataCache.read(filename, key, id_name, usecols)
+        if data is not None:
+            return data
+
+        data = DataLoader.parse_table(content, id_name, column_types, usecols)
+        if usecols is None:
+            if id_name is None:
+                data["index"] = data.index
+            DataCache.write(filename, key, id_name, data)
+        return data
+
+    @staticmethod
+    def parse_table(
+        content: bytes,
+        id_name: str | None,
+        column_types: dict[str, str],
+        usecols: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Parse CSV content (with its header line) into a typed table, without
+        going through the on-disk cache
+        """
+        return DataLoader._parse(
+            content,
+            **DataLoader._get_parse_options(id_name, column_types, usecols),
+        )
+
+    @staticmethod
+    def _get_parse_options(
+        id_name: str | None,
+        column_types: dict[str, str],
+        usecols: list[str] | None,
+    ) -> dict:
+        date_columns = [
+            column
+            for column, dtype in column_types.items()
+            if dtype.startswith("datetime64")
+        ]
+        return {
+            "index_col": id_name,
+            "usecols": usecols,
+            "na_values": NA_VALUES,
+            "dtype": {
+                column: dtype
+                for column, dtype in column_types.items()
+                if column not in date_columns
+            },
+            "parse_dates": date_columns,
+        }
+
+    @staticmethod
+    def _parse(content: bytes | BinaryIO, **kwargs) -> pd.DataFrame:
+        if isinstance(content, bytes):
+            content = io.BytesIO(content)
+        return pd.read_csv(content, sep=",", encoding="UTF-8", **kwargs)
@@ -1,27 +1,120 @@
+import numpy as np
 import pandas as pd
 
 
 class DataProcessor:
     @staticmethod
-    def empty_to_nan(df: pd.DataFrame) -> None:
+    def get_read_only(data: pd.DataFrame | pd.Series) -> pd.DataFrame | pd.Series:
         """
-        Convert "N" strings to NaN
+        Get the data with the values of every column locked, so a shared
+        frame cannot be modified in place: writing a value through any
+        shallow copy of it raises. Columns stored as views of other arrays
+        cannot be locked, the data is copied once when it has such columns.
+        The masks of nullable columns and string columns are left writable
+        (pandas cannot group or merge read-only ones), missing values and
+        strings must not be written into shared frames.
         """
-        df.replace(r"\\N", pd.NA, regex=True, inplace=True)
+        if DataProcessor._lock_values(data):
+            return data
+        data = data.copy()
+        DataProcessor._lock_values(data)
+        return data
 
     @staticmethod
-    def convert_types(
+    def _lock_values(data: pd.DataFrame | pd.Series) -> bool:
+        """
+        Lock the arrays holding the values, True when every column is locked
+        """
+        get_column = (
+            (lambda position: data) if isinstance(data, pd.Series)
+            else (lambda position: data.iloc[:, position])
+        )
+        columns = 1 if isinstance(data, pd.Series) else data.shape[1]
+        locked = True
+        for position in range(columns):
+            column = get_column(position)
+            array = column.array
+            if isinstance(
+                array,
+                (pd.arrays.IntegerArray, pd.arrays.FloatingArray, pd.arrays.BooleanArray),
+            ):
+                array._data.flags.writeable = False
+            elif isinstance(array, pd.Categorical):
+                array.codes.base.flags.writeable = False
+            elif isinstance(column.dtype, np.dtype):
+                values = column.to_numpy()
+                values.flags.writeable = False
+                if values.base is not None:
+                    values.base.flags.writeable = False
+                # A column is a view of the array of its block, which is not
+                # locked when it is a view of yet another array
+                locked = locked and not get_column(position).to_numpy().flags.writeable
+        return locked
+
+    @staticmethod
+    def optimize_memory(
         df: pd.DataFrame,
-        column_types: dict[str, str],
-    ) -> None:
+        category_columns: list[str],
+    ) -> pd.DataFrame:
+        """
+        Convert low-cardinality string columns to categories and integer
+        columns to the narrowest integer type holding their values
+        """
+        optimized = df.copy()
+        for column in optimized.columns:
+            if column in category_columns:
+                optimized[column] = optimized[column].astype("category")
+            elif pd.api.types.is_integer_dtype(optimized[column].dtype):
+                optimized[column] = DataProcessor.downcast_integers(optimized[column])
+        return optimized
+
+    @staticmethod
+    def downcast_integers(series: pd.Series) -> pd.Series:
+        """
+        Convert integer series to the narrowest integer type holding its values
+        """
+        if series.count() == 0:
+            return series
+
+        nullable = pd.api.types.is_extension_array_dtype(series.dtype)
+        minimum, maximum = series.min(), series.max()
+        for dtype in (np.int8, np.int16, np.int32):
+            info = np.iinfo(dtype)
+            if info.min <= minimum and maximum <= info.max:
+                return series.astype(f"Int{info.bits}" if nullable else dtype)
+        return series
+
+    @staticmethod
+    def append(df: pd.DataFrame, rows: pd.DataFrame) -> pd.DataFrame:
         """
-        Convert numeric columns to numeric
+        Append rows to the table keeping its column types, categories are
+        extended with the new values and narrowed integer columns keep their
+        type when the new values fit in it
         """
-        for column, dtype in column_types.items():
-            try:
-                df[column] = df[column].astype(dtype)
-            except TypeError:
-                print(f"Cannot convert {column} to {dtype}")
+        df = df.copy(deep=False)
+        rows = rows.copy(deep=False)
+        for column in df.columns.intersection(rows.columns):
+            dtype = df[column].dtype
+            if isinstance(dtype, pd.CategoricalDtype):
+                values = rows[column].dropna().unique()
+                new_categories = pd.Index(values).difference(dtype.categories)
+                if len(new_categories):
+                    df[column] = df[column].cat.add_categories(new_categories)
+                rows[column] = rows[column].astype(df[column].dtype)
+            elif (
+                pd.api.types.is_integer_dtype(dtype)
+                and pd.api.types.is_integer_dtype(rows[column].dtype)
+                and dtype != rows[column].dtype
+            ):
+                values = rows[column]
+                nullable = pd.api.types.is_extension_array_dtype(dtype)
+                info = np.iinfo(dtype.numpy_dtype if nullable else dtype)
+                if (nullable or values.notna().all()) and (
+                    values.count() == 0
+                    or (info.min <= values.min() and values.max() <= info.max)
+                ):
+                    rows[column] = values.astype(dtype)
+        return pd.concat([df, rows])
 
     @staticmethod
     def merge(axis: int = 1, *data: pd.DataFrame | pd.Series) -> pd.DataFrame:
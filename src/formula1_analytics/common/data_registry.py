@@ -0,0 +1,389 @@
+import threading
+from typing import Any, Callable
+import numpy as np
+import pandas as pd
+import formula1_analytics.config.config as cfg
+from formula1_analytics.common.data_cache import DataCache
+from formula1_analytics.common.data_loader import DataLoader
+from formula1_analytics.common.data_processor import DataProcessor
+from formula1_analytics.common.profiling import Profiler
+from formula1_analytics.logger import get_logger
+
+LOGGER = get_logger(__name__)
+
+# Bytes of the end of a loaded source file kept to recognize appends to it
+_SOURCE_TAIL_SIZE = 256
+
+
+class DataRegistry:
+    """
+    Process-wide store of the typed F1 tables.
+
+    Each table is parsed the first time it is requested and every later
+    request gets a shallow view of the same frame, so constructing
+    analytics objects does not touch the CSV files again. Adding, dropping
+    or renaming columns of a view does not affect the shared table. Its
+    values are locked (see DataProcessor.get_read_only), writing them
+    through a view raises; missing values and strings, which pandas cannot
+    lock, must not be written either.
+
+    refresh appends the rows added to a source file since it was loaded.
+    Every load, reload and refresh bumps the version of the table, derived
+    structures given an updater are updated from the appended rows instead
+    of being rebuilt.
+    """
+
+    _tables: dict[str, pd.DataFrame] = {}
+    _specs: dict[
+        str, tuple[str | None, dict[str, str], list[str], list[str] | None]
+    ] = {}
+    _versions: dict[str, int] = {}
+    _derived: dict[str, tuple[tuple[int, ...], Any]] = {}
+    # Size, header line and last bytes of the loaded content of every source
+    _sources: dict[str, tuple[int, bytes, bytes]] = {}
+    # Rows appended by the recent refreshes of every table, by version
+    _appended: dict[str, dict[int, pd.DataFrame]] = {}
+    _lock = threading.RLock()
+    # Held while a derived structure is built, by name
+    _build_locks: dict[str, threading.Lock] = {}
+
+    @classmethod
+    def get_table(
+        cls,
+        filename: str,
+        id_name: str | None,
+        column_types: dict[str, str],
+        category_columns: list[str] | None = None,
+        key_columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Get a read-only view of the table, loading it on first use. With
+        config.MEMORY_OPTIMIZED the category columns are stored as categories
+        and integer columns are narrowed. The key columns identify the rows
+        of tables without an id column, refresh uses them to detect new rows.
+        """
+        category_columns = category_columns or []
+        with cls._lock:
+            if filename not in cls._tables:
+                cls._specs[filename] = (
+                    id_name,
+                    column_types,
+                    category_columns,
+                    key_columns,
+                )
+                cls._tables[filename] = cls._load(
+                    filename, id_name, column_types, category_columns
+                )
+                cls._versions[filename] = cls._versions.get(filename, 0) + 1
+                cls._appended.pop(filename, None)
+            return cls._tables[filename].copy(deep=False)
+
+    @classmethod
+    def get_derived(
+        cls,
+        name: str,
+        builder: Callable[[], Any],
+        *filenames: str,
+        updater: Callable[[Any, tuple[int, ...]], Any] | None = None,
+    ) -> Any:
+        """
+        Get a table (or any other structure) derived from the given source
+        tables, it is built once and rebuilt only when one of the sources
+        changes. Tables are returned as views. The values of the tables and
+        arrays of the structure are locked like those of the source tables,
+        it is shared by every caller.
+
+        When the sources changed, the updater (if any) is called with the
+        current structure and the versions of the sources it was built from.
+        It returns the updated structure, typically using get_appended, or
+        None to have it rebuilt. It must not modify the structure in place.
+        """
+        with cls._lock:
+            entry = cls._get_current(name, filenames)
+            if entry is not None:
+                return cls._get_derived_view(entry[1])
+            build_lock = cls._build_locks.setdefault(name, threading.Lock())
+
+        # Structures are built outside the registry lock, so a long build
+        # blocks only the callers of the same structure
+        with build_lock:
+            with cls._lock:
+                entry = cls._get_current(name, filenames)
+                if entry is not None:
+                    return cls._get_derived_view(entry[1])
+                entry = cls._derived.get(name)
+                loaded = {
+                    filename: cls.get_version(filename)
+                    for filename in filenames
+                    if cls.is_loaded(filename)
+                }
+
+            if entry is None or len(loaded) < len(filenames):
+                data = builder()
+            else:
+                data = updater(entry[1], entry[0]) if updater else None
+                if data is None:
+                    data = builder()
+            data = cls._get_read_only(data)
+
+            with cls._lock:
+                # A source changed while the structure was built, it may mix
+                # both versions and is not kept
+                if all(
+                    cls.is_loaded(filename) and cls.get_version(filename) == version
+                    for filename, version in loaded.items()
+                ):
+                    cls._derived[name] = (cls.get_versions(*filenames), data)
+            return cls._get_derived_view(data)
+
+    @classmethod
+    def _get_current(cls, name: str, filenames: tuple[str, ...]) -> tuple | None:
+        """
+        Get the entry of the structure when it is up to date with its sources
+        """
+        entry = cls._derived.get(name)
+        if (
+            entry is None
+            or not all(cls.is_loaded(filename) for filename in filenames)
+            or entry[0] != cls.get_versions(*filenames)
+        ):
+            return None
+        return entry
+
+    @staticmethod
+    def _get_derived_view(data: Any) -> Any:
+        if isinstance(data, (pd.DataFrame, pd.Series)):
+            return data.copy(deep=False)
+        return data
+
+    @classmethod
+    def _get_read_only(cls, data: Any) -> Any:
+        """
+        Lock the tables and arrays of a derived structure, also inside tuples
+        """
+        if isinstance(data, (pd.DataFrame, pd.Series)):
+            return DataProcessor.get_read_only(data)
+        if isinstance(data, np.ndarray):
+            data.flags.writeable = False
+        elif type(data) is tuple:
+            return tuple(cls._get_read_only(item) for item in data)
+        return data
+
+    @classmethod
+    def is_loaded(cls, filename: str) -> bool:
+        return filename in cls._tables
+
+    @classmethod
+    def get_version(cls, filename: str) -> int:
+        """
+        Get the version of the table, bumped every time it is (re)loaded or
+        refreshed
+        """
+        return cls._versions.get(filename, 0)
+
+    @classmethod
+    def get_versions(cls, *filenames: str) -> tuple[int, ...]:
+        return tuple(cls.get_version(filename) for filename in filenames)
+
+    @classmethod
+    def get_appended(cls, filename: str, since_version: int) -> pd.DataFrame | None:
+        """
+        Get the rows appended to the table by refresh since the given version,
+        None when the table was (re)loaded since then or the refreshes are no
+        longer recorded (config.REFRESH_HISTORY_SIZE)
+        """
+        with cls._lock:
+            version = cls.get_version(filename)
+            if since_version == version and filename in cls._tables:
+                return cls._tables[filename].iloc[:0]
+            history = cls._appended.get(filename, {})
+            versions = range(since_version + 1, version + 1)
+            if since_version > version or not all(v in history for v in versions):
+                return None
+            return pd.concat([history[v] for v in versions])
+
+    @classmethod
+    def refresh(cls, filename: str) -> pd.DataFrame:
+        """
+        Description
+        -----------
+        Append the rows added to the source file since the table was loaded,
+        without loading it again. When the file only grew, just its new
+        lines are parsed, otherwise the whole file is parsed and only the
+        rows with new ids (or key columns) are kept. Rows of known ids are
+        never updated, use reload for edited files.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the file of a table loaded before.
+
+        Returns
+        -------
+        pd.DataFrame
+            The appended rows. When there are any, the version of the table
+            is bumped.
+        """
+        with cls._lock:
+            if filename not in cls._specs:
+                raise KeyError(f"Table '{filename}' has never been loaded")
+            id_name, column_types, category_columns, key_columns = cls._specs[filename]
+            if filename not in cls._tables:
+                return cls.get_table(filename, id_name, column_types, category_columns, key_columns)
+
+            with Profiler.stage(f"DataRegistry.refresh[{filename}]") as stage:
+                content = DataLoader.read_bytes(filename)
+                table = cls._tables[filename]
+                new_content, is_append = cls._get_new_content(filename, content)
+                rows = DataLoader.parse_table(new_content, id_name, column_types)
+                rows = cls._drop_known_rows(
+                    table, rows, id_name, key_columns, 0 if is_append else len(table)
+                )
+                stage.rows_in = len(table)
+                stage.rows_out = len(rows)
+
+                cls._sources[filename] = cls._get_source_state(content)
+                if rows.empty:
+                    return rows
+
+                if id_name is None:
+                    rows.index = pd.RangeIndex(len(table), len(table) + len(rows))
+                    if "index" in table.columns:
+                        rows["index"] = rows.index
+                if cfg.MEMORY_OPTIMIZED:
+                    rows = DataProcessor.optimize_memory(rows, category_columns)
+                size = len(table)
+                table = DataProcessor.get_read_only(DataProcessor.append(table, rows))
+                rows = table.iloc[size:]
+                if not cfg.MEMORY_OPTIMIZED:
+                    # The table is the one load_table caches, cache it for the
+                    # new content so the next process starts warm. The tables
+                    # are never modified in place, it is written in the
+                    # background.
+                    threading.Thread(
+                        target=cls._write_cache,
+                        args=(filename, content, id_name, column_types, table),
+                        name=f"refresh-cache-{filename}",
+                    ).start()
+
+                version = cls._versions[filename] + 1
+                history = cls._appended.setdefault(filename, {})
+                history[version] = rows
+                for old_version in sorted(history)[: -cfg.REFRESH_HISTORY_SIZE or None]:
+                    del history[old_version]
+                cls._tables[filename] = table
+                cls._versions[filename] = version
+
+            LOGGER.info("Appended %s rows to %s, version %s", len(rows), filename, version)
+            return rows.copy(deep=False)
+
+    @classmethod
+    def refresh_all(cls) -> dict[str, int]:
+        """
+        Refresh every loaded table, returns the number of rows appended to
+        each of them
+        """
+        with cls._lock:
+            return {filename: len(cls.refresh(filename)) for filename in list(cls._tables)}
+
+    @classmethod
+    def invalidate(cls, filename: str | None = None) -> None:
+        """
+        Drop the table (or all tables), it will be loaded again on next use
+        """
+        with cls._lock:
+            filenames = [filename] if filename else list(cls._tables)
+            for name in filenames:
+                cls._tables.pop(name, None)
+                cls._sources.pop(name, None)
+                cls._appended.pop(name, None)
+            if filename is None:
+                cls._derived.clear()
+
+    @classmethod
+    def reload(cls, filename: str) -> pd.DataFrame:
+        """
+        Load the table again from its source file
+        """
+        with cls._lock:
+            if filename not in cls._specs:
+                raise KeyError(f"Table '{filename}' has never been loaded")
+            cls.invalidate(filename)
+            return cls.get_table(filename, *cls._specs[filename])
+
+    @classmethod
+    def _load(
+        cls,
+        filename: str,
+        id_name: str | None,
+        column_types: dict[str, str],
+        category_columns: list[str],
+    ) -> pd.DataFrame:
+        with Profiler.stage(f"DataRegistry._load[{filename}]") as stage:
+            content = DataLoader.read_bytes(filename)
+            data = DataLoader.load_table(filename, id_name, column_types, content=content)
+            if cfg.MEMORY_OPTIMIZED:
+                data = DataProcessor.optimize_memory(data, category_columns)
+            cls._sources[filename] = cls._get_source_state(content)
+            stage.rows_out = len(data)
+        return DataProcessor.get_read_only(data)
+
+    @staticmethod
+    def _write_cache(
+        filename: str,
+        content: bytes,
+        id_name: str | None,
+        column_types: dict[str, str],
+        table: pd.DataFrame,
+    ) -> None:
+        key = DataCache.get_key(content, id_name, column_types)
+        DataCache.write(filename, key, id_name, table)
+
+    @classmethod
+    def _get_new_content(cls, filename: str, content: bytes) -> tuple[bytes, bool]:
+        """
+        Get the header and the lines appended since the file was loaded, or
+        the whole content when it changed otherwise, and whether the file
+        only grew
+        """
+        size, header, tail = cls._sources.get(filename, (0, b"", b""))
+        if (
+            size
+            and len(content) >= size
+            and content.startswith(header)
+            and content[size - len(tail):size] == tail
+            and tail.endswith(b"\n")
+        ):
+            return header + content[size:], True
+        return content, False
+
+    @staticmethod
+    def _get_source_state(content: bytes) -> tuple[int, bytes, bytes]:
+        header_end = content.find(b"\n") + 1
+        return len(content), content[:header_end], content[-_SOURCE_TAIL_SIZE:]
+
+    @staticmethod
+    def _drop_known_rows(
+        table: pd.DataFrame,
+        rows: pd.DataFrame,
+        id_name: str | None,
+        key_columns: list[str] | None,
+        offset: int,
+    ) -> pd.DataFrame:
+        """
+        Drop the rows whose id (or key columns) are in the table already, or
+        whose id is repeated in the new rows. Without an id or key columns,
+        the rows from the offset on are new.
+        """
+        if id_name is not None:
+            known = rows.index.isin(table.index) | rows.index.duplicated()
+        elif key_columns:
+            # Only the rows of the table sharing the first key can match
+            first_key = key_columns[0]
+            candidates = table[table[first_key].isin(rows[first_key].unique())]
+            known = pd.MultiIndex.from_frame(rows[key_columns]).isin(
+                pd.MultiIndex.from_frame(candidates[key_columns])
+            )
+        else:
+            return rows.iloc[offset:]
+        return rows[~known]
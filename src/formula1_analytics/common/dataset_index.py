@@ -0,0 +1,288 @@
+import pandas as pd
+from formula1_analytics.common.data_registry import DataRegistry
+from formula1_analytics.common.index_manager import IndexManager
+from formula1_analytics.config.config import (
+    CONSTRUCTORS_FILENAME,
+    CONSTRUCTORS_RESULTS_FILENAME,
+    CONSTRUCTORS_STANDINGS_FILENAME,
+    DRIVERS_FILENAME,
+    DRIVERS_STANDINGS_FILENAME,
+    QUALIFYING_FILENAME,
+    RACES_FILENAME,
+    RESULTS_FILENAME,
+    SPRINT_RESULTS_FILENAME,
+    WEATHER_FILENAME,
+)
+from formula1_analytics.drivers.drivers import Drivers
+from formula1_analytics.drivers.driver_standings import DriverStandingsColumns
+from formula1_analytics.constructors.constructor_results import ConstructorResultsColumns
+from formula1_analytics.constructors.constructor_standings import ConstructorStandingsColumns
+from formula1_analytics.qualifying.qualifying import QualifyingColumns
+from formula1_analytics.races.races import Races, RacesColumns
+from formula1_analytics.results.results import Results, ResultsColumns
+from formula1_analytics.results.sprint_results import SprintResultsColumns
+from formula1_analytics.weather.weather import Weather, WeatherColumns
+from formula1_analytics.weather.weather_summary import (
+    WeatherSummary,
+    WeatherSummaryColumns,
+)
+
+# Race id column of the tables with rows per race
+_RACE_ID_COLUMNS = {
+    RESULTS_FILENAME: ResultsColumns.RACE_ID,
+    CONSTRUCTORS_RESULTS_FILENAME: ConstructorResultsColumns.RACE_ID,
+    CONSTRUCTORS_STANDINGS_FILENAME: ConstructorStandingsColumns.RACE_ID,
+    DRIVERS_STANDINGS_FILENAME: DriverStandingsColumns.RACE_ID,
+    SPRINT_RESULTS_FILENAME: SprintResultsColumns.RACE_ID,
+    QUALIFYING_FILENAME: QualifyingColumns.RACE_ID,
+}
+
+
+class DatasetIndex:
+    """
+    Lookup structures over the shared tables.
+
+    Every structure is built once per version of its source tables through
+    the DataRegistry, lookups slice pre-sorted tables instead of scanning
+    them, so they cost O(k) in the number of rows returned.
+    """
+
+    @staticmethod
+    def get_season_races(season_year: int) -> pd.DataFrame:
+        """
+        Get the races of the season, sorted by round
+        """
+        races, year_slices, _ = DatasetIndex._get_races_index()
+        return races.iloc[year_slices.get(season_year, slice(0, 0))]
+
+    @staticmethod
+    def get_race_ids(season_year: int) -> pd.Index:
+        """
+        Get the ids of the races of the season, sorted by round
+        """
+        return DatasetIndex.get_season_races(season_year).index
+
+    @staticmethod
+    def get_race_id(season_year: int, round_number: int) -> int | None:
+        _, _, race_ids = DatasetIndex._get_races_index()
+        return race_ids.get((season_year, round_number))
+
+    @staticmethod
+    def get_race_results(race_ids: list[int] | pd.Index) -> pd.DataFrame:
+        """
+        Get the results of the races, grouped by race
+        """
+        results, race_slices = DatasetIndex._get_results_index()
+        slices = [race_slices[race_id] for race_id in race_ids if race_id in race_slices]
+        return results.iloc[IndexManager.slices_to_positions(slices)]
+
+    @staticmethod
+    def get_season_results(season_year: int) -> pd.DataFrame:
+        return DatasetIndex.get_race_results(DatasetIndex.get_race_ids(season_year))
+
+    @staticmethod
+    def get_driver_id(fullname: str) -> int | None:
+        return DatasetIndex._get_drivers_index().get(fullname)
+
+    @staticmethod
+    def has_driver(fullname: str) -> bool:
+        return fullname in DatasetIndex._get_drivers_index()
+
+    @staticmethod
+    def get_season_weather(season_year: int) -> pd.DataFrame:
+        """
+        Get the weather samples of the season, sorted by round
+        """
+        weather, year_slices = DatasetIndex._get_weather_index()
+        return weather.iloc[year_slices.get(season_year, slice(0, 0))]
+
+    @staticmethod
+    def get_season_weather_summary(season_year: int) -> pd.DataFrame:
+        """
+        Get the per race weather summary of the season, sorted by round
+        """
+        summary, year_slices = DatasetIndex._get_weather_summary_index()
+        return summary.iloc[year_slices.get(season_year, slice(0, 0))]
+
+    @staticmethod
+    def get_changed_seasons(
+        filenames: tuple[str, ...],
+        since_versions: tuple[int, ...],
+    ) -> set[int] | None:
+        """
+        Description
+        -----------
+        Get the seasons with rows appended to the tables (races, results,
+        sprint results, qualifying, weather, drivers, standings and the
+        constructor tables) by refreshes since the given versions.
+
+        Parameters
+        ----------
+        filenames : tuple[str, ...]
+            The files of the tables.
+        since_versions : tuple[int, ...]
+            The version of each table to compare with.
+
+        Returns
+        -------
+        set[int] | None
+            The years of the changed seasons, None when one of the tables was
+            (re)loaded since then, so any season may have changed.
+        """
+        seasons = set()
+        for filename, version in zip(filenames, since_versions):
+            appended = DataRegistry.get_appended(filename, version)
+            if appended is None:
+                return None
+            if appended.empty or filename in (DRIVERS_FILENAME, CONSTRUCTORS_FILENAME):
+                # New drivers and constructors only change the seasons of
+                # their new results
+                continue
+            if filename == RACES_FILENAME:
+                years = appended[RacesColumns.YEAR]
+            elif filename in _RACE_ID_COLUMNS:
+                years = Races().get_data()[RacesColumns.YEAR].reindex(
+                    appended[_RACE_ID_COLUMNS[filename]].unique()
+                )
+            elif filename == WEATHER_FILENAME:
+                years = appended[WeatherColumns.YEAR]
+            else:
+                return None
+            seasons.update(int(year) for year in years.dropna().unique())
+        return seasons
+
+    @staticmethod
+    def _get_races_index() -> tuple[pd.DataFrame, dict, dict]:
+        return DataRegistry.get_derived(
+            "index_races",
+            DatasetIndex._build_races_index,
+            RACES_FILENAME,
+        )
+
+    @staticmethod
+    def _get_results_index() -> tuple[pd.DataFrame, dict]:
+        return DataRegistry.get_derived(
+            "index_results",
+            DatasetIndex._build_results_index,
+            RESULTS_FILENAME,
+            updater=DatasetIndex._update_results_index,
+        )
+
+    @staticmethod
+    def _get_drivers_index() -> dict[str, int]:
+        return DataRegistry.get_derived(
+            "index_drivers",
+            DatasetIndex._build_drivers_index,
+            DRIVERS_FILENAME,
+        )
+
+    @staticmethod
+    def _get_weather_index() -> tuple[pd.DataFrame, dict]:
+        return DataRegistry.get_derived(
+            "index_weather",
+            DatasetIndex._build_weather_index,
+            WEATHER_FILENAME,
+            updater=DatasetIndex._update_weather_index,
+        )
+
+    @staticmethod
+    def _get_weather_summary_index() -> tuple[pd.DataFrame, dict]:
+        return DataRegistry.get_derived(
+            "index_weather_summary",
+            DatasetIndex._build_weather_summary_index,
+            WEATHER_FILENAME,
+        )
+
+    @staticmethod
+    def _build_races_index() -> tuple[pd.DataFrame, dict, dict]:
+        races = Races().get_data().sort_values(
+            [RacesColumns.YEAR, RacesColumns.ROUND], kind="stable"
+        )
+        race_ids = {
+            (year, round_number): race_id
+            for race_id, year, round_number in zip(
+                races.index.tolist(),
+                races[RacesColumns.YEAR].tolist(),
+                races[RacesColumns.ROUND].tolist(),
+            )
+        }
+        return races, IndexManager.get_group_slices(races[RacesColumns.YEAR]), race_ids
+
+    @staticmethod
+    def _build_results_index() -> tuple[pd.DataFrame, dict]:
+        results = Results().get_data().sort_values(ResultsColumns.RACE_ID, kind="stable")
+        return results, IndexManager.get_group_slices(results[ResultsColumns.RACE_ID])
+
+    @staticmethod
+    def _update_results_index(
+        index: tuple[pd.DataFrame, dict],
+        since_versions: tuple[int, ...],
+    ) -> tuple[pd.DataFrame, dict] | None:
+        appended = DataRegistry.get_appended(RESULTS_FILENAME, since_versions[0])
+        if appended is None:
+            return None
+        return DatasetIndex._append_sorted(
+            *index, appended, [ResultsColumns.RACE_ID], ResultsColumns.RACE_ID
+        )
+
+    @staticmethod
+    def _build_drivers_index() -> dict[str, int]:
+        fullnames = Drivers().get_driver_fullnames()
+        driver_ids = {}
+        for driver_id, fullname in zip(fullnames.index.tolist(), fullnames.tolist()):
+            driver_ids.setdefault(fullname, driver_id)
+        return driver_ids
+
+    @staticmethod
+    def _build_weather_index() -> tuple[pd.DataFrame, dict]:
+        weather = Weather().get_data().sort_values(
+            [WeatherColumns.YEAR, WeatherColumns.ROUND], kind="stable"
+        )
+        return weather, IndexManager.get_group_slices(weather[WeatherColumns.YEAR])
+
+    @staticmethod
+    def _update_weather_index(
+        index: tuple[pd.DataFrame, dict],
+        since_versions: tuple[int, ...],
+    ) -> tuple[pd.DataFrame, dict] | None:
+        appended = DataRegistry.get_appended(WEATHER_FILENAME, since_versions[0])
+        if appended is None:
+            return None
+        return DatasetIndex._append_sorted(
+            *index,
+            appended,
+            [WeatherColumns.YEAR, WeatherColumns.ROUND],
+            WeatherColumns.YEAR,
+        )
+
+    @staticmethod
+    def _append_sorted(
+        data: pd.DataFrame,
+        slices: dict,
+        appended: pd.DataFrame,
+        sort_columns: list[str],
+        slice_column: str,
+    ) -> tuple[pd.DataFrame, dict] | None:
+        """
+        Append rows to a sorted table and its group slices, None when the
+        rows do not sort after the table and it has to be sorted again
+        """
+        if appended.empty:
+            return data, slices
+        if appended[sort_columns].isna().any(axis=None):
+            return None
+        appended = appended.sort_values(sort_columns, kind="stable")
+        if not data.empty:
+            last = tuple(data[sort_columns].iloc[-1])
+            first = tuple(appended[sort_columns].iloc[0])
+            if first < last:
+                return None
+        slices = IndexManager.extend_group_slices(slices, appended[slice_column], len(data))
+        if slices is None:
+            return None
+        return pd.concat([data, appended]), slices
+
+    @staticmethod
+    def _build_weather_summary_index() -> tuple[pd.DataFrame, dict]:
+        summary = WeatherSummary().get_data()
+        return summary, IndexManager.get_group_slices(summary[WeatherSummaryColumns.YEAR])
@@ -0,0 +1,249 @@
+import numpy as np
+import pandas as pd
+from formula1_analytics.logger import FrameSummary, get_logger
+from formula1_analytics.common.dataset_index import DatasetIndex
+from formula1_analytics.common.profiling import profile_stage
+from formula1_analytics.races.races import Races, RacesColumns
+
+LOGGER = get_logger(__name__)
+
+
+class EntityAggregationColumns:
+    YEAR = RacesColumns.YEAR
+    ROUND = RacesColumns.ROUND
+
+
+class EntityAggregation:
+    """
+    Grouped aggregations over per race rows of an entity (a driver or a
+    constructor), shared by the driver and constructor analytics.
+
+    The rows are attached to their season and round with a lookup on the
+    races table instead of a merge, then reduced with a single groupby per
+    aggregation: sums per entity and round or season, cumulative sums over
+    the rounds of a season and top-k selection with a partial partition.
+    """
+
+    @staticmethod
+    def get_season_race_ids(season_years: list[int]) -> list[int]:
+        return [
+            race_id
+            for season_year in season_years
+            for race_id in DatasetIndex.get_race_ids(season_year)
+        ]
+
+    @staticmethod
+    def get_race_rows(
+        data: pd.DataFrame,
+        race_id_column: str,
+        race_ids: list[int],
+    ) -> pd.DataFrame:
+        """
+        Get the rows of a table without a race index (results have
+        DatasetIndex.get_race_results) which belong to the races
+        """
+        return data[data[race_id_column].isin(race_ids).to_numpy(dtype=bool, na_value=False)]
+
+    @staticmethod
+    @profile_stage()
+    def attach_season_round(
+        rows: pd.DataFrame,
+        race_id_column: str,
+    ) -> pd.DataFrame:
+        """
+        Description
+        -----------
+        Replace the race id of every row with the year and round of the
+        race. Rows of races missing from the races table are dropped.
+
+        Parameters
+        ----------
+        rows : pd.DataFrame
+            Rows with a race id column.
+        race_id_column : str
+            The race id column.
+
+        Returns
+        -------
+        pd.DataFrame
+            The rows with year and round (Int64) as the first columns
+            instead of the race id.
+        """
+        LOGGER.debug("Attaching race year and round to rows, and dropping race ID column...")
+        races = Races().get_selected_columns(RacesColumns.YEAR, RacesColumns.ROUND).reindex(
+            rows[race_id_column]
+        )
+        found = races[RacesColumns.YEAR].notna().to_numpy(dtype=bool)
+        rows = pd.concat(
+            [
+                races.reset_index(drop=True),
+                rows.drop(columns=[race_id_column]).reset_index(drop=True),
+            ],
+            axis=1,
+        )
+        if not found.all():
+            rows = rows[found].reset_index(drop=True)
+        LOGGER.debug("Rows with attached race round: \n %s", FrameSummary(rows))
+        return rows
+
+    @staticmethod
+    @profile_stage()
+    def attach_names(
+        rows: pd.DataFrame,
+        id_column: str,
+        names: pd.Series,
+        name_column: str,
+    ) -> pd.DataFrame:
+        """
+        Replace the entity id of every row with its name, rows of unknown
+        entities are dropped
+        """
+        LOGGER.debug("Attaching %s to rows...", name_column)
+        rows = rows.drop(columns=[id_column]).assign(
+            **{name_column: names.reindex(rows[id_column]).array}
+        )
+        rows = rows[rows[name_column].notna().to_numpy(dtype=bool)]
+        LOGGER.debug("Rows with attached %s: \n %s", name_column, FrameSummary(rows))
+        return rows
+
+    @staticmethod
+    @profile_stage()
+    def sum_by_round(
+        rows: pd.DataFrame,
+        entity_column: str,
+        value_column: str,
+    ) -> pd.DataFrame:
+        """
+        Sum the values of each entity in each round, sorted by year, round
+        and entity
+        """
+        LOGGER.debug("Summing %s of each %s in each round...", value_column, entity_column)
+        rows = (
+            rows.groupby(
+                [
+                    EntityAggregationColumns.YEAR,
+                    EntityAggregationColumns.ROUND,
+                    entity_column,
+                ],
+                sort=True,
+                observed=True,
+            )[value_column]
+            .sum()
+            .reset_index()
+        )
+        LOGGER.debug("Sums of each round: \n %s", FrameSummary(rows))
+        return rows
+
+    @staticmethod
+    @profile_stage()
+    def cumulative_sum_by_season(
+        rows: pd.DataFrame,
+        entity_column: str,
+        value_column: str,
+        total_column: str,
+    ) -> pd.DataFrame:
+        """
+        Add the running total of the values of each entity over the rounds
+        of a season, the rows must be sorted by round
+        """
+        LOGGER.debug("Calculating cumulative sum of %s for each %s...", value_column, entity_column)
+        rows[total_column] = rows.groupby(
+            [EntityAggregationColumns.YEAR, entity_column],
+            sort=False,
+            observed=True,
+        )[value_column].cumsum()
+        LOGGER.debug("Rows with cumulative sums: \n %s", FrameSummary(rows))
+        return rows
+
+    @staticmethod
+    @profile_stage()
+    def sum_by_season(
+        rows: pd.DataFrame,
+        entity_column: str,
+    ) -> pd.DataFrame:
+        """
+        Sum every value column of each entity in each season, indexed by
+        year and entity
+        """
+        seasons = rows.groupby(
+            [EntityAggregationColumns.YEAR, entity_column],
+            sort=True,
+        ).sum()
+        LOGGER.debug("Sums of each season: \n %s", FrameSummary(seasons))
+        return seasons
+
+    @staticmethod
+    @profile_stage()
+    def sum_over_seasons(seasons: pd.DataFrame, entity_column: str) -> pd.DataFrame:
+        """
+        Sum the season rows of sum_by_season over the seasons, indexed by
+        entity
+        """
+        return seasons.groupby(level=entity_column, sort=True).sum()
+
+    @staticmethod
+    def replace_seasons(
+        data: pd.DataFrame,
+        season_years: set[int],
+        updated: pd.DataFrame,
+    ) -> pd.DataFrame:
+        """
+        Description
+        -----------
+        Replace the rows of the seasons with their recomputed rows, the
+        result stays sorted by year.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            Rows sorted by year, in a year column (reset index) or in the
+            first index level.
+        season_years : set[int]
+            The recomputed seasons.
+        updated : pd.DataFrame
+            The new rows of the seasons, shaped and sorted like the data.
+
+        Returns
+        -------
+        pd.DataFrame
+            The rows of the other seasons and the updated rows.
+        """
+        by_index = EntityAggregationColumns.YEAR not in data.columns
+        if by_index:
+            years = data.index.get_level_values(EntityAggregationColumns.YEAR)
+        else:
+            years = data[EntityAggregationColumns.YEAR]
+        kept = data[~np.asarray(years.isin(season_years), dtype=bool)]
+        data = pd.concat([kept, updated])
+        if by_index:
+            return data.sort_index()
+
+        if (
+            not kept.empty
+            and not updated.empty
+            and updated[EntityAggregationColumns.YEAR].min()
+            < kept[EntityAggregationColumns.YEAR].max()
+        ):
+            data = data.sort_values(EntityAggregationColumns.YEAR, kind="stable")
+        return data.reset_index(drop=True)
+
+    @staticmethod
+    def select_top(values: np.ndarray, ids: np.ndarray, count: int) -> np.ndarray:
+        """
+        Positions of the count largest positive values ordered by value and
+        id, ties at the boundary are decided by the lower id. The partition
+        is O(n), only the selected positions are sorted.
+        """
+        candidates = np.flatnonzero(values > 0)
+        if count <= 0:
+            return candidates[:0]
+        if count < len(candidates):
+            candidate_values = values[candidates]
+            threshold = np.partition(candidate_values, len(candidates) - count)[
+                len(candidates) - count
+            ]
+            above = candidates[candidate_values > threshold]
+            ties = candidates[candidate_values == threshold][: count - len(above)]
+            candidates = np.concatenate([above, ties])
+        order = np.lexsort((ids[candidates], -values[candidates]))
+        return candidates[order]
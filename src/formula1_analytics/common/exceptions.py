@@ -0,0 +1,30 @@
+class SeasonNotFoundException(Exception):
+    def __init__(self, season_year: int) -> None:
+        self.season_year = season_year
+        self.message = f"Season {season_year} not found"
+        super().__init__(self.message)
+
+    def __reduce__(self):
+        return SeasonNotFoundException, (self.season_year,)
+
+
+class InvalidSeasonException(Exception):
+    def __init__(self, season_year: int, range: list[int]) -> None:
+        self.season_year = season_year
+        self.range = range
+        self.message = f"Season {season_year} is invalid, must be between {range[0]} and {range[-1]}"
+        super().__init__(self.message)
+
+    def __reduce__(self):
+        return InvalidSeasonException, (self.season_year, self.range)
+
+
+class RaceNotFoundException(Exception):
+    def __init__(self, season_year: int, round_number: int) -> None:
+        self.season_year = season_year
+        self.round_number = round_number
+        self.message = f"Round {round_number} of season {season_year} not found"
+        super().__init__(self.message)
+
+    def __reduce__(self):
+        return RaceNotFoundException, (self.season_year, self.round_number)
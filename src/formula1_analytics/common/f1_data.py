@@ -1,7 +1,7 @@
 import pandas as pd
 from formula1_analytics.common.data_loader import DataLoader
-from formula1_analytics.common.index_manager import IndexManager
 from formula1_analytics.common.data_processor import DataProcessor
+from formula1_analytics.common.data_registry import DataRegistry
 
 
 class F1Data:
@@ -11,20 +11,92 @@ class F1Data:
         self,
         filename: str,
         id_name: str,
+        column_types: dict[str, str] | None = None,
+        category_columns: list[str] | None = None,
+        key_columns: list[str] | None = None,
     ) -> None:
-        self._data = DataLoader().load_data(filename)
-        if id_name is not None:
-            IndexManager.id_to_index(self._data, id_name)
-        else:
-            self._data["index"] = self._data.index
-        
-        DataProcessor.empty_to_nan(self._data)
+        self._filename = filename
+        self._id_name = id_name
+        self._column_types = column_types or {}
+        self._category_columns = category_columns or []
+        self._key_columns = key_columns
+        self._data = DataRegistry.get_table(
+            filename,
+            id_name,
+            self._column_types,
+            self._category_columns,
+            self._key_columns,
+        )
 
     def get_data(self) -> pd.DataFrame:
         return self._data
 
+    def get_filename(self) -> str:
+        return self._filename
+
+    def refresh(self) -> pd.DataFrame:
+        """
+        Description
+        -----------
+        Append the rows added to the source file since it was loaded (rows
+        with new ids, or new key columns for tables without an id), without
+        parsing the whole file again. The table of every instance and the
+        derived structures are updated, see DataRegistry.refresh.
+
+        Returns
+        -------
+        pd.DataFrame
+            The appended rows.
+        """
+        rows = DataRegistry.refresh(self._filename)
+        self._data = DataRegistry.get_table(
+            self._filename,
+            self._id_name,
+            self._column_types,
+            self._category_columns,
+            self._key_columns,
+        )
+        return rows
+
     def get_selected_columns(
         self,
         *args,
     ) -> pd.DataFrame:
         return self._data[list(args)]
+
+    def memory_report(self) -> pd.DataFrame:
+        """
+        Description
+        -----------
+        Get the memory used by each column of the table in the standard and
+        in the memory-optimized layout (config.MEMORY_OPTIMIZED).
+
+        Returns
+        -------
+        pd.DataFrame
+            A DataFrame indexed by column (plus "Index" and "total") with
+            columns:
+                - before: int64, bytes in the standard layout
+                - after: int64, bytes in the memory-optimized layout
+                - dtype_before: object
+                - dtype_after: object
+        """
+        standard = DataLoader.load_table(
+            self._filename, self._id_name, self._column_types
+        )
+        optimized = DataProcessor.optimize_memory(standard, self._category_columns)
+
+        report = pd.DataFrame(
+            {
+                "before": standard.memory_usage(deep=True),
+                "after": optimized.memory_usage(deep=True),
+            }
+        )
+        report.loc["total"] = report.sum()
+        report["dtype_before"] = standard.dtypes.astype(str)
+        report["dtype_after"] = optimized.dtypes.astype(str)
+        report.loc["Index", ["dtype_before", "dtype_after"]] = [
+            str(standard.index.dtype),
+            str(optimized.index.dtype),
+        ]
+        return report
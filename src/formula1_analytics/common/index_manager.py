@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 
@@ -10,3 +11,54 @@ class IndexManager:
         df.index = df[id_col]
         df.drop(id_col, axis=1, inplace=True)
         return df
+
+    @staticmethod
+    def get_group_slices(values: pd.Series) -> dict:
+        """
+        Map every value of a sorted series to the slice of positions it
+        occupies
+        """
+        starts = np.flatnonzero(
+            (values != values.shift()).to_numpy(dtype=bool, na_value=True)
+        )
+        stops = np.append(starts[1:], len(values))
+        keys = values.iloc[starts].tolist()
+        return {
+            key: slice(start, stop)
+            for key, start, stop in zip(keys, starts.tolist(), stops.tolist())
+        }
+
+    @staticmethod
+    def extend_group_slices(slices: dict, values: pd.Series, offset: int) -> dict | None:
+        """
+        Add the slices of sorted values appended at the offset to the slices
+        of the sorted series before them. Returns None when the values do not
+        sort after the existing ones.
+        """
+        if values.empty:
+            return dict(slices)
+        new_slices = IndexManager.get_group_slices(values)
+        if not slices:
+            last_key = None
+        else:
+            last_key = next(reversed(slices))
+            first_key = next(iter(new_slices))
+            if first_key < last_key:
+                return None
+
+        extended = dict(slices)
+        for key, group in new_slices.items():
+            start = group.start + offset
+            if key == last_key:
+                start = extended[key].start
+            extended[key] = slice(start, group.stop + offset)
+        return extended
+
+    @staticmethod
+    def slices_to_positions(slices: list[slice]) -> np.ndarray:
+        """
+        Concatenate the positions covered by the slices
+        """
+        if not slices:
+            return np.empty(0, dtype=np.intp)
+        return np.concatenate([np.arange(s.start, s.stop) for s in slices])
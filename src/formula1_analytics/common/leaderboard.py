@@ -0,0 +1,256 @@
+from abc import ABC, abstractmethod
+import numpy as np
+import pandas as pd
+from formula1_analytics.logger import FrameSummary, get_logger
+from formula1_analytics.common.data_registry import DataRegistry
+from formula1_analytics.common.dataset_index import DatasetIndex
+from formula1_analytics.common.entity_aggregation import (
+    EntityAggregation,
+    EntityAggregationColumns,
+)
+from formula1_analytics.common.lru_cache import LRUCache
+from formula1_analytics.common.profiling import profile_stage
+from formula1_analytics.config.config import (
+    LEADERBOARD_CACHE_SIZE,
+    RACES_FILENAME,
+    RESULTS_FILENAME,
+)
+from formula1_analytics.results.results import Results, ResultsColumns
+
+LOGGER = get_logger(__name__)
+
+
+class LeaderboardColumns:
+    YEAR = "year"
+    WINS = "wins"
+    PODIUMS = "podiums"
+    POLES = "poles"
+    POINTS = "points"
+    FASTEST_LAPS = "fastest_laps"
+    STARTS = "starts"
+
+    @staticmethod
+    def get_metrics() -> list[str]:
+        return [
+            LeaderboardColumns.WINS,
+            LeaderboardColumns.PODIUMS,
+            LeaderboardColumns.POLES,
+            LeaderboardColumns.POINTS,
+            LeaderboardColumns.FASTEST_LAPS,
+            LeaderboardColumns.STARTS,
+        ]
+
+
+class Leaderboard(ABC):
+    """
+    Career statistics of the entities of the race results (drivers or
+    constructors): wins, podiums, poles (first on the grid), points and
+    fastest laps of their cars, and starts (races entered).
+
+    Subclasses give the entity id column of the results and the names of
+    the entities. The statistics of every entity in every season are
+    computed in a single grouped aggregation over the results and shared
+    through the DataRegistry, a refresh recomputes the changed seasons only.
+    Totals over all seasons are derived from it once, totals of season
+    ranges are kept in a bounded LRU cache. get_top selects the top entities
+    with a partial partition instead of sorting all of them.
+    """
+
+    # Column of the entity ids in the results, the index of the leaderboard
+    ID_COLUMN: str
+    # Column the entity names are added as
+    NAME_COLUMN: str
+    # Prefix of the leaderboard names in the DataRegistry
+    _derived_name: str
+    # Tables the leaderboard is computed from
+    _sources = (RESULTS_FILENAME, RACES_FILENAME)
+
+    def __init__(self) -> None:
+        LOGGER.debug("Initializing %s class", type(self).__name__)
+        self._ranges = LRUCache(LEADERBOARD_CACHE_SIZE)
+
+    def get_data(
+        self,
+        start_year: int | None = None,
+        end_year: int | None = None,
+    ) -> pd.DataFrame:
+        """
+        Description
+        -----------
+        Get the statistics of every entity over all seasons, or over a range
+        of seasons.
+
+        Parameters
+        ----------
+        start_year : int, optional
+            The first season to include, by default the first season in the data.
+        end_year : int, optional
+            The last season to include, by default the last season in the data.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per entity with at least one start in the seasons,
+            indexed by ID_COLUMN:
+
+            - wins: int64
+            - podiums: int64
+            - poles: int64
+            - points: float64
+            - fastest_laps: int64
+            - starts: int64
+            - NAME_COLUMN: string
+        """
+        totals = self._get_totals(start_year, end_year)
+        return self._add_names(totals)
+
+    def get_top(
+        self,
+        metric: str,
+        count: int,
+        start_year: int | None = None,
+        end_year: int | None = None,
+    ) -> pd.DataFrame:
+        """
+        Description
+        -----------
+        Get the entities with the highest value of the metric.
+
+        Parameters
+        ----------
+        metric : str
+            The metric to rank by, one of: wins, podiums, poles, points,
+            fastest_laps, starts.
+        count : int
+            The number of top entities to return.
+        start_year : int, optional
+            The first season to include, by default the first season in the data.
+        end_year : int, optional
+            The last season to include, by default the last season in the data.
+
+        Returns
+        -------
+        pd.DataFrame
+            At most count entities, ordered by the metric (descending) and
+            id, with the columns of get_data. Entities with a zero value are
+            not ranked.
+        """
+        if metric not in LeaderboardColumns.get_metrics():
+            raise ValueError(
+                f"Metric must be one of: {', '.join(LeaderboardColumns.get_metrics())}"
+            )
+        totals = self._get_totals(start_year, end_year)
+        positions = EntityAggregation.select_top(
+            totals[metric].to_numpy(), totals.index.to_numpy(), count
+        )
+        top = totals.iloc[positions]
+        LOGGER.debug("Top %s by %s: \n %s", count, metric, FrameSummary(top))
+        return self._add_names(top)
+
+    @classmethod
+    @abstractmethod
+    def _get_names(cls) -> pd.Series:
+        """
+        Get the names of the entities, indexed by id
+        """
+
+    def _get_totals(
+        self,
+        start_year: int | None,
+        end_year: int | None,
+    ) -> pd.DataFrame:
+        if start_year is not None and end_year is not None and start_year > end_year:
+            raise ValueError("Start year must not be after end year")
+        if start_year is None and end_year is None:
+            return DataRegistry.get_derived(
+                f"{self._derived_name}_totals",
+                lambda: EntityAggregation.sum_over_seasons(self._get_seasons(), self.ID_COLUMN),
+                *self._sources,
+            )
+
+        key = (start_year, end_year, DataRegistry.get_versions(*self._sources))
+        totals = self._ranges.get(key)
+        if totals is None:
+            seasons = self._get_seasons()
+            totals = EntityAggregation.sum_over_seasons(
+                seasons.loc[start_year:end_year], self.ID_COLUMN
+            )
+            self._ranges.put(key, totals)
+        return totals
+
+    def _get_seasons(self) -> pd.DataFrame:
+        return DataRegistry.get_derived(
+            f"{self._derived_name}_seasons",
+            self._build_seasons,
+            *self._sources,
+            updater=self._update_seasons,
+        )
+
+    @classmethod
+    def _update_seasons(
+        cls,
+        seasons: pd.DataFrame,
+        since_versions: tuple[int, ...],
+    ) -> pd.DataFrame | None:
+        changed = DatasetIndex.get_changed_seasons(cls._sources, since_versions)
+        if changed is None:
+            return None
+        if not changed:
+            return seasons
+
+        LOGGER.debug("Updating %s of seasons %s...", cls._derived_name, sorted(changed))
+        return EntityAggregation.replace_seasons(
+            seasons, changed, cls._build_seasons(sorted(changed))
+        )
+
+    @classmethod
+    @profile_stage()
+    def _build_seasons(cls, season_years: list[int] | None = None) -> pd.DataFrame:
+        LOGGER.debug("Building %s of seasons %s...", cls._derived_name, season_years or "all")
+        columns = [
+            ResultsColumns.RACE_ID,
+            cls.ID_COLUMN,
+            ResultsColumns.POSITION,
+            ResultsColumns.GRID,
+            ResultsColumns.POINTS,
+            ResultsColumns.RANK,
+        ]
+        if season_years is None:
+            results = Results().get_selected_columns(*columns)
+        else:
+            race_ids = EntityAggregation.get_season_race_ids(season_years)
+            results = DatasetIndex.get_race_results(race_ids)[columns]
+
+        position = results[ResultsColumns.POSITION]
+        statistics = pd.DataFrame(
+            {
+                ResultsColumns.RACE_ID: results[ResultsColumns.RACE_ID].array,
+                cls.ID_COLUMN: results[cls.ID_COLUMN].array,
+                LeaderboardColumns.WINS: (position == 1).to_numpy(dtype=np.int64, na_value=0),
+                LeaderboardColumns.PODIUMS: (position <= 3).to_numpy(dtype=np.int64, na_value=0),
+                LeaderboardColumns.POLES: (results[ResultsColumns.GRID] == 1).to_numpy(
+                    dtype=np.int64, na_value=0
+                ),
+                LeaderboardColumns.POINTS: results[ResultsColumns.POINTS].to_numpy(
+                    dtype=np.float64, na_value=0.0
+                ),
+                LeaderboardColumns.FASTEST_LAPS: (results[ResultsColumns.RANK] == 1).to_numpy(
+                    dtype=np.int64, na_value=0
+                ),
+                # Several cars of a constructor (or shared drives) are one start
+                LeaderboardColumns.STARTS: (
+                    ~results.duplicated([ResultsColumns.RACE_ID, cls.ID_COLUMN])
+                ).to_numpy(dtype=np.int64),
+            }
+        )
+        statistics = EntityAggregation.attach_season_round(statistics, ResultsColumns.RACE_ID)
+        return EntityAggregation.sum_by_season(
+            statistics.drop(columns=[EntityAggregationColumns.ROUND]),
+            cls.ID_COLUMN,
+        )
+
+    def _add_names(self, totals: pd.DataFrame) -> pd.DataFrame:
+        names = self._get_names()
+        totals = totals.copy()
+        totals[self.NAME_COLUMN] = names.reindex(totals.index).array
+        return totals
@@ -0,0 +1,74 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import weakref
+from typing import Hashable
+import formula1_analytics.config.config as cfg
+from formula1_analytics.common.lru_cache import LRUCache
+from formula1_analytics.logger import get_logger
+
+LOGGER = get_logger(__name__)
+
+
+class PlotCache:
+    """
+    LRU cache of rendered images.
+
+    With spill enabled, images evicted from memory are written to a private
+    directory under config.PLOT_CACHE_DIR instead of being dropped, and are
+    moved back to memory on their next hit. The directory is removed with
+    the cache.
+    """
+
+    def __init__(self, max_size: int | None = None, spill: bool | None = None) -> None:
+        spill = cfg.PLOT_CACHE_SPILL if spill is None else spill
+        self._spill_dir = None
+        if spill:
+            os.makedirs(cfg.PLOT_CACHE_DIR, exist_ok=True)
+            self._spill_dir = tempfile.mkdtemp(prefix="plots-", dir=cfg.PLOT_CACHE_DIR)
+            weakref.finalize(self, shutil.rmtree, self._spill_dir, True)
+        self._images = LRUCache(
+            max_size or cfg.PLOT_CACHE_SIZE,
+            on_evict=self._spill if spill else None,
+        )
+
+    def get(self, key: Hashable) -> bytes | None:
+        image = self._images.get(key)
+        if image is not None or self._spill_dir is None:
+            return image
+
+        path = self._get_path(key)
+        try:
+            with open(path, "rb") as file:
+                image = file.read()
+        except OSError:
+            return None
+        os.remove(path)
+        self._images.put(key, image)
+        return image
+
+    def put(self, key: Hashable, image: bytes) -> None:
+        self._images.put(key, image)
+
+    def clear(self) -> None:
+        self._images.clear()
+        if self._spill_dir is not None:
+            for entry in os.listdir(self._spill_dir):
+                os.remove(os.path.join(self._spill_dir, entry))
+
+    def __len__(self) -> int:
+        spilled = len(os.listdir(self._spill_dir)) if self._spill_dir else 0
+        return len(self._images) + spilled
+
+    def _spill(self, key: Hashable, image: bytes) -> None:
+        path = self._get_path(key)
+        try:
+            with open(path, "wb") as file:
+                file.write(image)
+        except OSError as e:
+            LOGGER.warning("Cannot spill plot to %s: %s", path, e)
+
+    def _get_path(self, key: Hashable) -> str:
+        digest = hashlib.blake2b(repr(key).encode("UTF-8"), digest_size=16).hexdigest()
+        return os.path.join(self._spill_dir, f"{digest}.png")
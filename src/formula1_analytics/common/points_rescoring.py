@@ -0,0 +1,380 @@
+from abc import ABC, abstractmethod
+import numpy as np
+import pandas as pd
+from formula1_analytics.logger import FrameSummary, get_logger
+from formula1_analytics.common.data_registry import DataRegistry
+from formula1_analytics.common.entity_aggregation import (
+    EntityAggregation,
+    EntityAggregationColumns,
+)
+from formula1_analytics.common.lru_cache import LRUCache
+from formula1_analytics.common.profiling import profile_stage
+from formula1_analytics.config.config import (
+    POINTS_RESCORING_CACHE_SIZE,
+    RACES_FILENAME,
+    RESULTS_FILENAME,
+    SPRINT_RESULTS_FILENAME,
+)
+from formula1_analytics.results.results import Results, ResultsColumns
+from formula1_analytics.results.sprint_results import SprintResults, SprintResultsColumns
+
+LOGGER = get_logger(__name__)
+
+
+class PointsRescoringColumns:
+    YEAR = "year"
+    ROUND = "round"
+    POINTS = "points"
+    TOTAL_POINTS = "total_points"
+    WINS = "wins"
+    POSITION = "position"
+    ORIGINAL_POINTS = "original_points"
+    ORIGINAL_POSITION = "original_position"
+
+
+class PointsSystem:
+    """
+    Definition of a points system: the points of the finishing positions of
+    a race (from the winner), the points of the fastest lap, only awarded
+    to a car finishing in the first fastest_lap_top positions when given,
+    and the points of the finishing positions of a sprint (None leaves the
+    sprints out). Systems with the same definition share their rescored
+    tables, see get_key.
+    """
+
+    def __init__(
+        self,
+        race_points: list[float],
+        fastest_lap_points: float = 0.0,
+        fastest_lap_top: int | None = None,
+        sprint_points: list[float] | None = None,
+    ) -> None:
+        self.race_points = tuple(float(points) for points in race_points)
+        self.fastest_lap_points = float(fastest_lap_points)
+        self.fastest_lap_top = fastest_lap_top
+        self.sprint_points = (
+            None if sprint_points is None else tuple(float(points) for points in sprint_points)
+        )
+        if (
+            min(self.race_points + (self.sprint_points or ()), default=0.0) < 0
+            or self.fastest_lap_points < 0
+        ):
+            raise ValueError("Points must not be negative")
+
+    def get_key(self) -> tuple:
+        return (
+            self.race_points,
+            self.fastest_lap_points,
+            self.fastest_lap_top,
+            self.sprint_points,
+        )
+
+    @staticmethod
+    def get_lookup(points: tuple[float, ...], max_position: int) -> np.ndarray:
+        """
+        Points of every finishing position from 0 (unclassified) to
+        max_position, positions without points score 0
+        """
+        lookup = np.zeros(max(max_position, len(points)) + 1)
+        lookup[1 : len(points) + 1] = points
+        return lookup
+
+    def __repr__(self) -> str:
+        return (
+            f"PointsSystem({list(self.race_points)}, fastest_lap_points={self.fastest_lap_points}, "
+            f"fastest_lap_top={self.fastest_lap_top}, "
+            f"sprint_points={None if self.sprint_points is None else list(self.sprint_points)})"
+        )
+
+
+class PointsRescoring(ABC):
+    """
+    Season progressions and final standings of the entities of the race
+    results (drivers or constructors) under any points system.
+
+    The points of every race result (and sprint result) of all seasons are
+    looked up at once by indexing a points array with the finishing
+    positions, then the progressions and the standings of every season are
+    aggregated in one pass with the EntityAggregation core. The original
+    points of the same results are aggregated alongside, so the standings
+    compare both systems. Rescored tables are kept per points system
+    definition in a bounded LRU cache, a refresh of the source tables
+    rescores the systems again.
+    """
+
+    # Column of the entity ids in the results
+    ID_COLUMN: str
+    # Column the entity names are added as
+    NAME_COLUMN: str
+    # Tables of the entity names
+    _names_sources: tuple[str, ...]
+
+    def __init__(self) -> None:
+        LOGGER.debug("Initializing %s class", type(self).__name__)
+        self._systems = LRUCache(POINTS_RESCORING_CACHE_SIZE)
+
+    def get_progression(
+        self,
+        points_system: PointsSystem,
+        start_year: int | None = None,
+        end_year: int | None = None,
+        wide: bool = False,
+    ) -> pd.DataFrame | dict[int, pd.DataFrame]:
+        """
+        Description
+        -----------
+        Get the points progression of every entity under the points system
+        in all seasons, or in a range of seasons.
+
+        Parameters
+        ----------
+        points_system : PointsSystem
+            The points system to score the results with.
+        start_year : int, optional
+            The first season to include, by default the first season in the data.
+        end_year : int, optional
+            The last season to include, by default the last season in the data.
+        wide : bool, optional
+            Return a dict of per-season tables indexed by round (with a first
+            row of zeros for round 0) with the total points of each entity
+            as columns, by default False.
+
+        Returns
+        -------
+        pd.DataFrame | dict[int, pd.DataFrame]
+            The long table has one row per entity and round it took part in:
+
+            - year: Int64
+            - round: Int64
+            - ID_COLUMN: Int64
+            - NAME_COLUMN: string
+            - points: float64, points scored in the round
+            - total_points: float64, points scored in the season so far
+        """
+        progression, _ = self._get_rescored(points_system)
+        progression = self._select_seasons(progression, start_year, end_year)
+        if not wide:
+            return progression.reset_index(drop=True)
+        return {
+            year: self._to_season_table(season)
+            for year, season in progression.groupby(PointsRescoringColumns.YEAR, sort=True)
+        }
+
+    def get_standings(
+        self,
+        points_system: PointsSystem,
+        season_year: int | None = None,
+    ) -> pd.DataFrame:
+        """
+        Description
+        -----------
+        Get the final standings of every season under the points system.
+
+        Parameters
+        ----------
+        points_system : PointsSystem
+            The points system to score the results with.
+        season_year : int, optional
+            The season to get the standings of, by default every season.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per entity and season, ordered by year and position:
+
+            - year: Int64
+            - ID_COLUMN: Int64
+            - NAME_COLUMN: string
+            - points: float64
+            - wins: int64
+            - position: int64, ties on points are decided by wins, then by
+              the lower id
+            - original_points: float64, points of the same results in the
+              data
+            - original_position: int64
+        """
+        _, standings = self._get_rescored(points_system)
+        if season_year is not None:
+            standings = self._select_seasons(standings, season_year, season_year)
+        return standings.reset_index(drop=True)
+
+    @classmethod
+    @abstractmethod
+    def _get_names(cls) -> pd.Series:
+        """
+        Get the names of the entities, indexed by id
+        """
+
+    def _get_rescored(self, points_system: PointsSystem) -> tuple[pd.DataFrame, pd.DataFrame]:
+        sources = self._get_sources(points_system)
+        key = (points_system.get_key(), DataRegistry.get_versions(*sources))
+        rescored = self._systems.get(key)
+        if rescored is None:
+            rescored = self._rescore(points_system)
+            self._systems.put(key, rescored)
+        return rescored
+
+    def _get_sources(self, points_system: PointsSystem) -> tuple[str, ...]:
+        sources = (RESULTS_FILENAME, RACES_FILENAME) + self._names_sources
+        if points_system.sprint_points is not None:
+            sources += (SPRINT_RESULTS_FILENAME,)
+        return sources
+
+    @profile_stage()
+    def _rescore(self, points_system: PointsSystem) -> tuple[pd.DataFrame, pd.DataFrame]:
+        LOGGER.debug("Rescoring %s with %s...", self.ID_COLUMN, points_system)
+        rows = [self._score_races(points_system)]
+        if points_system.sprint_points is not None:
+            rows.append(self._score_sprints(points_system))
+        rows = EntityAggregation.attach_season_round(
+            pd.concat(rows, ignore_index=True), ResultsColumns.RACE_ID
+        )
+        return self._build_progression(rows), self._build_standings(rows)
+
+    @profile_stage()
+    def _score_races(self, points_system: PointsSystem) -> pd.DataFrame:
+        results = Results().get_selected_columns(
+            ResultsColumns.RACE_ID,
+            self.ID_COLUMN,
+            ResultsColumns.POSITION_ORDER,
+            ResultsColumns.RANK,
+            ResultsColumns.POINTS,
+        )
+        positions = results[ResultsColumns.POSITION_ORDER].to_numpy(dtype=np.int64, na_value=0)
+        lookup = PointsSystem.get_lookup(points_system.race_points, positions.max(initial=0))
+        points = lookup[positions]
+        if points_system.fastest_lap_points:
+            # Fastest laps are not recorded in the early seasons, they score nothing
+            fastest_lap = (results[ResultsColumns.RANK] == 1).to_numpy(dtype=bool, na_value=False)
+            if points_system.fastest_lap_top is not None:
+                fastest_lap &= (positions >= 1) & (positions <= points_system.fastest_lap_top)
+            points = points + fastest_lap * points_system.fastest_lap_points
+        return self._to_scored_rows(
+            results[ResultsColumns.RACE_ID],
+            results[self.ID_COLUMN],
+            points,
+            results[ResultsColumns.POINTS],
+            (positions == 1).astype(np.int64),
+        )
+
+    @profile_stage()
+    def _score_sprints(self, points_system: PointsSystem) -> pd.DataFrame:
+        sprints = SprintResults().get_selected_columns(
+            SprintResultsColumns.RACE_ID,
+            self.ID_COLUMN,
+            SprintResultsColumns.POSITION_ORDER,
+            SprintResultsColumns.POINTS,
+        )
+        positions = sprints[SprintResultsColumns.POSITION_ORDER].to_numpy(dtype=np.int64, na_value=0)
+        lookup = PointsSystem.get_lookup(points_system.sprint_points, positions.max(initial=0))
+        return self._to_scored_rows(
+            sprints[SprintResultsColumns.RACE_ID],
+            sprints[self.ID_COLUMN],
+            lookup[positions],
+            sprints[SprintResultsColumns.POINTS],
+            np.zeros(len(sprints), dtype=np.int64),
+        )
+
+    def _to_scored_rows(
+        self,
+        race_ids: pd.Series,
+        ids: pd.Series,
+        points: np.ndarray,
+        original_points: pd.Series,
+        wins: np.ndarray,
+    ) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                ResultsColumns.RACE_ID: race_ids.array,
+                self.ID_COLUMN: ids.array,
+                PointsRescoringColumns.POINTS: points,
+                PointsRescoringColumns.ORIGINAL_POINTS: original_points.to_numpy(
+                    dtype=np.float64, na_value=0.0
+                ),
+                PointsRescoringColumns.WINS: wins,
+            }
+        )
+
+    @profile_stage()
+    def _build_progression(self, rows: pd.DataFrame) -> pd.DataFrame:
+        progression = EntityAggregation.sum_by_round(
+            rows, self.ID_COLUMN, PointsRescoringColumns.POINTS
+        )
+        progression = EntityAggregation.cumulative_sum_by_season(
+            progression,
+            self.ID_COLUMN,
+            PointsRescoringColumns.POINTS,
+            PointsRescoringColumns.TOTAL_POINTS,
+        )
+        progression.insert(
+            3,
+            self.NAME_COLUMN,
+            self._get_names().astype("string").reindex(progression[self.ID_COLUMN]).array,
+        )
+        LOGGER.debug("Rescored progression: \n %s", FrameSummary(progression))
+        return progression
+
+    @profile_stage()
+    def _build_standings(self, rows: pd.DataFrame) -> pd.DataFrame:
+        seasons = EntityAggregation.sum_by_season(
+            rows.drop(columns=[EntityAggregationColumns.ROUND]), self.ID_COLUMN
+        ).reset_index()
+        years = seasons[PointsRescoringColumns.YEAR].to_numpy(dtype=np.int64)
+        ids = seasons[self.ID_COLUMN].to_numpy(dtype=np.int64, na_value=-1)
+        wins = seasons[PointsRescoringColumns.WINS].to_numpy()
+        # Rows are sorted by year, so every season starts where its year does
+        season_starts = np.searchsorted(years, years, side="left")
+        for points_column, position_column in (
+            (PointsRescoringColumns.ORIGINAL_POINTS, PointsRescoringColumns.ORIGINAL_POSITION),
+            (PointsRescoringColumns.POINTS, PointsRescoringColumns.POSITION),
+        ):
+            order = np.lexsort((ids, -wins, -seasons[points_column].to_numpy(), years))
+            positions = np.empty(len(order), dtype=np.int64)
+            positions[order] = np.arange(len(order)) - season_starts[order] + 1
+            seasons[position_column] = positions
+
+        standings = seasons.iloc[order].reset_index(drop=True)
+        standings.insert(
+            2,
+            self.NAME_COLUMN,
+            self._get_names().astype("string").reindex(standings[self.ID_COLUMN]).array,
+        )
+        standings = standings[
+            [
+                PointsRescoringColumns.YEAR,
+                self.ID_COLUMN,
+                self.NAME_COLUMN,
+                PointsRescoringColumns.POINTS,
+                PointsRescoringColumns.WINS,
+                PointsRescoringColumns.POSITION,
+                PointsRescoringColumns.ORIGINAL_POINTS,
+                PointsRescoringColumns.ORIGINAL_POSITION,
+            ]
+        ]
+        LOGGER.debug("Rescored standings: \n %s", FrameSummary(standings))
+        return standings
+
+    @staticmethod
+    def _select_seasons(
+        data: pd.DataFrame,
+        start_year: int | None,
+        end_year: int | None,
+    ) -> pd.DataFrame:
+        """
+        Slice the rows of the seasons out of rows sorted by year
+        """
+        if start_year is not None and end_year is not None and start_year > end_year:
+            raise ValueError("Start year must not be after end year")
+        years = data[PointsRescoringColumns.YEAR].to_numpy(dtype=np.int64)
+        start = 0 if start_year is None else np.searchsorted(years, start_year, side="left")
+        end = len(years) if end_year is None else np.searchsorted(years, end_year, side="right")
+        return data.iloc[start:end]
+
+    def _to_season_table(self, season: pd.DataFrame) -> pd.DataFrame:
+        table = season.pivot(
+            index=PointsRescoringColumns.ROUND,
+            columns=self.NAME_COLUMN,
+            values=PointsRescoringColumns.TOTAL_POINTS,
+        ).astype(float)
+        table.loc[0] = 0.0
+        return table.sort_index().fillna(method="ffill")
@@ -0,0 +1,258 @@
+import functools
+import json
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable
+import pandas as pd
+import formula1_analytics.config.config as cfg
+from formula1_analytics.common.protocols.profiling import StageCollector
+
+
+class StageStats:
+    """
+    Aggregated measurements of one pipeline stage
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.min_seconds = float("inf")
+        self.max_seconds = 0.0
+        self.rows_in = 0
+        self.rows_out = 0
+        self.memory_delta = 0
+
+    def add(
+        self,
+        seconds: float,
+        rows_in: int | None,
+        rows_out: int | None,
+        memory_delta: int,
+    ) -> None:
+        self.calls += 1
+        self.total_seconds += seconds
+        self.min_seconds = min(self.min_seconds, seconds)
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.rows_in += rows_in or 0
+        self.rows_out += rows_out or 0
+        self.memory_delta += memory_delta
+
+    def to_dict(self) -> dict[str, float]:
+        return {
+            "calls": self.calls,
+            "total_seconds": self.total_seconds,
+            "mean_seconds": self.total_seconds / self.calls if self.calls else 0.0,
+            "min_seconds": self.min_seconds if self.calls else 0.0,
+            "max_seconds": self.max_seconds,
+            "rows_in": self.rows_in,
+            "rows_out": self.rows_out,
+            "memory_delta_bytes": self.memory_delta,
+        }
+
+
+class InMemoryCollector:
+    """
+    Collector aggregating the measurements of every stage in memory
+    """
+
+    def __init__(self) -> None:
+        self._stats: dict[str, StageStats] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        stage: str,
+        seconds: float,
+        rows_in: int | None,
+        rows_out: int | None,
+        memory_delta: int,
+    ) -> None:
+        with self._lock:
+            stats = self._stats.get(stage)
+            if stats is None:
+                stats = self._stats[stage] = StageStats()
+            stats.add(seconds, rows_in, rows_out, memory_delta)
+
+    def get_stats(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            return {stage: stats.to_dict() for stage, stats in self._stats.items()}
+
+    def get_data(self) -> pd.DataFrame:
+        """
+        Get the stage statistics, slowest stages first
+        """
+        data = pd.DataFrame.from_dict(self.get_stats(), orient="index")
+        if data.empty:
+            return data
+        data.index.name = "stage"
+        return data.sort_values("total_seconds", ascending=False)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+class StageExporter:
+    """
+    Exports the statistics of an InMemoryCollector
+    """
+
+    @staticmethod
+    def to_json(collector: InMemoryCollector) -> str:
+        return json.dumps(collector.get_stats(), indent=2, sort_keys=True)
+
+    @staticmethod
+    def to_prometheus(
+        collector: InMemoryCollector,
+        prefix: str = "formula1_analytics_stage",
+    ) -> str:
+        """
+        Render the statistics in the Prometheus text exposition format
+        """
+        metrics = [
+            ("calls", "counter", "Number of stage calls"),
+            ("total_seconds", "counter", "Wall time spent in the stage"),
+            ("max_seconds", "gauge", "Longest stage call"),
+            ("rows_in", "counter", "Rows passed into the stage"),
+            ("rows_out", "counter", "Rows returned by the stage"),
+            ("memory_delta_bytes", "counter", "Memory allocated by the stage"),
+        ]
+        stats = collector.get_stats()
+        lines = []
+        for metric, metric_type, description in metrics:
+            name = f"{prefix}_{metric}"
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for stage, values in sorted(stats.items()):
+                label = stage.replace("\\", "\\\\").replace('"', '\\"')
+                lines.append(f'{name}{{stage="{label}"}} {values[metric]}')
+        return "\n".join(lines) + "\n"
+
+
+class Profiler:
+    """
+    Process-wide profiling switch and collector.
+
+    Profiling is enabled with config.PROFILING_ENABLED. When disabled, a
+    profiled stage costs one attribute lookup on top of the call itself.
+    """
+
+    _collector: StageCollector = InMemoryCollector()
+    # Set when memory tracing was started by a profiled stage rather than by
+    # the caller, disable stops only tracing it started
+    _started_tracing = False
+
+    @classmethod
+    def get_collector(cls) -> StageCollector:
+        return cls._collector
+
+    @classmethod
+    def set_collector(cls, collector: StageCollector) -> None:
+        cls._collector = collector
+
+    @staticmethod
+    def enable(trace_memory: bool = False) -> None:
+        cfg.PROFILING_ENABLED = True
+        cfg.PROFILING_TRACE_MEMORY = trace_memory
+
+    @classmethod
+    def disable(cls) -> None:
+        cfg.PROFILING_ENABLED = False
+        if cls._started_tracing:
+            cls._started_tracing = False
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+
+    @classmethod
+    def stage(cls, name: str) -> "_Stage":
+        """
+        Context manager measuring the enclosed block as a stage, rows_in and
+        rows_out can be set on the returned object
+        """
+        return _Stage(name)
+
+
+class _Stage:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.rows_in: int | None = None
+        self.rows_out: int | None = None
+        self._enabled = False
+
+    def __enter__(self) -> "_Stage":
+        self._enabled = cfg.PROFILING_ENABLED
+        if self._enabled:
+            self._memory = _get_traced_memory()
+            self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._enabled:
+            Profiler.get_collector().record(
+                self.name,
+                time.perf_counter() - self._start,
+                self.rows_in,
+                self.rows_out,
+                _get_traced_memory() - self._memory,
+            )
+
+
+def profile_stage(name: str | None = None) -> Callable[[Callable], Callable]:
+    """
+    Decorator measuring every call of the function as a pipeline stage.
+
+    The input rows are taken from the first DataFrame or Series argument and
+    the output rows from the returned one.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        stage_name = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not cfg.PROFILING_ENABLED:
+                return function(*args, **kwargs)
+
+            rows_in = next(
+                (
+                    len(value)
+                    for value in (*args, *kwargs.values())
+                    if isinstance(value, (pd.DataFrame, pd.Series))
+                ),
+                None,
+            )
+            memory = _get_traced_memory()
+            start = time.perf_counter()
+            result = function(*args, **kwargs)
+            seconds = time.perf_counter() - start
+            memory_delta = _get_traced_memory() - memory
+
+            rows_out = _count_rows(result)
+            Profiler.get_collector().record(
+                stage_name, seconds, rows_in, rows_out, memory_delta
+            )
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def _count_rows(value: Any) -> int | None:
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return len(value)
+    return None
+
+
+def _get_traced_memory() -> int:
+    """
+    Get the memory currently allocated by Python, traced only with
+    config.PROFILING_TRACE_MEMORY (tracing slows every allocation down)
+    """
+    if not cfg.PROFILING_TRACE_MEMORY:
+        return 0
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+        Profiler._started_tracing = True
+    return tracemalloc.get_traced_memory()[0]
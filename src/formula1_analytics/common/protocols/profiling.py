@@ -0,0 +1,13 @@
+from typing import Protocol
+
+
+class StageCollector(Protocol):
+    def record(
+        self,
+        stage: str,
+        seconds: float,
+        rows_in: int | None,
+        rows_out: int | None,
+        memory_delta: int,
+    ) -> None:
+        ...
@@ -0,0 +1,284 @@
+from abc import ABC, abstractmethod
+import pandas as pd
+from formula1_analytics.logger import FrameSummary, get_logger
+from formula1_analytics.common.profiling import profile_stage
+from formula1_analytics.config.config import SEASON_CACHE_SIZE
+from formula1_analytics.common.data_registry import DataRegistry
+from formula1_analytics.common.dataset_index import DatasetIndex
+from formula1_analytics.common.entity_aggregation import EntityAggregation
+from formula1_analytics.common.index_manager import IndexManager
+from formula1_analytics.common.lru_cache import LRUCache
+from formula1_analytics.common.exceptions import (
+    InvalidSeasonException,
+    SeasonNotFoundException,
+)
+
+LOGGER = get_logger(__name__)
+
+
+class SeasonProgressionColumns:
+    YEAR = "year"
+    ROUND = "round"
+    POINTS = "points"
+    TOTAL_POINTS = "total_points"
+
+
+class SeasonProgression(ABC):
+    """
+    Cumulative points of the entities of a championship (drivers or
+    constructors) during a season.
+
+    Subclasses name the derived structures and the source tables, and give
+    the points rows of the entities and their names. The progression of
+    every season is computed once with the EntityAggregation core and
+    shared through the DataRegistry, a season table is a slice of it.
+    get_data does not modify the instance data and computed seasons are
+    kept in a bounded LRU cache, so one instance can serve any number of
+    requests. After a refresh of the source tables only the progression and
+    the cached tables of the changed seasons are computed again.
+    """
+
+    # Column of the entity names in the long progression table
+    NAME_COLUMN: str
+    # Name of the progression in the DataRegistry
+    _derived_name: str
+    # Tables the progression is computed from
+    _sources: tuple[str, ...]
+    # Column of the entity ids in the points rows
+    _id_column: str
+    _not_found_exception: type[Exception]
+    # Seasons get_data accepts, None for any season in the data
+    _season_range: range | None = None
+
+    def __init__(self) -> None:
+        LOGGER.debug("Initializing %s class", type(self).__name__)
+        self._seasons = LRUCache(SEASON_CACHE_SIZE)
+        self._versions = None
+
+    def get_data(
+        self,
+        season_year: int,
+        names: list[str],
+    ) -> pd.DataFrame:
+        """
+        Description
+        -----------
+        Get the points progression of each entity in a given season.
+
+        Parameters
+        ----------
+        season_year : int
+            The season to get the progression for.
+        names : list[str], optional
+            A list of names to filter the results by, by default None.
+
+        Returns
+        -------
+        pd.DataFrame
+            A DataFrame indexed by round (with a first row of zeros for
+            round 0) with the total points of each entity as columns.
+        """
+        if not isinstance(season_year, int):
+            raise TypeError("Season year must be an integer")
+        if self._season_range is not None and season_year not in self._season_range:
+            raise InvalidSeasonException(season_year, self._season_range)
+
+        self._drop_changed_seasons()
+        season_data = self._seasons.get(season_year)
+        if season_data is None:
+            season_data = self._compute_season(season_year)
+            self._seasons.put(season_year, season_data)
+
+        if names:
+            if not isinstance(names, list):
+                raise TypeError("Names must be a list")
+            return self._filter_names(season_data, names)
+        return season_data.copy()
+
+    def get_all_seasons(
+        self,
+        start_year: int | None = None,
+        end_year: int | None = None,
+        wide: bool = False,
+    ) -> pd.DataFrame | dict[int, pd.DataFrame]:
+        """
+        Description
+        -----------
+        Get the points progression of every entity in all seasons, or in a
+        range of seasons.
+
+        Parameters
+        ----------
+        start_year : int, optional
+            The first season to include, by default the first season in the data.
+        end_year : int, optional
+            The last season to include, by default the last season in the data.
+        wide : bool, optional
+            Return a dict of per-season tables shaped like get_data instead
+            of one long table, by default False.
+
+        Returns
+        -------
+        pd.DataFrame | dict[int, pd.DataFrame]
+            The long table has one row per entity and round it scored in:
+
+            - year: Int64
+            - round: Int64
+            - NAME_COLUMN: string
+            - points: Float64, points scored in the round
+            - total_points: Float64, points scored in the season so far
+        """
+        progression = self._get_progression()
+        if start_year is not None:
+            progression = progression[progression[SeasonProgressionColumns.YEAR] >= start_year]
+        if end_year is not None:
+            progression = progression[progression[SeasonProgressionColumns.YEAR] <= end_year]
+
+        if not wide:
+            return progression.reset_index(drop=True)
+        return {
+            year: self._to_season_table(season)
+            for year, season in progression.groupby(SeasonProgressionColumns.YEAR, sort=True)
+        }
+
+    @classmethod
+    @abstractmethod
+    def _get_points(cls, season_years: list[int] | None) -> pd.DataFrame:
+        """
+        Get the points rows (race id, entity id and points columns) of the
+        seasons, or of all seasons
+        """
+
+    @classmethod
+    @abstractmethod
+    def _get_names(cls) -> pd.Series:
+        """
+        Get the names of the entities, indexed by id
+        """
+
+    @profile_stage()
+    def _compute_season(self, season_year: int) -> pd.DataFrame:
+        self._check_season(season_year)
+        progression = self._get_progression()
+        season_slices = self._get_progression_season_slices()
+        if season_year not in season_slices:
+            raise SeasonNotFoundException(season_year)
+        return self._to_season_table(progression.iloc[season_slices[season_year]])
+
+    def _to_season_table(self, season: pd.DataFrame) -> pd.DataFrame:
+        results = self._transform_names_to_columns(season)
+        results = self._add_first_zero_row(results)
+        return self._forward_fill_points(results)
+
+    def _drop_changed_seasons(self) -> None:
+        """
+        Drop the cached tables of the seasons changed by a refresh, or all of
+        them when a source table was reloaded
+        """
+        versions = DataRegistry.get_versions(*self._sources)
+        if versions == self._versions:
+            return
+        seasons = None
+        if self._versions is not None:
+            seasons = DatasetIndex.get_changed_seasons(self._sources, self._versions)
+        if seasons is None:
+            self._seasons.clear()
+        else:
+            for season_year in seasons:
+                self._seasons.pop(season_year)
+        self._versions = versions
+
+    def _get_progression(self) -> pd.DataFrame:
+        return DataRegistry.get_derived(
+            self._derived_name,
+            self._build_progression,
+            *self._sources,
+            updater=self._update_progression,
+        )
+
+    def _get_progression_season_slices(self) -> dict[int, slice]:
+        return DataRegistry.get_derived(
+            f"{self._derived_name}_slices",
+            lambda: IndexManager.get_group_slices(
+                self._get_progression()[SeasonProgressionColumns.YEAR]
+            ),
+            *self._sources,
+        )
+
+    @classmethod
+    def _update_progression(
+        cls,
+        progression: pd.DataFrame,
+        since_versions: tuple[int, ...],
+    ) -> pd.DataFrame | None:
+        seasons = DatasetIndex.get_changed_seasons(cls._sources, since_versions)
+        if seasons is None:
+            return None
+        if not seasons:
+            return progression
+
+        LOGGER.debug("Updating points progression of seasons %s...", sorted(seasons))
+        return EntityAggregation.replace_seasons(
+            progression, seasons, cls._build_progression(sorted(seasons))
+        )
+
+    @classmethod
+    @profile_stage()
+    def _build_progression(cls, seasons: list[int] | None = None) -> pd.DataFrame:
+        LOGGER.debug("Building %s of seasons %s...", cls._derived_name, seasons or "all")
+        rows = cls._get_points(seasons)
+        rows = EntityAggregation.attach_season_round(rows, rows.columns[0])
+        rows = EntityAggregation.attach_names(
+            rows, cls._id_column, cls._get_names().astype("string"), cls.NAME_COLUMN
+        )
+        rows = EntityAggregation.sum_by_round(
+            rows, cls.NAME_COLUMN, SeasonProgressionColumns.POINTS
+        )
+        return EntityAggregation.cumulative_sum_by_season(
+            rows,
+            cls.NAME_COLUMN,
+            SeasonProgressionColumns.POINTS,
+            SeasonProgressionColumns.TOTAL_POINTS,
+        )
+
+    def _check_season(self, season_year: int) -> None:
+        LOGGER.debug("Checking races of season year... %s", season_year)
+        if DatasetIndex.get_race_ids(season_year).empty:
+            raise SeasonNotFoundException(season_year)
+
+    @profile_stage()
+    def _transform_names_to_columns(self, season: pd.DataFrame) -> pd.DataFrame:
+        LOGGER.debug("Transforming %s to columns...", self.NAME_COLUMN)
+        results = season.pivot(
+            index=SeasonProgressionColumns.ROUND,
+            columns=self.NAME_COLUMN,
+            values=SeasonProgressionColumns.TOTAL_POINTS,
+        ).astype(float)
+        LOGGER.debug("Results with names as columns: \n %s", FrameSummary(results))
+        return results
+
+    @profile_stage()
+    def _add_first_zero_row(self, results: pd.DataFrame) -> pd.DataFrame:
+        LOGGER.debug("Adding first row of zeros...")
+        results.loc[0] = [0 for _ in range(len(results.columns))]
+        results = results.sort_index()
+        LOGGER.debug("Results with first row of zeros: \n %s", FrameSummary(results))
+        return results
+
+    @profile_stage()
+    def _forward_fill_points(self, results: pd.DataFrame) -> pd.DataFrame:
+        LOGGER.debug("Carrying points over rounds without points rows...")
+        results = results.fillna(method="ffill")
+        LOGGER.debug("Results with points carried over: \n %s", FrameSummary(results))
+        return results
+
+    @profile_stage()
+    def _filter_names(self, results: pd.DataFrame, names: list[str]) -> pd.DataFrame:
+        LOGGER.debug("Filtering %s by: %s", self.NAME_COLUMN, names)
+        for name in names:
+            if name not in results.columns:
+                raise self._not_found_exception(name)
+
+        results = results[list(names)]
+        LOGGER.debug("Results filtered by names: \n %s", FrameSummary(results))
+        return results
@@ -0,0 +1,107 @@
+import numpy as np
+
+
+class SortedGroups:
+    """
+    Group-wise statistics over contiguous groups of NumPy arrays.
+
+    The rows are sorted once by the group keys, every group is then a
+    contiguous run of the sorted arrays and its statistics are computed with
+    reduceat / cumulative sums over all groups at once, without a Python
+    loop over the groups.
+    """
+
+    def __init__(self, *keys: np.ndarray) -> None:
+        """
+        Group the rows by the key arrays, the last key varies fastest
+        """
+        self.order = np.lexsort(keys[::-1]) if keys else np.arange(0)
+        sorted_keys = [key[self.order] for key in keys]
+        size = len(self.order)
+
+        boundaries = np.zeros(size, dtype=bool)
+        if size:
+            boundaries[0] = True
+            for key in sorted_keys:
+                boundaries[1:] |= key[1:] != key[:-1]
+        self.starts = np.flatnonzero(boundaries)
+        self.counts = np.diff(np.append(self.starts, size))
+        self.keys = [key[self.starts] for key in sorted_keys]
+        # Group number of every sorted row
+        self.group_ids = np.repeat(np.arange(len(self.starts)), self.counts)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def sort(self, values: np.ndarray) -> np.ndarray:
+        """
+        Order the values of the original rows like the grouped rows
+        """
+        return values[self.order]
+
+    def sum(self, values: np.ndarray) -> np.ndarray:
+        if not len(self):
+            return np.zeros(0)
+        return np.add.reduceat(self.sort(values).astype(np.float64), self.starts)
+
+    def mean(self, values: np.ndarray) -> np.ndarray:
+        return self.sum(values) / self.counts
+
+    def std(self, values: np.ndarray, ddof: int = 1) -> np.ndarray:
+        """
+        Standard deviation of each group, NaN for groups of ddof rows or less
+        """
+        if not len(self):
+            return np.zeros(0)
+        sorted_values = self.sort(values).astype(np.float64)
+        means = self.mean(values)
+        squares = np.add.reduceat(
+            (sorted_values - means[self.group_ids]) ** 2, self.starts
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.sqrt(
+                np.where(self.counts > ddof, squares / (self.counts - ddof), np.nan)
+            )
+
+    def min(self, values: np.ndarray) -> np.ndarray:
+        if not len(self):
+            return np.zeros(0, dtype=values.dtype)
+        return np.minimum.reduceat(self.sort(values), self.starts)
+
+    def max(self, values: np.ndarray) -> np.ndarray:
+        if not len(self):
+            return np.zeros(0, dtype=values.dtype)
+        return np.maximum.reduceat(self.sort(values), self.starts)
+
+    def quantile(self, values: np.ndarray, q: float) -> np.ndarray:
+        """
+        Quantile of each group with linear interpolation (like
+        pandas.Series.quantile)
+        """
+        if not len(self):
+            return np.zeros(0)
+        # Sort the values inside each group, the groups keep their positions
+        within = np.lexsort((self.sort(values), self.group_ids))
+        sorted_values = self.sort(values)[within].astype(np.float64)
+
+        position = self.starts + q * (self.counts - 1)
+        lower = np.floor(position).astype(np.int64)
+        upper = np.ceil(position).astype(np.int64)
+        fraction = position - lower
+        return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+
+    def median(self, values: np.ndarray) -> np.ndarray:
+        return self.quantile(values, 0.5)
+
+    def rolling_mean(self, values: np.ndarray, window: int) -> np.ndarray:
+        """
+        Mean of the last window rows (fewer at the start of a group) of
+        every sorted row, within its group
+        """
+        sorted_values = self.sort(values).astype(np.float64)
+        cumulative = np.concatenate([[0.0], np.cumsum(sorted_values)])
+        positions = np.arange(len(sorted_values))
+        window_starts = np.maximum(positions - window + 1, self.starts[self.group_ids])
+        return (cumulative[positions + 1] - cumulative[window_starts]) / (
+            positions + 1 - window_starts
+        )
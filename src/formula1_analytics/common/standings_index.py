@@ -0,0 +1,420 @@
+from abc import ABC, abstractmethod
+import numpy as np
+import pandas as pd
+from formula1_analytics.logger import FrameSummary, get_logger
+from formula1_analytics.common.data_registry import DataRegistry
+from formula1_analytics.common.dataset_index import DatasetIndex
+from formula1_analytics.common.entity_aggregation import EntityAggregation
+from formula1_analytics.common.index_manager import IndexManager
+from formula1_analytics.common.profiling import profile_stage
+from formula1_analytics.common.sorted_groups import SortedGroups
+from formula1_analytics.common.exceptions import (
+    RaceNotFoundException,
+    SeasonNotFoundException,
+)
+
+LOGGER = get_logger(__name__)
+
+
+class StandingsIndexColumns:
+    RACE_ID = "raceId"
+    YEAR = "year"
+    ROUND = "round"
+    POINTS = "points"
+    POSITION = "position"
+    WINS = "wins"
+    GAP_TO_LEADER = "gap_to_leader"
+    RESULTS_POINTS = "results_points"
+
+
+class StandingsIndex(ABC):
+    """
+    Championship standings after every round of every season.
+
+    The standings table has one row per entity (driver or constructor) and
+    race with the championship points, position and wins after the race.
+    It is sorted once by year, round and position with the gap to the
+    leader attached, and shared through the DataRegistry with a map of
+    every (year, round) to the contiguous block of its standings. The
+    standings after a round, the leader changes and the gaps of a season
+    are slices of it. A refresh sorts the rows of the changed seasons only.
+
+    Subclasses give the standings table, the points rows the standings are
+    validated against and the names of the entities.
+    """
+
+    # Column of the entity ids in the standings
+    ID_COLUMN: str
+    # Column the entity names are added as
+    NAME_COLUMN: str
+    # Name of the snapshots in the DataRegistry
+    _derived_name: str
+    # Standings table, an F1Data subclass
+    _table: type
+    # Tables the snapshots are computed from
+    _sources: tuple[str, ...]
+
+    def __init__(self) -> None:
+        LOGGER.debug("Initializing %s class", type(self).__name__)
+
+    def get_standings(
+        self,
+        season_year: int,
+        round_number: int | None = None,
+    ) -> pd.DataFrame:
+        """
+        Description
+        -----------
+        Get the championship standings after a round of a season.
+
+        Parameters
+        ----------
+        season_year : int
+            The season.
+        round_number : int, optional
+            The round, by default the last round of the season with
+            standings.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per entity, ordered by position:
+
+            - ID_COLUMN: Int64
+            - points: Float64, championship points after the round
+            - position: Int64
+            - wins: Int64
+            - gap_to_leader: float64, points behind the leader
+            - NAME_COLUMN: string
+        """
+        snapshots = self._get_snapshots()
+        round_slices, season_slices = self._get_snapshot_slices()
+        if season_year not in season_slices:
+            raise SeasonNotFoundException(season_year)
+        if round_number is None:
+            round_number = int(
+                snapshots[StandingsIndexColumns.ROUND].iat[season_slices[season_year].stop - 1]
+            )
+        if (season_year, round_number) not in round_slices:
+            raise RaceNotFoundException(season_year, round_number)
+
+        standings = snapshots.iloc[round_slices[(season_year, round_number)]][
+            [
+                self.ID_COLUMN,
+                StandingsIndexColumns.POINTS,
+                StandingsIndexColumns.POSITION,
+                StandingsIndexColumns.WINS,
+                StandingsIndexColumns.GAP_TO_LEADER,
+            ]
+        ]
+        return self._add_names(standings)
+
+    def get_leader_changes(self, season_year: int) -> pd.DataFrame:
+        """
+        Description
+        -----------
+        Get the rounds of a season after which the championship leader
+        changed, the first round of the season included.
+
+        Parameters
+        ----------
+        season_year : int
+            The season.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per change of the leader, ordered by round:
+
+            - round: Int64
+            - ID_COLUMN: Int64, the new leader
+            - points: Float64, points of the new leader
+            - NAME_COLUMN: string
+        """
+        season = self._get_season(season_year)
+        rounds = season[StandingsIndexColumns.ROUND].to_numpy(dtype=np.int64)
+        # The leader is the first row of the block of every round
+        leaders = season.iloc[np.flatnonzero(np.diff(rounds, prepend=rounds[:1] - 1))]
+        leader_ids = leaders[self.ID_COLUMN].to_numpy(dtype=np.int64, na_value=-1)
+        changed = np.diff(leader_ids, prepend=leader_ids[:1] - 1) != 0
+        changes = leaders[changed][
+            [StandingsIndexColumns.ROUND, self.ID_COLUMN, StandingsIndexColumns.POINTS]
+        ]
+        LOGGER.debug("Leader changes in %s: \n %s", season_year, FrameSummary(changes))
+        return self._add_names(changes)
+
+    def get_gaps_to_leader(
+        self,
+        season_year: int,
+        wide: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Description
+        -----------
+        Get the points gap of every entity to the championship leader after
+        every round of a season.
+
+        Parameters
+        ----------
+        season_year : int
+            The season.
+        wide : bool, optional
+            Return a table indexed by round with the gap of each entity as
+            columns (named like NAME_COLUMN), by default False.
+
+        Returns
+        -------
+        pd.DataFrame
+            The long table has one row per entity and round, ordered by
+            round and position:
+
+            - round: Int64
+            - ID_COLUMN: Int64
+            - points: Float64
+            - gap_to_leader: float64
+            - NAME_COLUMN: string
+        """
+        season = self._get_season(season_year)[
+            [
+                StandingsIndexColumns.ROUND,
+                self.ID_COLUMN,
+                StandingsIndexColumns.POINTS,
+                StandingsIndexColumns.GAP_TO_LEADER,
+            ]
+        ]
+        if not wide:
+            return self._add_names(season)
+
+        gaps = season.pivot(
+            index=StandingsIndexColumns.ROUND,
+            columns=self.ID_COLUMN,
+            values=StandingsIndexColumns.GAP_TO_LEADER,
+        )
+        gaps.columns = pd.Index(
+            self._get_names().reindex(gaps.columns).array, name=self.NAME_COLUMN
+        )
+        return gaps
+
+    def validate(self, season_year: int | None = None) -> pd.DataFrame:
+        """
+        Description
+        -----------
+        Compare the championship points of the standings with the
+        cumulative sums of the points rows (race results) of every entity,
+        carried over the rounds without a points row.
+
+        Standings legitimately differ where points were not scored in the
+        races, for example sprint points or the dropped results of older
+        seasons, the differences are listed rather than raised.
+
+        Parameters
+        ----------
+        season_year : int, optional
+            The season to validate, by default every season.
+
+        Returns
+        -------
+        pd.DataFrame
+            The standings rows whose points differ, ordered by year, round
+            and position:
+
+            - year: Int64
+            - round: Int64
+            - ID_COLUMN: Int64
+            - points: Float64, championship points of the standings
+            - results_points: float64, cumulative points of the points rows
+            - NAME_COLUMN: string
+        """
+        if season_year is None:
+            snapshots = self._get_snapshots()
+            seasons = None
+        else:
+            snapshots = self._get_season(season_year)
+            seasons = [season_year]
+        totals = self._get_cumulative_points(seasons)
+
+        columns = [StandingsIndexColumns.YEAR, StandingsIndexColumns.ROUND, self.ID_COLUMN]
+        results_points = self._lookup_totals(snapshots, totals)
+        points = snapshots[StandingsIndexColumns.POINTS].to_numpy(dtype=np.float64, na_value=0.0)
+        differs = ~np.isclose(points, results_points)
+        differences = snapshots[differs][columns + [StandingsIndexColumns.POINTS]].assign(
+            **{StandingsIndexColumns.RESULTS_POINTS: results_points[differs]}
+        )
+        LOGGER.debug(
+            "%s of %s standings rows differ from the points rows",
+            len(differences),
+            len(snapshots),
+        )
+        return self._add_names(differences)
+
+    @classmethod
+    @abstractmethod
+    def _get_points(cls, season_years: list[int] | None) -> pd.DataFrame:
+        """
+        Get the points rows (race id, entity id and points columns) the
+        standings are validated against, of the seasons or of all seasons
+        """
+
+    @classmethod
+    @abstractmethod
+    def _get_names(cls) -> pd.Series:
+        """
+        Get the names of the entities, indexed by id
+        """
+
+    def _get_season(self, season_year: int) -> pd.DataFrame:
+        _, season_slices = self._get_snapshot_slices()
+        if season_year not in season_slices:
+            raise SeasonNotFoundException(season_year)
+        return self._get_snapshots().iloc[season_slices[season_year]]
+
+    def _get_snapshots(self) -> pd.DataFrame:
+        return DataRegistry.get_derived(
+            self._derived_name,
+            self._build_snapshots,
+            *self._sources,
+            updater=self._update_snapshots,
+        )
+
+    def _get_snapshot_slices(self) -> tuple[dict[tuple[int, int], slice], dict[int, slice]]:
+        return DataRegistry.get_derived(
+            f"{self._derived_name}_slices",
+            lambda: self._build_snapshot_slices(self._get_snapshots()),
+            *self._sources,
+        )
+
+    @classmethod
+    def _update_snapshots(
+        cls,
+        snapshots: pd.DataFrame,
+        since_versions: tuple[int, ...],
+    ) -> pd.DataFrame | None:
+        seasons = DatasetIndex.get_changed_seasons(cls._sources, since_versions)
+        if seasons is None:
+            return None
+        if not seasons:
+            return snapshots
+
+        LOGGER.debug("Updating %s of seasons %s...", cls._derived_name, sorted(seasons))
+        return EntityAggregation.replace_seasons(
+            snapshots, seasons, cls._build_snapshots(sorted(seasons))
+        )
+
+    @classmethod
+    @profile_stage()
+    def _build_snapshots(cls, season_years: list[int] | None = None) -> pd.DataFrame:
+        LOGGER.debug("Building %s of seasons %s...", cls._derived_name, season_years or "all")
+        standings = cls._table().get_selected_columns(
+            StandingsIndexColumns.RACE_ID,
+            cls.ID_COLUMN,
+            StandingsIndexColumns.POINTS,
+            StandingsIndexColumns.POSITION,
+            StandingsIndexColumns.WINS,
+        )
+        if season_years is not None:
+            standings = EntityAggregation.get_race_rows(
+                standings,
+                StandingsIndexColumns.RACE_ID,
+                EntityAggregation.get_season_race_ids(season_years),
+            )
+        standings = EntityAggregation.attach_season_round(standings, StandingsIndexColumns.RACE_ID)
+        standings = standings.sort_values(
+            [
+                StandingsIndexColumns.YEAR,
+                StandingsIndexColumns.ROUND,
+                StandingsIndexColumns.POSITION,
+            ],
+            kind="stable",
+            na_position="last",
+        ).reset_index(drop=True)
+
+        groups = SortedGroups(
+            standings[StandingsIndexColumns.YEAR].to_numpy(dtype=np.int64),
+            standings[StandingsIndexColumns.ROUND].to_numpy(dtype=np.int64),
+        )
+        points = standings[StandingsIndexColumns.POINTS].to_numpy(dtype=np.float64, na_value=0.0)
+        # The rows are sorted already, so the group ids follow the rows
+        standings[StandingsIndexColumns.GAP_TO_LEADER] = (
+            groups.max(points)[groups.group_ids] - points
+        )
+        LOGGER.debug("Standings snapshots: \n %s", FrameSummary(standings))
+        return standings
+
+    @staticmethod
+    def _build_snapshot_slices(
+        snapshots: pd.DataFrame,
+    ) -> tuple[dict[tuple[int, int], slice], dict[int, slice]]:
+        groups = SortedGroups(
+            snapshots[StandingsIndexColumns.YEAR].to_numpy(dtype=np.int64),
+            snapshots[StandingsIndexColumns.ROUND].to_numpy(dtype=np.int64),
+        )
+        round_slices = {
+            (year, round_number): slice(start, start + count)
+            for year, round_number, start, count in zip(
+                groups.keys[0].tolist(),
+                groups.keys[1].tolist(),
+                groups.starts.tolist(),
+                groups.counts.tolist(),
+            )
+        }
+        season_slices = IndexManager.get_group_slices(snapshots[StandingsIndexColumns.YEAR])
+        return round_slices, season_slices
+
+    @classmethod
+    @profile_stage()
+    def _get_cumulative_points(cls, season_years: list[int] | None) -> pd.DataFrame:
+        rows = EntityAggregation.attach_season_round(
+            cls._get_points(season_years), StandingsIndexColumns.RACE_ID
+        )
+        rows = EntityAggregation.sum_by_round(rows, cls.ID_COLUMN, StandingsIndexColumns.POINTS)
+        rows = EntityAggregation.cumulative_sum_by_season(
+            rows,
+            cls.ID_COLUMN,
+            StandingsIndexColumns.POINTS,
+            StandingsIndexColumns.RESULTS_POINTS,
+        )
+        return rows
+
+    @classmethod
+    def _lookup_totals(cls, snapshots: pd.DataFrame, totals: pd.DataFrame) -> np.ndarray:
+        """
+        Cumulative points of every snapshot row: the total after the last
+        round up to the row's round with a points row of the entity, 0
+        before its first one. Season, entity and round are packed into one
+        integer key, so the lookup is a single searchsorted.
+        """
+        snapshot_keys = cls._get_lookup_keys(snapshots)
+        total_keys = cls._get_lookup_keys(totals)
+        id_base = max(snapshot_keys[1].max(initial=0), total_keys[1].max(initial=0)) + 1
+        round_base = max(snapshot_keys[2].max(initial=0), total_keys[2].max(initial=0)) + 1
+
+        total_entities = total_keys[0] * id_base + total_keys[1]
+        total_packed = total_entities * round_base + total_keys[2]
+        order = np.argsort(total_packed, kind="stable")
+        total_entities = total_entities[order]
+        total_packed = total_packed[order]
+        values = totals[StandingsIndexColumns.RESULTS_POINTS].to_numpy(
+            dtype=np.float64, na_value=0.0
+        )[order]
+
+        snapshot_entities = snapshot_keys[0] * id_base + snapshot_keys[1]
+        positions = np.searchsorted(
+            total_packed, snapshot_entities * round_base + snapshot_keys[2], side="right"
+        ) - 1
+        found = positions >= 0
+        found[found] = total_entities[positions[found]] == snapshot_entities[found]
+        return np.where(found, values[np.maximum(positions, 0)], 0.0)
+
+    @classmethod
+    def _get_lookup_keys(cls, data: pd.DataFrame) -> list[np.ndarray]:
+        # Missing ids become 0, the ids are shifted to keep them apart
+        return [
+            data[StandingsIndexColumns.YEAR].to_numpy(dtype=np.int64),
+            data[cls.ID_COLUMN].to_numpy(dtype=np.int64, na_value=-1) + 1,
+            data[StandingsIndexColumns.ROUND].to_numpy(dtype=np.int64),
+        ]
+
+    def _add_names(self, data: pd.DataFrame) -> pd.DataFrame:
+        data = data.reset_index(drop=True)
+        data[self.NAME_COLUMN] = self._get_names().reindex(data[self.ID_COLUMN]).array
+        return data
@@ -1,4 +1,8 @@
+import os
+
 DATA_DIR = "data/"
+# Directory with the CSV files to use instead of the bundled package data
+DATA_PATH = os.environ.get("F1_ANALYTICS_DATA_PATH")
 CIRCUITS_FILENAME = "circuits.csv"
 CONSTRUCTORS_RESULTS_FILENAME = "constructor_results.csv"
 CONSTRUCTORS_STANDINGS_FILENAME = "constructor_standings.csv"
@@ -12,5 +16,89 @@ RACES_FILENAME = "races.csv"
 RESULTS_FILENAME = "results.csv"
 SEASONS_FILENAME = "seasons.csv"
 SPRINTS_FILENAME = "sprints.csv"
+SPRINT_RESULTS_FILENAME = "sprint_results.csv"
 STATUS_FILENAME = "status.csv"
 WEATHER_FILENAME = "weather.csv"
+
+CACHE_ENABLED = True
+CACHE_DIR = os.environ.get(
+    "F1_ANALYTICS_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "formula1_analytics"),
+)
+
+SEASON_CACHE_SIZE = 32
+
+MEMORY_OPTIMIZED = False
+
+# Record wall time and row counts of every pipeline stage, see common.profiling
+PROFILING_ENABLED = os.environ.get("F1_ANALYTICS_PROFILING") == "1"
+# Also record the memory allocated by every stage (slows allocations down)
+PROFILING_TRACE_MEMORY = False
+
+LOG_LEVEL = os.environ.get("F1_ANALYTICS_LOG_LEVEL", "WARNING")
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+# "console" and/or "file" (written to LOG_FILE)
+LOG_HANDLERS = ["console"]
+LOG_FILE = "formula1_analytics.log"
+# Rows and columns of DataFrames rendered in debug messages
+LOG_FRAME_ROWS = 5
+LOG_FRAME_COLUMNS = 10
+
+# Rows per chunk of the streaming loader
+CHUNK_SIZE = 100_000
+# Chunks whose partial aggregates are merged at once, bounds the memory of
+# the pending partials to this many times the number of groups
+CHUNK_MERGE_INTERVAL = 16
+
+# Worker processes of the BatchExecutor, None uses every core
+BATCH_MAX_WORKERS = None
+# Start method of the BatchExecutor workers, None forks when the parent has
+# no other threads and uses forkserver (or spawn) otherwise
+BATCH_START_METHOD = None
+
+# Rendered plots kept in memory, with spill evicted plots go to PLOT_CACHE_DIR
+PLOT_CACHE_SIZE = 64
+PLOT_CACHE_SPILL = False
+PLOT_CACHE_DIR = os.path.join(CACHE_DIR, "plots")
+# Worker processes rendering plots, None uses every core
+PLOT_MAX_WORKERS = None
+
+# Query server, see server.http_server
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 8050
+# Threads running the analytics of the requests
+SERVER_MAX_WORKERS = 4
+# Seconds an idle keep-alive connection stays open
+SERVER_KEEP_ALIVE_TIMEOUT = 5
+# Bytes of the request line and headers
+SERVER_MAX_HEADER_SIZE = 16 * 1024
+
+# Refreshes of each table whose appended rows are kept for the incremental
+# update of derived structures, older changes make them rebuild
+REFRESH_HISTORY_SIZE = 16
+
+# Leaderboard totals of season ranges kept per Leaderboard instance (drivers,
+# constructors)
+LEADERBOARD_CACHE_SIZE = 32
+
+# Championship simulator, see drivers.championship_simulator
+# Points of the finishing positions in the simulated races
+SIMULATION_POINTS = [25, 18, 15, 12, 10, 8, 6, 4, 2, 1]
+# Races before the simulated ones the finishing position distributions are
+# estimated from
+SIMULATION_FORM_RACES = 10
+# Pseudo-count added to every finishing position of every driver
+SIMULATION_FORM_PRIOR = 0.5
+# Simulated races times drivers of one batch, bounds the memory of a batch
+SIMULATION_BATCH_ELEMENTS = 4_000_000
+# Worker processes simulating batches, 1 simulates in the calling process
+# and None uses every core
+SIMULATION_MAX_WORKERS = 1
+
+# Rescored progressions and standings of points systems kept per
+# PointsRescoring instance (drivers, constructors)
+POINTS_RESCORING_CACHE_SIZE = 8
+
+# Teammate head-to-head totals of season ranges kept per TeammatesHeadToHead
+# instance
+HEAD_TO_HEAD_CACHE_SIZE = 32
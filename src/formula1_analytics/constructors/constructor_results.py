@@ -0,0 +1,46 @@
+import pandas as pd
+from formula1_analytics.config.config import CONSTRUCTORS_RESULTS_FILENAME
+from formula1_analytics.common.f1_data import F1Data
+
+
+class ConstructorResultsColumns:
+    CONSTRUCTOR_RESULTS_ID = "constructorResultsId"
+    RACE_ID = "raceId"
+    CONSTRUCTOR_ID = "constructorId"
+    POINTS = "points"
+    STATUS = "status"
+
+    @staticmethod
+    def get_types() -> dict[str, str]:
+        return {
+            ConstructorResultsColumns.RACE_ID: "Int64",
+            ConstructorResultsColumns.CONSTRUCTOR_ID: "Int64",
+            ConstructorResultsColumns.POINTS: "Float64",
+            ConstructorResultsColumns.STATUS: "string",
+        }
+
+    @staticmethod
+    def get_category_columns() -> list[str]:
+        return [ConstructorResultsColumns.STATUS]
+
+
+class ConstructorResults(F1Data):
+    def __init__(self) -> None:
+        super().__init__(
+            CONSTRUCTORS_RESULTS_FILENAME,
+            ConstructorResultsColumns.CONSTRUCTOR_RESULTS_ID,
+            ConstructorResultsColumns.get_types(),
+            ConstructorResultsColumns.get_category_columns(),
+        )
+
+    def get_race_ids(self) -> pd.Series:
+        return self._data[ConstructorResultsColumns.RACE_ID]
+
+    def get_constructor_ids(self) -> pd.Series:
+        return self._data[ConstructorResultsColumns.CONSTRUCTOR_ID]
+
+    def get_points(self) -> pd.Series:
+        return self._data[ConstructorResultsColumns.POINTS]
+
+    def get_statuses(self) -> pd.Series:
+        return self._data[ConstructorResultsColumns.STATUS]
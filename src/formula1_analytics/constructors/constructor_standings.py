@@ -0,0 +1,56 @@
+import pandas as pd
+from formula1_analytics.config.config import CONSTRUCTORS_STANDINGS_FILENAME
+from formula1_analytics.common.f1_data import F1Data
+
+
+class ConstructorStandingsColumns:
+    CONSTRUCTOR_STANDINGS_ID = "constructorStandingsId"
+    RACE_ID = "raceId"
+    CONSTRUCTOR_ID = "constructorId"
+    POINTS = "points"
+    POSITION = "position"
+    POSITION_TEXT = "positionText"
+    WINS = "wins"
+
+    @staticmethod
+    def get_types() -> dict[str, str]:
+        return {
+            ConstructorStandingsColumns.RACE_ID: "Int64",
+            ConstructorStandingsColumns.CONSTRUCTOR_ID: "Int64",
+            ConstructorStandingsColumns.POINTS: "Float64",
+            ConstructorStandingsColumns.POSITION: "Int64",
+            ConstructorStandingsColumns.POSITION_TEXT: "string",
+            ConstructorStandingsColumns.WINS: "Int64",
+        }
+
+    @staticmethod
+    def get_category_columns() -> list[str]:
+        return [ConstructorStandingsColumns.POSITION_TEXT]
+
+
+class ConstructorStandings(F1Data):
+    def __init__(self) -> None:
+        super().__init__(
+            CONSTRUCTORS_STANDINGS_FILENAME,
+            ConstructorStandingsColumns.CONSTRUCTOR_STANDINGS_ID,
+            ConstructorStandingsColumns.get_types(),
+            ConstructorStandingsColumns.get_category_columns(),
+        )
+
+    def get_race_ids(self) -> pd.Series:
+        return self._data[ConstructorStandingsColumns.RACE_ID]
+
+    def get_constructor_ids(self) -> pd.Series:
+        return self._data[ConstructorStandingsColumns.CONSTRUCTOR_ID]
+
+    def get_points(self) -> pd.Series:
+        return self._data[ConstructorStandingsColumns.POINTS]
+
+    def get_positions(self) -> pd.Series:
+        return self._data[ConstructorStandingsColumns.POSITION]
+
+    def get_positions_texts(self) -> pd.Series:
+        return self._data[ConstructorStandingsColumns.POSITION_TEXT]
+
+    def get_wins(self) -> pd.Series:
+        return self._data[ConstructorStandingsColumns.WINS]
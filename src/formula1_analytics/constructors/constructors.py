@@ -0,0 +1,46 @@
+import pandas as pd
+from formula1_analytics.config.config import CONSTRUCTORS_FILENAME
+from formula1_analytics.common.f1_data import F1Data
+
+
+class ConstructorsColumns:
+    CONSTRUCTOR_ID = "constructorId"
+    CONSTRUCTOR_REF = "constructorRef"
+    NAME = "name"
+    NATIONALITY = "nationality"
+    URL = "url"
+
+    @staticmethod
+    def get_types() -> dict[str, str]:
+        return {
+            ConstructorsColumns.CONSTRUCTOR_REF: "string",
+            ConstructorsColumns.NAME: "string",
+            ConstructorsColumns.NATIONALITY: "string",
+            ConstructorsColumns.URL: "string",
+        }
+
+    @staticmethod
+    def get_category_columns() -> list[str]:
+        return [ConstructorsColumns.NATIONALITY]
+
+
+class Constructors(F1Data):
+    def __init__(self) -> None:
+        super().__init__(
+            CONSTRUCTORS_FILENAME,
+            ConstructorsColumns.CONSTRUCTOR_ID,
+            ConstructorsColumns.get_types(),
+            ConstructorsColumns.get_category_columns(),
+        )
+
+    def get_refs(self) -> pd.Series:
+        return self._data[ConstructorsColumns.CONSTRUCTOR_REF]
+
+    def get_names(self) -> pd.Series:
+        return self._data[ConstructorsColumns.NAME]
+
+    def get_nationalities(self) -> pd.Series:
+        return self._data[ConstructorsColumns.NATIONALITY]
+
+    def get_url(self) -> pd.Series:
+        return self._data[ConstructorsColumns.URL]
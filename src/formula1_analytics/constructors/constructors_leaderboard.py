@@ -0,0 +1,25 @@
+import pandas as pd
+from formula1_analytics.common.leaderboard import Leaderboard, LeaderboardColumns
+from formula1_analytics.constructors.constructors import Constructors, ConstructorsColumns
+from formula1_analytics.results.results import ResultsColumns
+
+
+class ConstructorsLeaderboardColumns(LeaderboardColumns):
+    CONSTRUCTOR_ID = ResultsColumns.CONSTRUCTOR_ID
+    NAME = ConstructorsColumns.NAME
+
+
+class ConstructorsLeaderboard(Leaderboard):
+    """
+    Career statistics of all constructors, indexed by constructorId with
+    their name, see Leaderboard. Wins, podiums, poles, points and fastest
+    laps count every car of the team, starts count the races entered.
+    """
+
+    ID_COLUMN = ConstructorsLeaderboardColumns.CONSTRUCTOR_ID
+    NAME_COLUMN = ConstructorsLeaderboardColumns.NAME
+    _derived_name = "constructors_leaderboard"
+
+    @classmethod
+    def _get_names(cls) -> pd.Series:
+        return Constructors().get_names()
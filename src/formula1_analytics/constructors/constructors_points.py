@@ -0,0 +1,32 @@
+import pandas as pd
+from formula1_analytics.common.entity_aggregation import EntityAggregation
+from formula1_analytics.constructors.constructor_results import (
+    ConstructorResults,
+    ConstructorResultsColumns,
+)
+
+
+class ConstructorsPoints:
+    """
+    Points the constructors scored for the championship in each race, the
+    source of the constructors season progression and standings checks
+    """
+
+    @staticmethod
+    def get_rows(season_years: list[int] | None) -> pd.DataFrame:
+        """
+        Get the race id, constructor id and points of the constructor
+        results of the seasons, or of all seasons
+        """
+        results = ConstructorResults().get_selected_columns(
+            ConstructorResultsColumns.RACE_ID,
+            ConstructorResultsColumns.CONSTRUCTOR_ID,
+            ConstructorResultsColumns.POINTS,
+        )
+        if season_years is None:
+            return results
+        return EntityAggregation.get_race_rows(
+            results,
+            ConstructorResultsColumns.RACE_ID,
+            EntityAggregation.get_season_race_ids(season_years),
+        )
@@ -0,0 +1,21 @@
+import pandas as pd
+from formula1_analytics.config.config import CONSTRUCTORS_FILENAME
+from formula1_analytics.common.points_rescoring import PointsRescoring
+from formula1_analytics.constructors.constructors import Constructors, ConstructorsColumns
+from formula1_analytics.results.results import ResultsColumns
+
+
+class ConstructorsPointsRescoring(PointsRescoring):
+    """
+    Season progressions and final standings of the constructors under any
+    points system, with their name, see PointsRescoring. Every car of a
+    team scores for it.
+    """
+
+    ID_COLUMN = ResultsColumns.CONSTRUCTOR_ID
+    NAME_COLUMN = ConstructorsColumns.NAME
+    _names_sources = (CONSTRUCTORS_FILENAME,)
+
+    @classmethod
+    def _get_names(cls) -> pd.Series:
+        return Constructors().get_names()
@@ -0,0 +1,66 @@
+import pandas as pd
+from formula1_analytics.config.config import (
+    CONSTRUCTORS_FILENAME,
+    CONSTRUCTORS_RESULTS_FILENAME,
+    RACES_FILENAME,
+)
+from formula1_analytics.common.season_progression import (
+    SeasonProgression,
+    SeasonProgressionColumns,
+)
+from formula1_analytics.constructors.constructors import Constructors
+from formula1_analytics.constructors.constructor_results import ConstructorResultsColumns
+from formula1_analytics.constructors.constructors_points import ConstructorsPoints
+from formula1_analytics.constructors.exceptions import ConstructorNotFoundException
+
+
+class ConstructorsSeasonPerfColumns(SeasonProgressionColumns):
+    CONSTRUCTOR_NAME = "constructor_name"
+
+
+class ConstructorsSeasonPerf(SeasonProgression):
+    """
+    Cumulative points of constructors during a season, computed from the
+    constructor results (the points each team scored for the
+    championship in each race), see SeasonProgression.
+    """
+
+    NAME_COLUMN = ConstructorsSeasonPerfColumns.CONSTRUCTOR_NAME
+    _derived_name = "constructors_season_progression"
+    _sources = (CONSTRUCTORS_RESULTS_FILENAME, RACES_FILENAME, CONSTRUCTORS_FILENAME)
+    _id_column = ConstructorResultsColumns.CONSTRUCTOR_ID
+    _not_found_exception = ConstructorNotFoundException
+
+    def get_data(
+        self,
+        season_year: int,
+        constructor_names: list[str],
+    ) -> pd.DataFrame:
+        """
+        Description
+        -----------
+        Get the performance of each constructor in a given season.
+
+        Parameters
+        ----------
+        season_year : int
+            The season to get the performance for, seasons without a
+            constructors championship raise SeasonNotFoundException.
+        constructor_names : list[str], optional
+            A list of constructor names to filter the results by, by default None.
+
+        Returns
+        -------
+        pd.DataFrame
+            A DataFrame indexed by round with the total points of each
+            constructor in the season as columns.
+        """
+        return super().get_data(season_year, constructor_names)
+
+    @classmethod
+    def _get_points(cls, season_years: list[int] | None) -> pd.DataFrame:
+        return ConstructorsPoints.get_rows(season_years)
+
+    @classmethod
+    def _get_names(cls) -> pd.Series:
+        return Constructors().get_names()
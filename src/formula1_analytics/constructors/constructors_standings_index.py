@@ -0,0 +1,31 @@
+import pandas as pd
+from formula1_analytics.config.config import CONSTRUCTORS_STANDINGS_FILENAME, RACES_FILENAME
+from formula1_analytics.common.standings_index import StandingsIndex
+from formula1_analytics.constructors.constructors import Constructors, ConstructorsColumns
+from formula1_analytics.constructors.constructors_points import ConstructorsPoints
+from formula1_analytics.constructors.constructor_standings import (
+    ConstructorStandings,
+    ConstructorStandingsColumns,
+)
+
+
+class ConstructorsStandingsIndex(StandingsIndex):
+    """
+    Constructors championship standings after every round, from the
+    constructor standings table and validated against the constructor
+    results, see StandingsIndex.
+    """
+
+    ID_COLUMN = ConstructorStandingsColumns.CONSTRUCTOR_ID
+    NAME_COLUMN = ConstructorsColumns.NAME
+    _derived_name = "constructors_standings_snapshots"
+    _table = ConstructorStandings
+    _sources = (CONSTRUCTORS_STANDINGS_FILENAME, RACES_FILENAME)
+
+    @classmethod
+    def _get_points(cls, season_years: list[int] | None) -> pd.DataFrame:
+        return ConstructorsPoints.get_rows(season_years)
+
+    @classmethod
+    def _get_names(cls) -> pd.Series:
+        return Constructors().get_names()
@@ -0,0 +1,8 @@
+class ConstructorNotFoundException(Exception):
+    def __init__(self, constructor_name: str) -> None:
+        self.constructor_name = constructor_name
+        self.message = f"Constructor '{constructor_name}' not found in this season"
+        super().__init__(self.message)
+
+    def __reduce__(self):
+        return ConstructorNotFoundException, (self.constructor_name,)
@@ -0,0 +1,483 @@
+import numpy as np
+import pandas as pd
+import formula1_analytics.config.config as cfg
+from formula1_analytics.logger import FrameSummary, get_logger
+from formula1_analytics.common.batch_executor import AnalyticRequest, BatchExecutor
+from formula1_analytics.common.dataset_index import DatasetIndex
+from formula1_analytics.common.profiling import profile_stage
+from formula1_analytics.common.standings_index import StandingsIndexColumns
+from formula1_analytics.drivers.drivers import Drivers, DriversColumns
+from formula1_analytics.drivers.drivers_standings_index import DriversStandingsIndex
+from formula1_analytics.races.races import Races, RacesColumns
+from formula1_analytics.results.results import ResultsColumns
+from formula1_analytics.common.exceptions import (
+    RaceNotFoundException,
+    SeasonNotFoundException,
+)
+
+LOGGER = get_logger(__name__)
+
+# Bits of the random draw of a finishing position, and of the tie-break
+_DRAW_BITS = 16
+
+
+class SimulationColumns:
+    DRIVER_ID = ResultsColumns.DRIVER_ID
+    FULLNAME = DriversColumns.FULLNAME
+    POINTS = "points"
+    WINS = "wins"
+    TITLE_PROBABILITY = "title_probability"
+    MEAN_POINTS = "mean_points"
+    STD_POINTS = "std_points"
+    P05_POINTS = "p05_points"
+    P50_POINTS = "p50_points"
+    P95_POINTS = "p95_points"
+
+
+class SeasonModel:
+    """
+    Inputs of the simulation of the rest of a season: the drivers, their
+    points and wins so far, the distribution of their finishing positions
+    (a cumulative distribution over positions 1 to the number of drivers,
+    one row per driver), the number of races left and the points of the
+    finishing positions. The lookup table of the positions is built once
+    here rather than in every batch, see get_position_table; the model
+    stays around a megabyte, so it is cheap to send to worker processes.
+    """
+
+    def __init__(
+        self,
+        driver_ids: np.ndarray,
+        points: np.ndarray,
+        wins: np.ndarray,
+        position_cdf: np.ndarray,
+        rounds: int,
+        points_table: np.ndarray,
+    ) -> None:
+        self.driver_ids = driver_ids
+        self.points = points
+        self.wins = wins
+        self.position_cdf = position_cdf
+        self.rounds = rounds
+        self.points_table = points_table
+        self._position_table = self._build_position_table()
+
+    def get_position_table(self) -> np.ndarray:
+        """
+        Inverse of the position distributions sampled at 2**_DRAW_BITS
+        evenly spaced probabilities: the finishing position (from 0) of
+        every driver (rows) for every random draw (columns). The
+        probabilities of the positions are rounded to 1 / 2**_DRAW_BITS.
+        """
+        return self._position_table
+
+    def _build_position_table(self) -> np.ndarray:
+        draws = (np.arange(1 << _DRAW_BITS) + 0.5) / (1 << _DRAW_BITS)
+        drivers = len(self.driver_ids)
+        # Distribution of driver d is shifted to [d, d + 1], so one sorted
+        # array holds all of them
+        offsets = np.arange(drivers)
+        table = np.searchsorted(
+            (self.position_cdf + offsets[:, None]).ravel(),
+            (draws + offsets[:, None]).ravel(),
+            side="right",
+        ).reshape(drivers, -1) - (offsets * drivers)[:, None]
+        return np.minimum(table, drivers - 1).astype(np.min_scalar_type(drivers - 1))
+
+    def get_point_bins(self) -> tuple[int, int]:
+        """
+        First bin and number of bins of the final points of a driver, in
+        half points
+        """
+        first = int(np.floor(self.points.min(initial=0.0) * 2))
+        most = self.points.max(initial=0.0) + self.rounds * self.points_table.max(initial=0.0)
+        last = int(np.ceil(most * 2))
+        return first, last - first + 1
+
+
+class SeasonSampler:
+    """
+    Simulates batches of seasons of a SeasonModel, the unit of work of the
+    process pool
+    """
+
+    def run(
+        self,
+        model: SeasonModel,
+        simulations: int,
+        seed: np.random.SeedSequence,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Description
+        -----------
+        Simulate the rest of the season the given number of times.
+
+        Every simulated race samples the finishing position of each driver
+        from its distribution (inverse transform sampling through a lookup
+        table, see SeasonModel.get_position_table), the finishing order
+        sorts the drivers by their sampled positions with random ties.
+
+        Parameters
+        ----------
+        model : SeasonModel
+            The season to simulate.
+        simulations : int
+            The number of simulated seasons.
+        seed : np.random.SeedSequence
+            The seed of the batch.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+            Per driver: the number of titles, the sum and the sum of squares
+            of the final points, and the histogram of the final points in
+            half points (see SeasonModel.get_point_bins).
+        """
+        rng = np.random.default_rng(seed)
+        drivers = len(model.driver_ids)
+        shape = (simulations, model.rounds, drivers)
+
+        # The high bits of every random word pick the finishing position from
+        # the lookup table of the driver, the low bits order the drivers
+        # which drew the same position
+        draws = rng.integers(0, 1 << (2 * _DRAW_BITS), shape, dtype=np.uint32)
+        positions = model.get_position_table().ravel()[
+            (draws >> _DRAW_BITS) + np.arange(drivers, dtype=np.uint32) * (1 << _DRAW_BITS)
+        ]
+        keys = (positions.astype(np.uint32) << _DRAW_BITS) | (draws & ((1 << _DRAW_BITS) - 1))
+        del draws, positions
+        scoring = min(len(model.points_table), drivers)
+        order = np.argsort(keys, axis=-1)[..., :scoring]
+        del keys
+
+        season_offsets = (np.arange(simulations, dtype=np.int32) * drivers)[:, None, None]
+        points = np.bincount(
+            (order.astype(np.int32) + season_offsets).ravel(),
+            weights=np.broadcast_to(model.points_table[:scoring], order.shape).ravel(),
+            minlength=simulations * drivers,
+        ).reshape(simulations, drivers)
+        wins = np.bincount(
+            (order[..., 0] + season_offsets[..., 0]).ravel(),
+            minlength=simulations * drivers,
+        ).reshape(simulations, drivers)
+
+        points = points + model.points
+        wins = wins + model.wins
+        # Ties on points are decided by wins, then by the lower driver id
+        leaders = points == points.max(axis=1, keepdims=True)
+        champions = np.argmax(np.where(leaders, wins, -1), axis=1)
+        titles = np.bincount(champions, minlength=drivers)
+
+        first_bin, bins = model.get_point_bins()
+        point_bins = np.rint(points * 2).astype(np.int64) - first_bin
+        histogram = np.bincount(
+            (point_bins + np.arange(drivers) * bins).ravel(),
+            minlength=drivers * bins,
+        ).reshape(drivers, bins)
+        return titles, points.sum(axis=0), (points**2).sum(axis=0), histogram
+
+
+class SimulationResult:
+    """
+    Outcome of a simulation: summary has one row per driver, ordered by
+    title probability, points_distribution the probability of every final
+    points total (index, in half points) of every driver (columns)
+    """
+
+    def __init__(
+        self,
+        summary: pd.DataFrame,
+        points_distribution: pd.DataFrame,
+        simulations: int,
+        seed: int | None,
+    ) -> None:
+        self.summary = summary
+        self.points_distribution = points_distribution
+        self.simulations = simulations
+        self.seed = seed
+
+    def get_title_probabilities(self) -> pd.Series:
+        return self.summary.set_index(SimulationColumns.FULLNAME)[
+            SimulationColumns.TITLE_PROBABILITY
+        ]
+
+    def __repr__(self) -> str:
+        return f"SimulationResult({self.simulations} seasons, seed={self.seed})"
+
+
+class ChampionshipSimulator:
+    """
+    Monte Carlo simulation of the drivers championship from a round of a
+    season to its end.
+
+    The points and wins so far are those of the drivers standings, so they
+    include sprint points. The finishing position distribution of each
+    driver comes from its results in the last races before the simulated
+    ones (config SIMULATION_FORM_RACES), smoothed with a pseudo-count. The remaining
+    races of many seasons are sampled at once as arrays of shape
+    (seasons, races, drivers) and scored with the points table. Seasons are
+    simulated in batches to bound the memory (config
+    SIMULATION_BATCH_ELEMENTS), every batch has its own seed spawned from
+    the given one, so a seeded simulation gives the same result in the
+    calling process and on the process pool.
+    """
+
+    def __init__(
+        self,
+        points_table: list[float] | None = None,
+        form_races: int | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        self._points_table = np.asarray(
+            cfg.SIMULATION_POINTS if points_table is None else points_table,
+            dtype=np.float64,
+        )
+        self._form_races = form_races or cfg.SIMULATION_FORM_RACES
+        self._max_workers = max_workers or cfg.SIMULATION_MAX_WORKERS
+        self._standings_index = DriversStandingsIndex()
+
+    def simulate(
+        self,
+        season_year: int,
+        after_round: int,
+        simulations: int = 100_000,
+        seed: int | None = None,
+    ) -> SimulationResult:
+        """
+        Description
+        -----------
+        Simulate the rest of a season after a round.
+
+        Parameters
+        ----------
+        season_year : int
+            The season.
+        after_round : int
+            The last round with known results, 0 simulates the whole season.
+            Rounds after the last one with results raise
+            RaceNotFoundException.
+        simulations : int, optional
+            The number of simulated seasons, by default 100 000.
+        seed : int, optional
+            Seed of the random numbers, by default a random seed.
+
+        Returns
+        -------
+        SimulationResult
+            The summary has one row per driver:
+
+            - driverId: int64
+            - fullname: string
+            - points: float64, points after the round
+            - wins: int64, wins after the round
+            - title_probability: float64
+            - mean_points: float64, final points
+            - std_points: float64
+            - p05_points, p50_points, p95_points: float64, quantiles of the
+              final points
+        """
+        if not isinstance(simulations, int) or simulations <= 0:
+            raise ValueError("Simulations must be a positive integer")
+        model = self.build_model(season_year, after_round)
+        titles, points_sum, squares_sum, histogram = self._run(model, simulations, seed)
+        return self._summarize(model, simulations, seed, titles, points_sum, squares_sum, histogram)
+
+    @profile_stage()
+    def build_model(self, season_year: int, after_round: int) -> SeasonModel:
+        """
+        Description
+        -----------
+        Get the inputs of the simulation of the rest of a season.
+
+        Parameters
+        ----------
+        season_year : int
+            The season.
+        after_round : int
+            The last round with known results.
+
+        Returns
+        -------
+        SeasonModel
+            The drivers are those of the last round played, or of the first
+            round of the season when none has been played, plus the drivers
+            with points in the season.
+        """
+        races = DatasetIndex.get_season_races(season_year)
+        if races.empty:
+            raise SeasonNotFoundException(season_year)
+        rounds = races[RacesColumns.ROUND].to_numpy(dtype=np.int64)
+        with_results = races.index.isin(
+            DatasetIndex.get_race_results(races.index)[ResultsColumns.RACE_ID].unique()
+        )
+        last_round = int(rounds[with_results].max()) if with_results.any() else 0
+        if after_round != 0 and (after_round not in rounds or after_round > last_round):
+            raise RaceNotFoundException(season_year, after_round)
+
+        played = races.index[rounds <= after_round]
+        form_race_ids = self._get_form_race_ids(season_year, played)
+        form_results = DatasetIndex.get_race_results(form_race_ids)
+
+        driver_ids, points, wins = self._get_standings(season_year, after_round)
+        entry_race_ids = played[-1:] if after_round else races.index[with_results][:1]
+        if len(entry_race_ids) == 0:
+            # No race of the season has results yet, the entry list is
+            # taken from the last race before it
+            entry_race_ids = form_race_ids[-1:]
+        entry_drivers = DatasetIndex.get_race_results(entry_race_ids)[
+            ResultsColumns.DRIVER_ID
+        ].to_numpy(dtype=np.int64, na_value=-1)
+        model_driver_ids = np.union1d(driver_ids[points > 0], entry_drivers)
+        if len(model_driver_ids) == 0:
+            raise SeasonNotFoundException(season_year)
+
+        model = SeasonModel(
+            model_driver_ids,
+            pd.Series(points, index=driver_ids).reindex(model_driver_ids, fill_value=0.0).to_numpy(),
+            pd.Series(wins, index=driver_ids).reindex(model_driver_ids, fill_value=0).to_numpy(),
+            self._get_position_cdf(model_driver_ids, form_results),
+            int((rounds > after_round).sum()),
+            self._points_table,
+        )
+        LOGGER.debug(
+            "Simulating %s races of %s drivers after round %s of %s",
+            model.rounds,
+            len(model_driver_ids),
+            after_round,
+            season_year,
+        )
+        return model
+
+    def _get_form_race_ids(self, season_year: int, played: pd.Index) -> list[int]:
+        """
+        Ids of the last races before the simulated ones, from earlier
+        seasons too when the season has not had enough of them
+        """
+        race_ids = list(played[-self._form_races:])
+        first_year = Races().get_data()[RacesColumns.YEAR].min()
+        year = season_year - 1
+        while len(race_ids) < self._form_races and year >= first_year:
+            previous = list(DatasetIndex.get_race_ids(year))
+            race_ids = previous[max(len(previous) - (self._form_races - len(race_ids)), 0):] + race_ids
+            year -= 1
+        return race_ids
+
+    def _get_standings(
+        self,
+        season_year: int,
+        after_round: int,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Driver ids, points and wins of the drivers standings after the
+        round, empty before the first round
+        """
+        if after_round == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0), np.empty(0, dtype=np.int64)
+        standings = self._standings_index.get_standings(season_year, after_round)
+        return (
+            standings[DriversStandingsIndex.ID_COLUMN].to_numpy(dtype=np.int64, na_value=-1),
+            standings[StandingsIndexColumns.POINTS].to_numpy(dtype=np.float64, na_value=0.0),
+            standings[StandingsIndexColumns.WINS].to_numpy(dtype=np.int64, na_value=0),
+        )
+
+    @staticmethod
+    def _get_position_cdf(driver_ids: np.ndarray, results: pd.DataFrame) -> np.ndarray:
+        """
+        Cumulative distribution of the finishing positions of every driver
+        in the results, positions after the number of drivers count as last
+        """
+        drivers = len(driver_ids)
+        result_driver_ids = results[ResultsColumns.DRIVER_ID].to_numpy(dtype=np.int64, na_value=-1)
+        positions = results[ResultsColumns.POSITION_ORDER].to_numpy(
+            dtype=np.int64, na_value=drivers
+        )
+        driver_index = np.searchsorted(driver_ids, result_driver_ids)
+        known = driver_index < drivers
+        known[known] = driver_ids[driver_index[known]] == result_driver_ids[known]
+
+        counts = np.bincount(
+            driver_index[known] * drivers + np.clip(positions[known], 1, drivers) - 1,
+            minlength=drivers * drivers,
+        ).reshape(drivers, drivers) + cfg.SIMULATION_FORM_PRIOR
+        cdf = np.cumsum(counts, axis=1) / counts.sum(axis=1, keepdims=True)
+        cdf[:, -1] = 1.0
+        return cdf
+
+    @profile_stage()
+    def _run(
+        self,
+        model: SeasonModel,
+        simulations: int,
+        seed: int | None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        batch_size = max(
+            cfg.SIMULATION_BATCH_ELEMENTS // max(model.rounds * len(model.driver_ids), 1), 1
+        )
+        sizes = [batch_size] * (simulations // batch_size)
+        if simulations % batch_size:
+            sizes.append(simulations % batch_size)
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        LOGGER.debug("Simulating %s seasons in %s batches...", simulations, len(sizes))
+
+        results = BatchExecutor(self._max_workers, tables=[]).run(
+            AnalyticRequest(SeasonSampler, "run", model, size, batch_seed)
+            for size, batch_seed in zip(sizes, seeds)
+        )
+        totals = [result.get() for result in results]
+        return tuple(np.sum(values, axis=0) for values in zip(*totals))
+
+    @profile_stage()
+    def _summarize(
+        self,
+        model: SeasonModel,
+        simulations: int,
+        seed: int | None,
+        titles: np.ndarray,
+        points_sum: np.ndarray,
+        squares_sum: np.ndarray,
+        histogram: np.ndarray,
+    ) -> SimulationResult:
+        mean = points_sum / simulations
+        std = np.sqrt(np.maximum(squares_sum / simulations - mean**2, 0.0))
+        first_bin, bins = model.get_point_bins()
+        cumulative = np.cumsum(histogram, axis=1)
+        quantiles = {
+            # Half point bins round the points already banked down
+            column: np.maximum(
+                (np.argmax(cumulative >= q * simulations, axis=1) + first_bin) / 2,
+                model.points,
+            )
+            for column, q in (
+                (SimulationColumns.P05_POINTS, 0.05),
+                (SimulationColumns.P50_POINTS, 0.5),
+                (SimulationColumns.P95_POINTS, 0.95),
+            )
+        }
+
+        fullnames = Drivers().get_driver_fullnames().reindex(model.driver_ids).array
+        summary = pd.DataFrame(
+            {
+                SimulationColumns.DRIVER_ID: model.driver_ids,
+                SimulationColumns.FULLNAME: fullnames,
+                SimulationColumns.POINTS: model.points,
+                SimulationColumns.WINS: model.wins,
+                SimulationColumns.TITLE_PROBABILITY: titles / simulations,
+                SimulationColumns.MEAN_POINTS: mean,
+                SimulationColumns.STD_POINTS: std,
+                **quantiles,
+            }
+        )
+        summary = summary.sort_values(
+            [SimulationColumns.TITLE_PROBABILITY, SimulationColumns.MEAN_POINTS],
+            ascending=False,
+            kind="stable",
+        ).reset_index(drop=True)
+        LOGGER.debug("Simulated championship: \n %s", FrameSummary(summary))
+
+        reached = np.flatnonzero(histogram.any(axis=0))
+        points_distribution = pd.DataFrame(
+            histogram[:, reached].T / simulations,
+            index=pd.Index((reached + first_bin) / 2, name=SimulationColumns.POINTS),
+            columns=pd.Index(fullnames, name=SimulationColumns.FULLNAME),
+        )
+        return SimulationResult(summary, points_distribution, simulations, seed)
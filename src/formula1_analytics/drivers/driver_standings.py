@@ -0,0 +1,56 @@
+import pandas as pd
+from formula1_analytics.config.config import DRIVERS_STANDINGS_FILENAME
+from formula1_analytics.common.f1_data import F1Data
+
+
+class DriverStandingsColumns:
+    DRIVER_STANDINGS_ID = "driverStandingsId"
+    RACE_ID = "raceId"
+    DRIVER_ID = "driverId"
+    POINTS = "points"
+    POSITION = "position"
+    POSITION_TEXT = "positionText"
+    WINS = "wins"
+
+    @staticmethod
+    def get_types() -> dict[str, str]:
+        return {
+            DriverStandingsColumns.RACE_ID: "Int64",
+            DriverStandingsColumns.DRIVER_ID: "Int64",
+            DriverStandingsColumns.POINTS: "Float64",
+            DriverStandingsColumns.POSITION: "Int64",
+            DriverStandingsColumns.POSITION_TEXT: "string",
+            DriverStandingsColumns.WINS: "Int64",
+        }
+
+    @staticmethod
+    def get_category_columns() -> list[str]:
+        return [DriverStandingsColumns.POSITION_TEXT]
+
+
+class DriverStandings(F1Data):
+    def __init__(self) -> None:
+        super().__init__(
+            DRIVERS_STANDINGS_FILENAME,
+            DriverStandingsColumns.DRIVER_STANDINGS_ID,
+            DriverStandingsColumns.get_types(),
+            DriverStandingsColumns.get_category_columns(),
+        )
+
+    def get_race_ids(self) -> pd.Series:
+        return self._data[DriverStandingsColumns.RACE_ID]
+
+    def get_driver_ids(self) -> pd.Series:
+        return self._data[DriverStandingsColumns.DRIVER_ID]
+
+    def get_points(self) -> pd.Series:
+        return self._data[DriverStandingsColumns.POINTS]
+
+    def get_positions(self) -> pd.Series:
+        return self._data[DriverStandingsColumns.POSITION]
+
+    def get_positions_texts(self) -> pd.Series:
+        return self._data[DriverStandingsColumns.POSITION_TEXT]
+
+    def get_wins(self) -> pd.Series:
+        return self._data[DriverStandingsColumns.WINS]
@@ -1,15 +1,18 @@
 import pandas as pd
 import numpy as np
 from formula1_analytics.logger import get_logger
+from formula1_analytics.common.profiling import profile_stage
 from formula1_analytics.drivers.drivers import Drivers, DriversColumns
-from formula1_analytics.races.races import Races, RacesColumns
-from formula1_analytics.results.results import Results, ResultsColumns
-from formula1_analytics.weather.weather import Weather, WeatherColumns
-from formula1_analytics.drivers.exceptions import (
-    SeasonNotFoundException,
-    DriverNotFoundException,
+from formula1_analytics.races.races import RacesColumns
+from formula1_analytics.results.results import ResultsColumns
+from formula1_analytics.weather.weather import WeatherColumns
+from formula1_analytics.weather.weather_summary import WeatherSummaryColumns
+from formula1_analytics.common.dataset_index import DatasetIndex
+from formula1_analytics.common.exceptions import (
     InvalidSeasonException,
+    SeasonNotFoundException,
 )
+from formula1_analytics.drivers.exceptions import DriverNotFoundException
 
 LOGGER = get_logger(__name__)
 
@@ -21,6 +24,45 @@ class WeatherType:
     HUMIDITY = "humidity"
     PRESSURE = "pressure"
     WIND_SPEED = "wind_speed"
+    UNKNOWN = "Unknown"
+
+    # Inner bin edges and labels of each weather type, a value falls into
+    # labels[i] when edges[i - 1] <= value < edges[i]
+    _bins = {
+        RAINFALL: ([0.5], ["Dry", "Rainy"]),
+        TRACK_TEMP: (
+            [20, 30],
+            ["Cold Track (<20°C)", "Medium Track (20-30°C)", "Hot Track (>30°C)"],
+        ),
+        AIR_TEMP: (
+            [20, 25],
+            ["Cold Air (<20°C)", "Medium Air (20-25°C)", "Hot Air (>25°C)"],
+        ),
+        HUMIDITY: (
+            [40, 70],
+            [
+                "Low Humidity (<40%)",
+                "Medium Humidity (40-70%)",
+                "High Humidity (>70%)",
+            ],
+        ),
+        PRESSURE: (
+            [990, 1020],
+            [
+                "Low Pressure (<990 hPa)",
+                "Medium Pressure (990-1020 hPa)",
+                "High Pressure (>1020 hPa)",
+            ],
+        ),
+        WIND_SPEED: (
+            [10, 20],
+            [
+                "Light Wind (<10 km/h)",
+                "Medium Wind (10-20 km/h)",
+                "Strong Wind (>20 km/h)",
+            ],
+        ),
+    }
     
     @staticmethod
     def get_all_types():
@@ -44,54 +86,70 @@ class WeatherType:
             WeatherType.PRESSURE: WeatherColumns.PRESSURE,
             WeatherType.WIND_SPEED: WeatherColumns.WIND_SPEED,
         }
+
+    @staticmethod
+    def get_summary_column_map():
+        """Maps weather type to the per race column in the weather summary"""
+        return {
+            WeatherType.RAINFALL: WeatherSummaryColumns.ANY_RAIN,
+            **{
+                weather_type: WeatherSummaryColumns.get_stat_column(
+                    column, WeatherSummaryColumns.MEAN
+                )
+                for weather_type, column in WeatherType.get_column_map().items()
+                if weather_type != WeatherType.RAINFALL
+            },
+        }
     
+    @staticmethod
+    def get_bins() -> dict[str, tuple[list[float], list[str]]]:
+        """Bin edges and labels used to categorize each weather type"""
+        return dict(WeatherType._bins)
+
+    @staticmethod
+    def register_bins(
+        weather_type: str,
+        edges: list[float],
+        labels: list[str],
+    ) -> None:
+        """
+        Replace the bins of a weather type. Edges are the increasing inner
+        boundaries, there must be exactly one label more than edges.
+        """
+        if weather_type not in WeatherType.get_all_types():
+            raise ValueError(f"Weather type must be one of: {', '.join(WeatherType.get_all_types())}")
+        if len(labels) != len(edges) + 1:
+            raise ValueError("There must be exactly one label more than bin edges")
+        if np.any(np.diff(edges) <= 0):
+            raise ValueError("Bin edges must be strictly increasing")
+        if len(set(labels)) != len(labels) or WeatherType.UNKNOWN in labels:
+            raise ValueError(f"Labels must be unique and different from '{WeatherType.UNKNOWN}'")
+        WeatherType._bins[weather_type] = (list(edges), list(labels))
+
+    @staticmethod
+    def categorize(weather_type: str, values: pd.Series) -> pd.Series:
+        """
+        Categorize weather values into interpretable ranges, missing values
+        fall into the "Unknown" category
+        """
+        edges, labels = WeatherType._bins[weather_type]
+        numeric = values.astype("Float64")
+        codes = np.digitize(numeric.to_numpy(dtype=float, na_value=np.nan), edges)
+        codes[numeric.isna().to_numpy()] = len(labels)
+
+        categories = pd.Categorical.from_codes(
+            codes,
+            categories=[*labels, WeatherType.UNKNOWN],
+            ordered=True,
+        )
+        return pd.Series(categories, index=values.index, name=values.name)
+
     @staticmethod
     def categorize_value(weather_type, value):
-        """Categorize weather values into interpretable ranges"""
-        if weather_type == WeatherType.RAINFALL:
-            return "Rainy" if value else "Dry"
-        
-        elif weather_type == WeatherType.TRACK_TEMP:
-            if value < 20:
-                return "Cold Track (<20°C)"
-            elif value < 30:
-                return "Medium Track (20-30°C)"
-            else:
-                return "Hot Track (>30°C)"
-                
-        elif weather_type == WeatherType.AIR_TEMP:
-            if value < 20:
-                return "Cold Air (<20°C)"
-            elif value < 25:
-                return "Medium Air (20-25°C)"
-            else:
-                return "Hot Air (>25°C)"
-                
-        elif weather_type == WeatherType.HUMIDITY:
-            if value < 40:
-                return "Low Humidity (<40%)"
-            elif value < 70:
-                return "Medium Humidity (40-70%)"
-            else:
-                return "High Humidity (>70%)"
-                
-        elif weather_type == WeatherType.PRESSURE:
-            if value < 990:
-                return "Low Pressure (<990 hPa)"
-            elif value < 1020:
-                return "Medium Pressure (990-1020 hPa)"
-            else:
-                return "High Pressure (>1020 hPa)"
-                
-        elif weather_type == WeatherType.WIND_SPEED:
-            if value < 10:
-                return "Light Wind (<10 km/h)"
-            elif value < 20:
-                return "Medium Wind (10-20 km/h)"
-            else:
-                return "Strong Wind (>20 km/h)"
-        
-        return "Unknown"
+        """Categorize a single weather value into an interpretable range"""
+        if weather_type not in WeatherType._bins:
+            return WeatherType.UNKNOWN
+        return WeatherType.categorize(weather_type, pd.Series([value])).iloc[0]
 
 
 class DriverWeatherPerf:
@@ -100,9 +158,6 @@ class DriverWeatherPerf:
     def __init__(self) -> None:
         LOGGER.debug("Initializing DriverWeatherPerf class")
         self._drivers = Drivers()
-        self._results = Results()
-        self._races = Races()
-        self._weather = Weather()
         
     def get_data(
         self,
@@ -114,6 +169,8 @@ class DriverWeatherPerf:
         Description
         -----------
         Get the performance of drivers based on weather conditions in a given season.
+        Each race result is counted once, in the category of the race's average
+        conditions (any rain during the race for rainfall).
 
         Parameters
         ----------
@@ -131,56 +188,122 @@ class DriverWeatherPerf:
             A DataFrame containing the performance metrics of drivers under different 
             weather conditions in the specified season.
         """
-        LOGGER.debug(f"Getting driver weather performance for {season_year}, {driver_names}, {weather_type}")
-        
+        LOGGER.debug("Getting driver weather performance for %s, %s, %s", season_year, driver_names, weather_type)
+
+        performance_data = self.get_data_for_types(
+            season_year, driver_names, [weather_type]
+        )
+        if performance_data.empty:
+            return performance_data
+
+        performance_data = performance_data.drop(columns=["weather_type"])
+        performance_data["weather_category"] = performance_data[
+            "weather_category"
+        ].cat.set_categories(
+            [*WeatherType.get_bins()[weather_type][1], WeatherType.UNKNOWN]
+        )
+        return performance_data.reset_index(drop=True)
+
+    def get_data_for_types(
+        self,
+        season_year: int,
+        driver_names: list[str] = None,
+        weather_types: list[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Description
+        -----------
+        Get the performance of drivers under several weather conditions at once.
+        The season's results are joined with the weather summary a single time
+        and the metrics of every weather type are computed in one grouping.
+
+        Parameters
+        ----------
+        season_year : int
+            The season to get the performance for (2018-2023).
+        driver_names : list[str], optional
+            A list of driver names to filter the results by, by default None.
+        weather_types : list[str], optional
+            The weather conditions to analyze, by default all of them.
+
+        Returns
+        -------
+        pd.DataFrame
+            A long-format DataFrame with the same metrics as get_data and an
+            additional weather_type column.
+        """
+        LOGGER.debug("Getting driver weather performance for %s, %s, %s", season_year, driver_names, weather_types)
+
+        weather_types = weather_types or WeatherType.get_all_types()
+        for weather_type in weather_types:
+            if weather_type not in WeatherType.get_all_types():
+                raise ValueError(f"Weather type must be one of: {', '.join(WeatherType.get_all_types())}")
+
+        merged_data = self._get_season_race_weather(season_year, driver_names, weather_types)
+        if merged_data.empty:
+            return pd.DataFrame()
+
+        categorized_data = self._categorize_weather(merged_data, weather_types)
+        return self._calculate_performance_metrics(
+            categorized_data, ["weather_type", "fullname", "weather_category"]
+        )
+
+    @profile_stage()
+    def _get_season_race_weather(
+        self,
+        season_year: int,
+        driver_names: list[str] | None,
+        weather_types: list[str],
+    ) -> pd.DataFrame:
+        """Join the season's results with drivers and per race weather"""
         if not isinstance(season_year, int):
             raise TypeError("Season year must be an integer")
         if season_year < 1996 or season_year > 2023:
             raise InvalidSeasonException(season_year, range(1996, 2024))
-        if weather_type not in WeatherType.get_all_types():
-            raise ValueError(f"Weather type must be one of: {', '.join(WeatherType.get_all_types())}")
-        
+
         self._check_season(season_year)
         
         driver_df = self._drivers.get_driver_fullnames()
         if driver_names:
             if not isinstance(driver_names, list):
                 raise TypeError("Driver names must be a list")
-            self._validate_drivers(driver_names, driver_df)
+            self._validate_drivers(driver_names)
         
-        results_df = self._results.get_selected_columns(
+        results_df = DatasetIndex.get_season_results(season_year)[[
             ResultsColumns.RACE_ID,
             ResultsColumns.DRIVER_ID,
             ResultsColumns.POSITION,
             ResultsColumns.POINTS
-        )
+        ]]
         
-        races_df = self._races.get_selected_columns(
+        races_df = DatasetIndex.get_season_races(season_year)[[
             RacesColumns.YEAR,
             RacesColumns.ROUND
-        )
-        races_df = races_df[races_df[RacesColumns.YEAR] == season_year].reset_index()
+        ]].reset_index()
         
         if races_df.empty:
             raise SeasonNotFoundException(season_year)
         
-        weather_df = self._weather.get_selected_columns(
-            WeatherColumns.ROUND,
-            WeatherColumns.YEAR,
-            WeatherType.get_column_map()[weather_type]
-        )
-        weather_df = weather_df[weather_df[WeatherColumns.YEAR] == season_year]
+        weather_cols = [
+            WeatherType.get_summary_column_map()[weather_type]
+            for weather_type in weather_types
+        ]
+        weather_df = DatasetIndex.get_season_weather_summary(season_year)[[
+            WeatherSummaryColumns.ROUND,
+            WeatherSummaryColumns.YEAR,
+            *weather_cols,
+        ]]
         
         if weather_df.empty:
-            LOGGER.warning(f"No weather data found for season {season_year}")
+            LOGGER.warning("No weather data found for season %s", season_year)
             return pd.DataFrame()
         
         race_weather = pd.merge(
             races_df,
             weather_df,
             left_on=[RacesColumns.ROUND, RacesColumns.YEAR],
-            right_on=[WeatherColumns.ROUND, WeatherColumns.YEAR]
-        ).drop(columns=[WeatherColumns.ROUND, WeatherColumns.YEAR])
+            right_on=[WeatherSummaryColumns.ROUND, WeatherSummaryColumns.YEAR]
+        ).drop(columns=[WeatherSummaryColumns.ROUND, WeatherSummaryColumns.YEAR])
         
         merged_data = pd.merge(
             results_df,
@@ -198,49 +321,88 @@ class DriverWeatherPerf:
         
         if driver_names:
             merged_data = merged_data[merged_data[DriversColumns.FULLNAME].isin(driver_names)]
-        
-        weather_col = WeatherType.get_column_map()[weather_type]
-        merged_data['weather_category'] = merged_data[weather_col].apply(
-            lambda x: WeatherType.categorize_value(weather_type, x)
+
+        return merged_data
+
+    @profile_stage()
+    def _categorize_weather(
+        self,
+        data: pd.DataFrame,
+        weather_types: list[str],
+    ) -> pd.DataFrame:
+        """Stack the categorized results of every weather type"""
+        bins = WeatherType.get_bins()
+        category_dtype = pd.CategoricalDtype(
+            [
+                *dict.fromkeys(
+                    label
+                    for weather_type in weather_types
+                    for label in bins[weather_type][1]
+                ),
+                WeatherType.UNKNOWN,
+            ],
+            ordered=True,
         )
-        
-        performance_data = self._calculate_performance_metrics(merged_data)
-        
-        return performance_data
+        base_columns = [
+            DriversColumns.FULLNAME,
+            ResultsColumns.RACE_ID,
+            ResultsColumns.POSITION,
+            ResultsColumns.POINTS,
+        ]
+
+        categorized = []
+        for weather_type in weather_types:
+            weather_col = WeatherType.get_summary_column_map()[weather_type]
+            type_data = data[base_columns].assign(
+                weather_type=weather_type,
+                weather_category=WeatherType.categorize(
+                    weather_type, data[weather_col]
+                ).astype(category_dtype),
+            )
+            categorized.append(type_data)
+
+        return pd.concat(categorized, ignore_index=True)
     
     def _check_season(self, season_year: int) -> None:
         """Prepare and validate the base data"""
-        LOGGER.debug(f"Preparing data for season {season_year}")
-        
-        season_races = self._races.get_data()
-        season_races = season_races[season_races[RacesColumns.YEAR] == season_year]
+        LOGGER.debug("Preparing data for season %s", season_year)
         
-        if season_races.empty:
+        if DatasetIndex.get_race_ids(season_year).empty:
             raise SeasonNotFoundException(season_year)
     
-    def _validate_drivers(self, driver_names: list[str], driver_df: pd.DataFrame) -> None:
+    def _validate_drivers(self, driver_names: list[str]) -> None:
         """Validate that all requested drivers exist"""
         for driver in driver_names:
-            if driver not in driver_df.values:
+            if not DatasetIndex.has_driver(driver):
                 raise DriverNotFoundException(driver)
     
-    def _calculate_performance_metrics(self, data: pd.DataFrame) -> pd.DataFrame:
+    @profile_stage()
+    def _calculate_performance_metrics(
+        self,
+        data: pd.DataFrame,
+        group_columns: list[str],
+    ) -> pd.DataFrame:
         """Calculate various performance metrics for each driver by weather category"""
-        grouped = data.groupby(['fullname', 'weather_category'])
+        position = data['position']
+        data = data.assign(
+            is_win=(position == 1).fillna(False).astype(int),
+            is_podium=(position <= 3).fillna(False).astype(int),
+        )
+        grouped = data.groupby(group_columns, observed=True)
 
         metrics = grouped.agg(
-            avg_position=pd.NamedAgg(column='position', aggfunc=lambda x: x.astype(float).mean()),
+            avg_position=pd.NamedAgg(column='position', aggfunc='mean'),
             avg_points=pd.NamedAgg(column='points', aggfunc='mean'),
             total_points=pd.NamedAgg(column='points', aggfunc='sum'),
             race_count=pd.NamedAgg(column='raceId', aggfunc='count'),
-            win_count=pd.NamedAgg(column='position', aggfunc=lambda x: (x == 1).sum()),
-            podium_count=pd.NamedAgg(column='position', aggfunc=lambda x: (x <= 3).sum())
+            win_count=pd.NamedAgg(column='is_win', aggfunc='sum'),
+            podium_count=pd.NamedAgg(column='is_podium', aggfunc='sum')
         ).reset_index()
         
         metrics['win_rate'] = (metrics['win_count'] / metrics['race_count'] * 100).round(2)
         metrics['podium_rate'] = (metrics['podium_count'] / metrics['race_count'] * 100).round(2)
         
-        metrics = metrics.sort_values(['fullname', 'weather_category'])
+        metrics = metrics.sort_values(group_columns, ignore_index=True)
         
         return metrics
 
@@ -277,26 +439,31 @@ class DriverWeatherPerf:
         
         Returns a dictionary with the best condition for each metric.
         """
+        LOGGER.debug("Analyzing all weather types for %s", driver_name)
+        performance_data = self.get_data_for_types(season_year, [driver_name])
+        if performance_data.empty:
+            return {}
+
         best_conditions = {}
-        
         for weather_type in WeatherType.get_all_types():
-            LOGGER.debug(f"Analyzing {weather_type} for {driver_name}")
-            try:
-                data = self.get_data(season_year, [driver_name], weather_type)
-                
-                if not data.empty:
-                    best_pos_idx = data['avg_position'].idxmin()
-                    best_conditions[f'best_{weather_type}_position'] = {
-                        'condition': data.loc[best_pos_idx, 'weather_category'],
-                        'value': round(data.loc[best_pos_idx, 'avg_position'], 2)
-                    }
-                    
-                    best_points_idx = data['avg_points'].idxmax()
-                    best_conditions[f'best_{weather_type}_points'] = {
-                        'condition': data.loc[best_points_idx, 'weather_category'],
-                        'value': round(data.loc[best_points_idx, 'avg_points'], 2)
-                    }
-            except Exception as e:
-                LOGGER.warning(f"Error analyzing {weather_type}: {e}")
+            data = performance_data[performance_data['weather_type'] == weather_type]
+            if data.empty:
+                continue
+
+            # Drivers without a classified finish have no average position,
+            # idxmin would return NaN, so those metrics are skipped
+            best_pos_idx = data['avg_position'].idxmin()
+            if not pd.isna(best_pos_idx):
+                best_conditions[f'best_{weather_type}_position'] = {
+                    'condition': data.loc[best_pos_idx, 'weather_category'],
+                    'value': round(data.loc[best_pos_idx, 'avg_position'], 2)
+                }
+
+            best_points_idx = data['avg_points'].idxmax()
+            if not pd.isna(best_points_idx):
+                best_conditions[f'best_{weather_type}_points'] = {
+                    'condition': data.loc[best_points_idx, 'weather_category'],
+                    'value': round(data.loc[best_points_idx, 'avg_points'], 2)
+                }
         
-        return best_conditions
\ No newline at end of file
+        return best_conditions
@@ -1,7 +1,8 @@
 import pandas as pd
+import formula1_analytics.config.config as cfg
 from formula1_analytics.config.config import DRIVERS_FILENAME
 from formula1_analytics.common.f1_data import F1Data
-from formula1_analytics.common.data_processor import DataProcessor
+from formula1_analytics.common.data_registry import DataRegistry
 
 
 class DriversColumns:
@@ -28,11 +29,19 @@ class DriversColumns:
             DriversColumns.URL: "string",
         }
 
+    @staticmethod
+    def get_category_columns() -> list[str]:
+        return [DriversColumns.NATIONALITY]
+
 
 class Drivers(F1Data):
     def __init__(self) -> None:
-        super().__init__(DRIVERS_FILENAME, DriversColumns.DRIVER_ID)
-        DataProcessor().convert_types(self._data, DriversColumns.get_types())
+        super().__init__(
+            DRIVERS_FILENAME,
+            DriversColumns.DRIVER_ID,
+            DriversColumns.get_types(),
+            DriversColumns.get_category_columns(),
+        )
 
     def get_refs(self) -> pd.Series:
         return self._data[DriversColumns.DRIVER_REF]
@@ -59,10 +68,25 @@ class Drivers(F1Data):
         return self._data[DriversColumns.URL]
 
     def get_driver_fullnames(self) -> pd.Series:
+        """
+        Get the full names of drivers, they are computed once per process
+        (and stored as a category with config.MEMORY_OPTIMIZED)
+        """
+        return DataRegistry.get_derived(
+            "drivers_fullnames",
+            Drivers._build_driver_fullnames,
+            DRIVERS_FILENAME,
+        )
+
+    @staticmethod
+    def _build_driver_fullnames() -> pd.Series:
+        data = Drivers().get_data()
         driver_fullnames = (
-            self._data[DriversColumns.FORENAME]
+            data[DriversColumns.FORENAME]
             + " "
-            + self._data[DriversColumns.SURNAME]
+            + data[DriversColumns.SURNAME]
         )
         driver_fullnames.name = DriversColumns.FULLNAME
+        if cfg.MEMORY_OPTIMIZED:
+            driver_fullnames = driver_fullnames.astype("category")
         return driver_fullnames
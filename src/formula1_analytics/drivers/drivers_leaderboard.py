@@ -0,0 +1,24 @@
+import pandas as pd
+from formula1_analytics.common.leaderboard import Leaderboard, LeaderboardColumns
+from formula1_analytics.drivers.drivers import Drivers, DriversColumns
+from formula1_analytics.results.results import ResultsColumns
+
+
+class DriversLeaderboardColumns(LeaderboardColumns):
+    DRIVER_ID = ResultsColumns.DRIVER_ID
+    FULLNAME = DriversColumns.FULLNAME
+
+
+class DriversLeaderboard(Leaderboard):
+    """
+    Career statistics of all drivers, indexed by driverId with their
+    fullname, see Leaderboard.
+    """
+
+    ID_COLUMN = DriversLeaderboardColumns.DRIVER_ID
+    NAME_COLUMN = DriversLeaderboardColumns.FULLNAME
+    _derived_name = "drivers_leaderboard"
+
+    @classmethod
+    def _get_names(cls) -> pd.Series:
+        return Drivers().get_driver_fullnames()
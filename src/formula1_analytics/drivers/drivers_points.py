@@ -0,0 +1,27 @@
+import pandas as pd
+from formula1_analytics.common.dataset_index import DatasetIndex
+from formula1_analytics.common.entity_aggregation import EntityAggregation
+from formula1_analytics.results.results import Results, ResultsColumns
+
+
+class DriversPoints:
+    """
+    Points the drivers scored in each race, the source of the drivers
+    season progression and standings checks
+    """
+
+    @staticmethod
+    def get_rows(season_years: list[int] | None) -> pd.DataFrame:
+        """
+        Get the race id, driver id and points of the race results of the
+        seasons, or of all seasons
+        """
+        columns = [
+            ResultsColumns.RACE_ID,
+            ResultsColumns.DRIVER_ID,
+            ResultsColumns.POINTS,
+        ]
+        if season_years is None:
+            return Results().get_selected_columns(*columns)
+        race_ids = EntityAggregation.get_season_race_ids(season_years)
+        return DatasetIndex.get_race_results(race_ids)[columns]
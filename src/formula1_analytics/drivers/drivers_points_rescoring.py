@@ -0,0 +1,20 @@
+import pandas as pd
+from formula1_analytics.config.config import DRIVERS_FILENAME
+from formula1_analytics.common.points_rescoring import PointsRescoring
+from formula1_analytics.drivers.drivers import Drivers, DriversColumns
+from formula1_analytics.results.results import ResultsColumns
+
+
+class DriversPointsRescoring(PointsRescoring):
+    """
+    Season progressions and final standings of the drivers under any
+    points system, with their fullname, see PointsRescoring.
+    """
+
+    ID_COLUMN = ResultsColumns.DRIVER_ID
+    NAME_COLUMN = DriversColumns.FULLNAME
+    _names_sources = (DRIVERS_FILENAME,)
+
+    @classmethod
+    def _get_names(cls) -> pd.Series:
+        return Drivers().get_driver_fullnames()
@@ -0,0 +1,31 @@
+import pandas as pd
+from formula1_analytics.config.config import DRIVERS_STANDINGS_FILENAME, RACES_FILENAME
+from formula1_analytics.common.standings_index import StandingsIndex
+from formula1_analytics.drivers.drivers import Drivers, DriversColumns
+from formula1_analytics.drivers.drivers_points import DriversPoints
+from formula1_analytics.drivers.driver_standings import (
+    DriverStandings,
+    DriverStandingsColumns,
+)
+
+
+class DriversStandingsIndex(StandingsIndex):
+    """
+    Drivers championship standings after every round, from the driver
+    standings table and validated against the race results, see
+    StandingsIndex.
+    """
+
+    ID_COLUMN = DriverStandingsColumns.DRIVER_ID
+    NAME_COLUMN = DriversColumns.FULLNAME
+    _derived_name = "drivers_standings_snapshots"
+    _table = DriverStandings
+    _sources = (DRIVERS_STANDINGS_FILENAME, RACES_FILENAME)
+
+    @classmethod
+    def _get_points(cls, season_years: list[int] | None) -> pd.DataFrame:
+        return DriversPoints.get_rows(season_years)
+
+    @classmethod
+    def _get_names(cls) -> pd.Series:
+        return Drivers().get_driver_fullnames()
@@ -1,19 +1,24 @@
+# The season and race exceptions are shared by every analytics package, they
+# are defined in common.exceptions and kept importable from here
+from formula1_analytics.common.exceptions import (
+    InvalidSeasonException,
+    RaceNotFoundException,
+    SeasonNotFoundException,
+)
+
+__all__ = [
+    "DriverNotFoundException",
+    "InvalidSeasonException",
+    "RaceNotFoundException",
+    "SeasonNotFoundException",
+]
+
+
 class DriverNotFoundException(Exception):
     def __init__(self, driver_name: str) -> None:
         self.driver_id = driver_name
         self.message = f"Driver '{driver_name}' not found in this season"
         super().__init__(self.message)
 
-
-class SeasonNotFoundException(Exception):
-    def __init__(self, season_year: int) -> None:
-        self.season_year = season_year
-        self.message = f"Season {season_year} not found"
-        super().__init__(self.message)
-
-
-class InvalidSeasonException(Exception):
-    def __init__(self, season_year: int, range: list[int]) -> None:
-        self.season_year = season_year
-        self.message = f"Season {season_year} is invalid, must be between {range[0]} and {range[-1]}"
-        super().__init__(self.message)
+    def __reduce__(self):
+        return DriverNotFoundException, (self.driver_id,)
@@ -0,0 +1,322 @@
+import threading
+from io import BytesIO
+import matplotlib
+import numpy as np
+from matplotlib.figure import Figure
+import formula1_analytics.config.config as cfg
+from formula1_analytics.logger import FrameSummary, get_logger
+from formula1_analytics.common.batch_executor import AnalyticRequest, BatchExecutor
+from formula1_analytics.common.data_registry import DataRegistry
+from formula1_analytics.common.plot_cache import PlotCache
+from formula1_analytics.drivers.drivers import Drivers
+from formula1_analytics.drivers.drivers_season_perf import DriversSeasonPerf
+from formula1_analytics.drivers.drivers_most_wins import DriversMostWins
+from formula1_analytics.drivers.driver_weather_perf import DriverWeatherPerf, WeatherType
+from formula1_analytics.races.races import Races
+from formula1_analytics.results.results import Results
+from formula1_analytics.weather.weather import Weather
+
+LOGGER = get_logger(__name__)
+
+
+class PlotKind:
+    SEASON_PERFORMANCE = "season_performance"
+    MOST_WINS = "most_wins"
+    WEATHER_PERFORMANCE = "weather_performance"
+
+    # Tables the data of each kind of plot is computed from, by filename
+    _tables = {
+        SEASON_PERFORMANCE: {
+            cfg.RESULTS_FILENAME: Results,
+            cfg.RACES_FILENAME: Races,
+            cfg.DRIVERS_FILENAME: Drivers,
+        },
+        MOST_WINS: {
+            cfg.RESULTS_FILENAME: Results,
+            cfg.RACES_FILENAME: Races,
+            cfg.DRIVERS_FILENAME: Drivers,
+        },
+        WEATHER_PERFORMANCE: {
+            cfg.RESULTS_FILENAME: Results,
+            cfg.RACES_FILENAME: Races,
+            cfg.DRIVERS_FILENAME: Drivers,
+            cfg.WEATHER_FILENAME: Weather,
+        },
+    }
+
+    @staticmethod
+    def get_tables(kind: str) -> list[type]:
+        return list(PlotKind._get_sources(kind).values())
+
+    @staticmethod
+    def get_filenames(kind: str) -> list[str]:
+        return list(PlotKind._get_sources(kind))
+
+    @staticmethod
+    def _get_sources(kind: str) -> dict[str, type]:
+        if kind not in PlotKind._tables:
+            raise ValueError(f"Plot kind must be one of: {', '.join(PlotKind._tables)}")
+        return PlotKind._tables[kind]
+
+
+class PlotRequest:
+    """
+    Description of one chart, size is in inches
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        season_year: int | None = None,
+        driver_names: list[str] | None = None,
+        weather_type: str | None = None,
+        count: int | None = None,
+        size: tuple[float, float] | None = None,
+        dpi: int = 100,
+    ) -> None:
+        PlotKind.get_tables(kind)
+        self.kind = kind
+        self.season_year = season_year
+        self.driver_names = tuple(driver_names) if driver_names else None
+        self.weather_type = weather_type
+        self.count = count
+        self.size = tuple(size) if size else FigureRenderer.get_default_size(kind)
+        self.dpi = dpi
+
+    def get_weather_bins(self) -> tuple | None:
+        """
+        Bins the weather conditions of the chart are categorized with, None
+        for charts without weather conditions
+        """
+        if self.kind != PlotKind.WEATHER_PERFORMANCE:
+            return None
+        bins = WeatherType.get_bins().get(self.weather_type or WeatherType.RAINFALL)
+        if bins is None:
+            return None
+        edges, labels = bins
+        return tuple(edges), tuple(labels)
+
+    def get_key(self) -> tuple:
+        """
+        Cache key of the chart, it includes the weather bins and the version
+        of the source tables, so a chart is rendered again after the bins
+        are registered again or its data is reloaded
+        """
+        return (
+            self.kind,
+            self.season_year,
+            self.driver_names,
+            self.weather_type,
+            self.count,
+            self.size,
+            self.dpi,
+            self.get_weather_bins(),
+            DataRegistry.get_versions(*PlotKind.get_filenames(self.kind)),
+        )
+
+    def __repr__(self) -> str:
+        return f"PlotRequest{self.get_key()[:-1]!r}"
+
+
+class FigureRenderer:
+    """
+    Draws charts with the object-oriented Figure API. It does not touch the
+    pyplot state, so figures can be drawn from several threads or processes.
+    """
+
+    _default_sizes = {
+        PlotKind.SEASON_PERFORMANCE: (25, 20),
+        PlotKind.MOST_WINS: (10, 10),
+        PlotKind.WEATHER_PERFORMANCE: (25, 20),
+    }
+
+    def __init__(self) -> None:
+        self._drivers_season_perf = DriversSeasonPerf()
+        self._drivers_most_wins = DriversMostWins()
+        self._driver_weather_perf = DriverWeatherPerf()
+
+    @staticmethod
+    def get_default_size(kind: str) -> tuple[float, float]:
+        return FigureRenderer._default_sizes[kind]
+
+    def render(self, request: PlotRequest, weather_bins: tuple | None = None) -> bytes:
+        """
+        Render the chart as PNG bytes. weather_bins, as returned by
+        PlotRequest.get_weather_bins, are registered first, a worker process
+        started without the bins of its parent gets them this way.
+        """
+        if weather_bins is not None and weather_bins != request.get_weather_bins():
+            WeatherType.register_bins(request.weather_type or WeatherType.RAINFALL, *weather_bins)
+        figure = Figure(figsize=request.size, dpi=request.dpi)
+        save_options = {}
+        if request.kind == PlotKind.SEASON_PERFORMANCE:
+            self._draw_season_performance(figure, request)
+        elif request.kind == PlotKind.MOST_WINS:
+            self._draw_most_wins(figure, request)
+            save_options["bbox_inches"] = "tight"
+        else:
+            self._draw_weather_performance(figure, request)
+
+        image = BytesIO()
+        figure.savefig(image, format="png", **save_options)
+        return image.getvalue()
+
+    def _draw_season_performance(self, figure: Figure, request: PlotRequest) -> None:
+        data = self._drivers_season_perf.get_data(
+            request.season_year,
+            list(request.driver_names) if request.driver_names else None,
+        )
+        colors = matplotlib.colormaps["Paired"](np.linspace(0, 0.8, len(data.columns)))
+
+        axes = figure.add_subplot()
+        for color, driver in zip(colors, data.columns):
+            axes.plot(data.index, data[driver], lw=7, color=color, label=driver)
+        axes.grid(True)
+        axes.set_title(
+            f"Drivers performance in {request.season_year} season",
+            fontdict={"fontsize": 40},
+        )
+        axes.set_xlabel("Round", fontdict={"fontsize": 20})
+        axes.set_ylabel("Points", fontdict={"fontsize": 20})
+        axes.legend(fontsize=20)
+
+    def _draw_most_wins(self, figure: Figure, request: PlotRequest) -> None:
+        data = self._drivers_most_wins.get_data(request.count)
+        LOGGER.debug("Drivers with most wins: \n %s", FrameSummary(data))
+        wins = data["wins"].to_numpy()
+        colors = matplotlib.colormaps["viridis"](np.linspace(0, 1.1, len(wins)))
+
+        axes = figure.add_subplot()
+        positions = np.arange(len(wins))
+        axes.bar(positions, wins, color=colors)
+        axes.set_xticks(positions, data["fullname"].astype(str), rotation=90)
+        axes.grid(True)
+        axes.set_axisbelow(True)
+        axes.set_xlabel("Driver", fontdict={"fontsize": 20})
+        axes.set_ylabel("Wins", fontdict={"fontsize": 20})
+        axes.tick_params(axis="x", labelsize=15)
+        axes.set_title(
+            f"TOP {request.count} drivers with most wins", fontdict={"fontsize": 20}
+        )
+        for index, value in enumerate(wins):
+            axes.text(
+                index,
+                value + 1,
+                str(value),
+                ha="center",
+                va="bottom",
+                fontdict={"fontsize": 12},
+            )
+
+    def _draw_weather_performance(self, figure: Figure, request: PlotRequest) -> None:
+        driver_name = request.driver_names[0] if request.driver_names else None
+        data = self._driver_weather_perf.get_data(
+            request.season_year,
+            [driver_name] if driver_name else None,
+            request.weather_type,
+        )
+        colors = matplotlib.colormaps["Paired"](np.linspace(0, 0.8, max(len(data), 1)))
+
+        axes = figure.add_subplot()
+        positions = np.arange(len(data))
+        axes.bar(positions, data["avg_position"].to_numpy(dtype=float), color=colors)
+        axes.set_xticks(positions, data["weather_category"].astype(str), fontsize=20)
+        axes.grid(True)
+        axes.set_axisbelow(True)
+        axes.set_title(
+            f"{driver_name} performance in {request.weather_type} in {request.season_year} season",
+            fontdict={"fontsize": 40},
+        )
+        axes.set_xlabel("Conditions", fontdict={"fontsize": 20})
+        axes.set_ylabel("Average position", fontdict={"fontsize": 20})
+
+
+class PlotRenderer:
+    """
+    Cached, parallel chart rendering.
+
+    Rendered PNGs are cached by PlotRequest.get_key, which includes the
+    version of the source tables, so repeated requests are served from the
+    cache until the data is reloaded. render_many renders the cache misses of
+    a batch on a process pool. render can be called from several threads,
+    each of them draws with its own FigureRenderer.
+    """
+
+    _default: "PlotRenderer | None" = None
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        cache: PlotCache | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        self._cache = cache or PlotCache()
+        self._max_workers = max_workers or cfg.PLOT_MAX_WORKERS
+        self._local = threading.local()
+
+    @classmethod
+    def get_default(cls) -> "PlotRenderer":
+        with cls._lock:
+            if cls._default is None:
+                cls._default = PlotRenderer()
+            return cls._default
+
+    def render(self, request: PlotRequest) -> bytes:
+        key = request.get_key()
+        image = self._cache.get(key)
+        if image is None:
+            renderer = getattr(self._local, "renderer", None)
+            if renderer is None:
+                renderer = self._local.renderer = FigureRenderer()
+            image = renderer.render(request)
+            # Rendering loads the source tables, which changes the key of a
+            # chart rendered before they were first used
+            self._cache.put(request.get_key(), image)
+        return image
+
+    def render_many(self, requests: list[PlotRequest]) -> list[bytes]:
+        """
+        Description
+        -----------
+        Render several charts, the ones missing from the cache are rendered
+        concurrently on a process pool.
+
+        Parameters
+        ----------
+        requests : list[PlotRequest]
+            The charts to render.
+
+        Returns
+        -------
+        list[bytes]
+            The PNG bytes of every chart, in request order. The first error
+            of a chart which could not be rendered is raised.
+        """
+        keys = [request.get_key() for request in requests]
+        images = {key: self._cache.get(key) for key in keys}
+        missing = {
+            key: request
+            for key, request in zip(keys, requests)
+            if images[key] is None
+        }
+
+        if missing:
+            tables = list(
+                dict.fromkeys(
+                    table
+                    for request in missing.values()
+                    for table in PlotKind.get_tables(request.kind)
+                )
+            )
+            results = BatchExecutor(self._max_workers, tables).run(
+                AnalyticRequest(FigureRenderer, "render", request, request.get_weather_bins())
+                for request in missing.values()
+            )
+            for (key, request), result in zip(missing.items(), results):
+                images[key] = result.get()
+                self._cache.put(request.get_key(), images[key])
+
+        return [images[key] for key in keys]
+
+    def clear(self) -> None:
+        self._cache.clear()
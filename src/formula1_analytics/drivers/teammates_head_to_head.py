@@ -0,0 +1,424 @@
+from typing import Callable
+import numpy as np
+import pandas as pd
+from formula1_analytics.logger import FrameSummary, get_logger
+from formula1_analytics.common.data_registry import DataRegistry
+from formula1_analytics.common.dataset_index import DatasetIndex
+from formula1_analytics.common.entity_aggregation import (
+    EntityAggregation,
+    EntityAggregationColumns,
+)
+from formula1_analytics.common.lru_cache import LRUCache
+from formula1_analytics.common.profiling import profile_stage
+from formula1_analytics.common.sorted_groups import SortedGroups
+from formula1_analytics.config.config import (
+    HEAD_TO_HEAD_CACHE_SIZE,
+    QUALIFYING_FILENAME,
+    RACES_FILENAME,
+    RESULTS_FILENAME,
+)
+from formula1_analytics.drivers.drivers import Drivers, DriversColumns
+from formula1_analytics.drivers.exceptions import DriverNotFoundException
+from formula1_analytics.qualifying.qualifying import Qualifying, QualifyingColumns
+from formula1_analytics.results.results import Results, ResultsColumns
+
+LOGGER = get_logger(__name__)
+
+
+class TeammatesHeadToHeadColumns:
+    YEAR = "year"
+    DRIVER_ID = ResultsColumns.DRIVER_ID
+    TEAMMATE_ID = "teammateId"
+    FULLNAME = DriversColumns.FULLNAME
+    TEAMMATE_FULLNAME = "teammate_fullname"
+    WIN = "win"
+    DELTA = "delta"
+    RACES = "races"
+    RACE_WINS = "race_wins"
+    RACE_POSITION_DELTA = "race_position_delta"
+    QUALIFYINGS = "qualifyings"
+    QUALIFYING_WINS = "qualifying_wins"
+    QUALIFYING_POSITION_DELTA = "qualifying_position_delta"
+
+    @staticmethod
+    def get_metrics() -> list[str]:
+        return [
+            TeammatesHeadToHeadColumns.RACES,
+            TeammatesHeadToHeadColumns.RACE_WINS,
+            TeammatesHeadToHeadColumns.RACE_POSITION_DELTA,
+            TeammatesHeadToHeadColumns.QUALIFYINGS,
+            TeammatesHeadToHeadColumns.QUALIFYING_WINS,
+            TeammatesHeadToHeadColumns.QUALIFYING_POSITION_DELTA,
+        ]
+
+
+class TeammatesHeadToHead:
+    """
+    Head-to-head records of teammates: how often a driver finished and
+    qualified ahead of each of their teammates, and by how many positions
+    on average.
+
+    Teammates are paired once per dataset by grouping the race results and
+    the qualifying results by race and constructor, every group yields the
+    ordered pairs of its drivers without a join. The pairs of every season
+    are shared through the DataRegistry, a refresh pairs the changed
+    seasons only. The records of a season range are reduced from the pairs
+    with one grouped NumPy aggregation per pair kind and kept in a bounded
+    LRU cache. Only teammates who met have a record, so the records are a
+    sparse driver x teammate matrix.
+    """
+
+    def __init__(self) -> None:
+        LOGGER.debug("Initializing %s class", type(self).__name__)
+        self._ranges = LRUCache(HEAD_TO_HEAD_CACHE_SIZE)
+
+    def get_data(
+        self,
+        start_year: int | None = None,
+        end_year: int | None = None,
+    ) -> pd.DataFrame:
+        """
+        Description
+        -----------
+        Get the head-to-head records of every pair of teammates over all
+        seasons, or over a range of seasons.
+
+        Parameters
+        ----------
+        start_year : int, optional
+            The first season to include, by default the first season in the data.
+        end_year : int, optional
+            The last season to include, by default the last season in the data.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per driver and teammate who were teammates in a race or
+            a qualifying, indexed by driverId and teammateId (every pair is
+            there in both orders):
+
+            - races: int64, races as teammates
+            - race_wins: int64, races the driver finished ahead
+            - race_position_delta: float64, average finishing position of
+              the driver minus the one of the teammate (positionOrder,
+              negative when ahead), NaN without races
+            - qualifyings: int64, qualifyings as teammates
+            - qualifying_wins: int64, qualifyings the driver was ahead
+            - qualifying_position_delta: float64, like race_position_delta
+            - fullname: string
+            - teammate_fullname: string
+        """
+        return self._add_names(self._get_records(start_year, end_year))
+
+    def get_teammates(
+        self,
+        driver_name: str,
+        start_year: int | None = None,
+        end_year: int | None = None,
+    ) -> pd.DataFrame:
+        """
+        Description
+        -----------
+        Get the head-to-head records of a driver against each of their
+        teammates.
+
+        Parameters
+        ----------
+        driver_name : str
+            The fullname of the driver.
+        start_year : int, optional
+            The first season to include, by default the first season in the data.
+        end_year : int, optional
+            The last season to include, by default the last season in the data.
+
+        Returns
+        -------
+        pd.DataFrame
+            The rows of get_data of the driver, indexed by teammateId.
+        """
+        driver_id = DatasetIndex.get_driver_id(driver_name)
+        if driver_id is None:
+            raise DriverNotFoundException(driver_name)
+        records = self._get_records(start_year, end_year)
+        driver_ids = records.index.get_level_values(TeammatesHeadToHeadColumns.DRIVER_ID)
+        start, end = np.searchsorted(driver_ids, [driver_id, driver_id + 1])
+        return self._add_names(records.iloc[start:end]).droplevel(
+            TeammatesHeadToHeadColumns.DRIVER_ID
+        )
+
+    def get_matrix(
+        self,
+        metric: str,
+        start_year: int | None = None,
+        end_year: int | None = None,
+    ) -> pd.DataFrame:
+        """
+        Description
+        -----------
+        Get a metric of the head-to-head records as a driver x teammate
+        matrix.
+
+        Parameters
+        ----------
+        metric : str
+            The metric, one of: races, race_wins, race_position_delta,
+            qualifyings, qualifying_wins, qualifying_position_delta.
+        start_year : int, optional
+            The first season to include, by default the first season in the data.
+        end_year : int, optional
+            The last season to include, by default the last season in the data.
+
+        Returns
+        -------
+        pd.DataFrame
+            Indexed by the fullname of the driver with the fullnames of the
+            teammates as columns, of sparse float64 columns (NaN for drivers
+            who were not teammates).
+        """
+        if metric not in TeammatesHeadToHeadColumns.get_metrics():
+            raise ValueError(
+                f"Metric must be one of: {', '.join(TeammatesHeadToHeadColumns.get_metrics())}"
+            )
+        records = self._get_records(start_year, end_year)
+        dense = records[metric].astype(np.float64).unstack(TeammatesHeadToHeadColumns.TEAMMATE_ID)
+        values = dense.to_numpy()
+        # Building the sparse columns directly is faster than astype on the
+        # whole frame
+        matrix = pd.DataFrame(
+            {column: pd.arrays.SparseArray(values[:, column]) for column in range(values.shape[1])}
+        )
+        names = Drivers().get_driver_fullnames()
+        matrix.index = pd.Index(
+            names.reindex(dense.index).array, name=TeammatesHeadToHeadColumns.FULLNAME
+        )
+        matrix.columns = pd.Index(
+            names.reindex(dense.columns).array, name=TeammatesHeadToHeadColumns.TEAMMATE_FULLNAME
+        )
+        return matrix
+
+    def _get_records(
+        self,
+        start_year: int | None,
+        end_year: int | None,
+    ) -> pd.DataFrame:
+        if start_year is not None and end_year is not None and start_year > end_year:
+            raise ValueError("Start year must not be after end year")
+        sources = (RESULTS_FILENAME, QUALIFYING_FILENAME, RACES_FILENAME)
+        if start_year is None and end_year is None:
+            return DataRegistry.get_derived(
+                "teammates_head_to_head",
+                lambda: self._build_records(None, None),
+                *sources,
+            )
+
+        key = (start_year, end_year, DataRegistry.get_versions(*sources))
+        records = self._ranges.get(key)
+        if records is None:
+            records = self._build_records(start_year, end_year)
+            self._ranges.put(key, records)
+        return records
+
+    @profile_stage()
+    def _build_records(
+        self,
+        start_year: int | None,
+        end_year: int | None,
+    ) -> pd.DataFrame:
+        LOGGER.debug("Building teammate records of seasons %s-%s...", start_year, end_year)
+        races = self._sum_pairs(
+            self._select_seasons(self._get_race_pairs(), start_year, end_year),
+            TeammatesHeadToHeadColumns.RACES,
+            TeammatesHeadToHeadColumns.RACE_WINS,
+            TeammatesHeadToHeadColumns.RACE_POSITION_DELTA,
+        )
+        qualifyings = self._sum_pairs(
+            self._select_seasons(self._get_qualifying_pairs(), start_year, end_year),
+            TeammatesHeadToHeadColumns.QUALIFYINGS,
+            TeammatesHeadToHeadColumns.QUALIFYING_WINS,
+            TeammatesHeadToHeadColumns.QUALIFYING_POSITION_DELTA,
+        )
+        records = pd.concat([races, qualifyings], axis=1).sort_index()
+        # Teammates who only raced or only qualified together
+        for column in (
+            TeammatesHeadToHeadColumns.RACES,
+            TeammatesHeadToHeadColumns.RACE_WINS,
+            TeammatesHeadToHeadColumns.QUALIFYINGS,
+            TeammatesHeadToHeadColumns.QUALIFYING_WINS,
+        ):
+            records[column] = records[column].fillna(0).astype(np.int64)
+        LOGGER.debug("Teammate records: \n %s", FrameSummary(records))
+        return records
+
+    @staticmethod
+    def _sum_pairs(
+        pairs: pd.DataFrame,
+        count_column: str,
+        wins_column: str,
+        delta_column: str,
+    ) -> pd.DataFrame:
+        """
+        Count, wins and average position delta of every driver against
+        every teammate, indexed by driverId and teammateId
+        """
+        groups = SortedGroups(
+            pairs[TeammatesHeadToHeadColumns.DRIVER_ID].to_numpy(),
+            pairs[TeammatesHeadToHeadColumns.TEAMMATE_ID].to_numpy(),
+        )
+        driver_ids, teammate_ids = groups.keys if len(groups) else (np.zeros(0, np.int64),) * 2
+        return pd.DataFrame(
+            {
+                count_column: groups.counts.astype(np.int64),
+                wins_column: groups.sum(pairs[TeammatesHeadToHeadColumns.WIN].to_numpy()).astype(
+                    np.int64
+                ),
+                delta_column: groups.mean(pairs[TeammatesHeadToHeadColumns.DELTA].to_numpy()),
+            },
+            index=pd.MultiIndex.from_arrays(
+                [driver_ids, teammate_ids],
+                names=[TeammatesHeadToHeadColumns.DRIVER_ID, TeammatesHeadToHeadColumns.TEAMMATE_ID],
+            ),
+        )
+
+    @staticmethod
+    def _select_seasons(
+        pairs: pd.DataFrame,
+        start_year: int | None,
+        end_year: int | None,
+    ) -> pd.DataFrame:
+        """
+        Slice the pairs of the seasons out of the pairs sorted by year
+        """
+        years = pairs[TeammatesHeadToHeadColumns.YEAR].to_numpy(dtype=np.int64)
+        start = 0 if start_year is None else np.searchsorted(years, start_year, side="left")
+        end = len(years) if end_year is None else np.searchsorted(years, end_year, side="right")
+        return pairs.iloc[start:end]
+
+    def _get_race_pairs(self) -> pd.DataFrame:
+        return DataRegistry.get_derived(
+            "teammates_race_pairs",
+            self._build_race_pairs,
+            RESULTS_FILENAME,
+            RACES_FILENAME,
+            updater=lambda pairs, since_versions: self._update_pairs(
+                pairs, since_versions, (RESULTS_FILENAME, RACES_FILENAME), self._build_race_pairs
+            ),
+        )
+
+    def _get_qualifying_pairs(self) -> pd.DataFrame:
+        return DataRegistry.get_derived(
+            "teammates_qualifying_pairs",
+            self._build_qualifying_pairs,
+            QUALIFYING_FILENAME,
+            RACES_FILENAME,
+            updater=lambda pairs, since_versions: self._update_pairs(
+                pairs,
+                since_versions,
+                (QUALIFYING_FILENAME, RACES_FILENAME),
+                self._build_qualifying_pairs,
+            ),
+        )
+
+    @staticmethod
+    def _update_pairs(
+        pairs: pd.DataFrame,
+        since_versions: tuple[int, ...],
+        sources: tuple[str, ...],
+        builder: Callable[[list[int]], pd.DataFrame],
+    ) -> pd.DataFrame | None:
+        changed = DatasetIndex.get_changed_seasons(sources, since_versions)
+        if changed is None:
+            return None
+        if not changed:
+            return pairs
+
+        LOGGER.debug("Updating teammate pairs of seasons %s...", sorted(changed))
+        return EntityAggregation.replace_seasons(pairs, changed, builder(sorted(changed)))
+
+    @classmethod
+    @profile_stage()
+    def _build_race_pairs(cls, season_years: list[int] | None = None) -> pd.DataFrame:
+        LOGGER.debug("Pairing teammates in the races of seasons %s...", season_years or "all")
+        columns = [
+            ResultsColumns.RACE_ID,
+            ResultsColumns.CONSTRUCTOR_ID,
+            ResultsColumns.DRIVER_ID,
+            ResultsColumns.POSITION_ORDER,
+        ]
+        if season_years is None:
+            results = Results().get_selected_columns(*columns)
+        else:
+            race_ids = EntityAggregation.get_season_race_ids(season_years)
+            results = DatasetIndex.get_race_results(race_ids)[columns]
+        return cls._build_pairs(results, ResultsColumns.POSITION_ORDER)
+
+    @classmethod
+    @profile_stage()
+    def _build_qualifying_pairs(cls, season_years: list[int] | None = None) -> pd.DataFrame:
+        LOGGER.debug("Pairing teammates in the qualifyings of seasons %s...", season_years or "all")
+        qualifying = Qualifying().get_selected_columns(
+            QualifyingColumns.RACE_ID,
+            QualifyingColumns.CONSTRUCTOR_ID,
+            QualifyingColumns.DRIVER_ID,
+            QualifyingColumns.POSITION,
+        )
+        if season_years is not None:
+            qualifying = EntityAggregation.get_race_rows(
+                qualifying,
+                QualifyingColumns.RACE_ID,
+                EntityAggregation.get_season_race_ids(season_years),
+            )
+        return cls._build_pairs(qualifying, QualifyingColumns.POSITION)
+
+    @staticmethod
+    def _build_pairs(rows: pd.DataFrame, position_column: str) -> pd.DataFrame:
+        """
+        Every ordered pair of different drivers of a constructor in a race,
+        with the year of the race, whether the first driver was ahead and
+        the position delta. Rows without a position are left out.
+        """
+        rows = rows[rows[position_column].notna().to_numpy(dtype=bool)]
+        race_ids = rows[ResultsColumns.RACE_ID].to_numpy(dtype=np.int64, na_value=-1)
+        driver_ids = rows[ResultsColumns.DRIVER_ID].to_numpy(dtype=np.int64, na_value=-1)
+        positions = rows[position_column].to_numpy(dtype=np.int64)
+        groups = SortedGroups(
+            race_ids, rows[ResultsColumns.CONSTRUCTOR_ID].to_numpy(dtype=np.int64, na_value=-1)
+        )
+
+        # Every grouped row is repeated once per row of its group, and paired
+        # with each of them in turn
+        sizes = groups.counts[groups.group_ids]
+        firsts = np.repeat(np.arange(len(sizes)), sizes)
+        offsets = np.arange(len(firsts)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        seconds = np.repeat(groups.starts[groups.group_ids], sizes) + offsets
+        firsts, seconds = groups.order[firsts], groups.order[seconds]
+        # Shared drives put a driver twice in a team
+        different = driver_ids[firsts] != driver_ids[seconds]
+        firsts, seconds = firsts[different], seconds[different]
+
+        delta = positions[firsts] - positions[seconds]
+        pairs = pd.DataFrame(
+            {
+                ResultsColumns.RACE_ID: race_ids[firsts],
+                TeammatesHeadToHeadColumns.DRIVER_ID: driver_ids[firsts],
+                TeammatesHeadToHeadColumns.TEAMMATE_ID: driver_ids[seconds],
+                TeammatesHeadToHeadColumns.WIN: (delta < 0).astype(np.int64),
+                TeammatesHeadToHeadColumns.DELTA: delta,
+            }
+        )
+        pairs = EntityAggregation.attach_season_round(pairs, ResultsColumns.RACE_ID)
+        pairs = pairs.drop(columns=[EntityAggregationColumns.ROUND]).sort_values(
+            TeammatesHeadToHeadColumns.YEAR, kind="stable"
+        )
+        LOGGER.debug("Teammate pairs: \n %s", FrameSummary(pairs))
+        return pairs.reset_index(drop=True)
+
+    def _add_names(self, records: pd.DataFrame) -> pd.DataFrame:
+        names = Drivers().get_driver_fullnames()
+        records = records.copy()
+        records[TeammatesHeadToHeadColumns.FULLNAME] = names.reindex(
+            records.index.get_level_values(TeammatesHeadToHeadColumns.DRIVER_ID)
+        ).array
+        records[TeammatesHeadToHeadColumns.TEAMMATE_FULLNAME] = names.reindex(
+            records.index.get_level_values(TeammatesHeadToHeadColumns.TEAMMATE_ID)
+        ).array
+        return records
@@ -0,0 +1,434 @@
+import numpy as np
+import pandas as pd
+from formula1_analytics.logger import get_logger
+from formula1_analytics.config.config import (
+    DRIVERS_FILENAME,
+    LAP_TIMES_FILENAME,
+    PIT_STOPS_FILENAME,
+    RACES_FILENAME,
+)
+from formula1_analytics.common.data_registry import DataRegistry
+from formula1_analytics.common.dataset_index import DatasetIndex
+from formula1_analytics.common.index_manager import IndexManager
+from formula1_analytics.common.profiling import profile_stage
+from formula1_analytics.common.sorted_groups import SortedGroups
+from formula1_analytics.drivers.drivers import Drivers
+from formula1_analytics.common.exceptions import RaceNotFoundException
+from formula1_analytics.drivers.exceptions import DriverNotFoundException
+from formula1_analytics.laptimes.lap_times import LapTimes, LapTimesColumns
+from formula1_analytics.laptimes.pit_stops import PitStops, PitStopsColumns
+from formula1_analytics.races.races import Races, RacesColumns
+
+LOGGER = get_logger(__name__)
+
+
+class DriverRacePaceColumns:
+    RACE_ID = "raceId"
+    YEAR = "year"
+    ROUND = "round"
+    DRIVER_ID = "driverId"
+    FULLNAME = "fullname"
+    LAP = "lap"
+    STINT = "stint"
+    LAPS = "laps"
+    LAP_MS = "lap_ms"
+    MEDIAN_MS = "median_ms"
+    MEAN_MS = "mean_ms"
+    STD_MS = "std_ms"
+    IQR_MS = "iqr_ms"
+    FASTEST_MS = "fastest_ms"
+    FASTEST_DELTA_MS = "fastest_delta_ms"
+    MEDIAN_DELTA_MS = "median_delta_ms"
+    ROLLING_MS = "rolling_ms"
+
+
+class DriverRacePace:
+    """
+    Race pace of drivers computed from the lap times.
+
+    The lap table is sorted once by race, driver and lap, so every driver's
+    race is a contiguous run of the arrays. The statistics of all of them
+    are computed at once with SortedGroups, and the pace of every race is
+    built a single time per version of the lap table.
+    """
+
+    def __init__(self) -> None:
+        LOGGER.debug("Initializing DriverRacePace class")
+        self._drivers = Drivers()
+
+    def get_data(
+        self,
+        season_year: int,
+        round_number: int,
+        driver_names: list[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Description
+        -----------
+        Get the pace of every driver in a race, fastest median lap first.
+
+        Parameters
+        ----------
+        season_year : int
+            The season of the race.
+        round_number : int
+            The round of the race in the season.
+        driver_names : list[str], optional
+            A list of driver names to filter the results by, by default None.
+
+        Returns
+        -------
+        pd.DataFrame
+            A DataFrame with one row per driver:
+
+            - raceId, driverId: int64
+            - year, round: Int64
+            - fullname: string
+            - laps: int64, number of timed laps
+            - median_ms, mean_ms, std_ms, iqr_ms: float64, lap time statistics
+            - fastest_ms: int64, the driver's fastest lap
+            - fastest_delta_ms: int64, gap of the fastest lap to the fastest
+              lap of the race
+            - median_delta_ms: float64, gap of the median lap to the best
+              median lap of the race
+        """
+        race_id = self._get_race_id(season_year, round_number)
+        pace, race_slices = self._get_pace()
+        pace = pace.iloc[race_slices.get(race_id, slice(0, 0))]
+        pace = self._filter_drivers(pace, driver_names)
+        return pace.sort_values(DriverRacePaceColumns.MEDIAN_MS, ignore_index=True)
+
+    def get_season(
+        self,
+        season_year: int,
+        driver_names: list[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Description
+        -----------
+        Get the pace of every driver in every race of a season, with the same
+        columns as get_data, sorted by round and median lap.
+        """
+        race_ids = DatasetIndex.get_race_ids(season_year)
+        pace, race_slices = self._get_pace()
+        slices = [race_slices[race_id] for race_id in race_ids if race_id in race_slices]
+        pace = pace.iloc[IndexManager.slices_to_positions(slices)]
+        pace = self._filter_drivers(pace, driver_names)
+        return pace.sort_values(
+            [DriverRacePaceColumns.ROUND, DriverRacePaceColumns.MEDIAN_MS],
+            ignore_index=True,
+        )
+
+    def get_all_races(self) -> pd.DataFrame:
+        """
+        Get the pace of every driver in every race of the lap table, with
+        the same columns as get_data, sorted by race and driver
+        """
+        pace, _ = self._get_pace()
+        return pace.reset_index(drop=True)
+
+    def get_rolling_pace(
+        self,
+        season_year: int,
+        round_number: int,
+        window: int = 5,
+        driver_names: list[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Description
+        -----------
+        Get the rolling mean lap time of every driver during a race.
+
+        Parameters
+        ----------
+        season_year : int
+            The season of the race.
+        round_number : int
+            The round of the race in the season.
+        window : int, optional
+            The number of laps averaged, by default 5.
+        driver_names : list[str], optional
+            A list of driver names to filter the results by, by default None.
+
+        Returns
+        -------
+        pd.DataFrame
+            A DataFrame with one row per driver and lap:
+
+            - driverId: int64
+            - fullname: string
+            - lap: int64
+            - lap_ms: int64
+            - rolling_ms: float64, mean of the lap and the window - 1 laps
+              before it
+        """
+        if window < 1:
+            raise ValueError("Window must be at least 1 lap")
+
+        laps = self._get_race_laps(self._get_race_id(season_year, round_number))
+        groups = SortedGroups(laps[DriverRacePaceColumns.DRIVER_ID].to_numpy())
+        rolling = pd.DataFrame(
+            {
+                DriverRacePaceColumns.DRIVER_ID: groups.sort(
+                    laps[DriverRacePaceColumns.DRIVER_ID].to_numpy()
+                ),
+                DriverRacePaceColumns.LAP: groups.sort(
+                    laps[DriverRacePaceColumns.LAP].to_numpy()
+                ),
+                DriverRacePaceColumns.LAP_MS: groups.sort(
+                    laps[DriverRacePaceColumns.LAP_MS].to_numpy()
+                ),
+                DriverRacePaceColumns.ROLLING_MS: groups.rolling_mean(
+                    laps[DriverRacePaceColumns.LAP_MS].to_numpy(), window
+                ),
+            }
+        )
+        rolling.insert(1, DriverRacePaceColumns.FULLNAME, self._get_fullnames(rolling))
+        return self._filter_drivers(rolling, driver_names).reset_index(drop=True)
+
+    def get_stints(
+        self,
+        season_year: int,
+        round_number: int,
+        driver_names: list[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Description
+        -----------
+        Get the pace of every stint (laps between pit stops) of every driver
+        in a race. A lap belongs to the stint after the pit stops made on
+        earlier laps, so the in-lap ends a stint and the out-lap starts one.
+
+        Parameters
+        ----------
+        season_year : int
+            The season of the race.
+        round_number : int
+            The round of the race in the season.
+        driver_names : list[str], optional
+            A list of driver names to filter the results by, by default None.
+
+        Returns
+        -------
+        pd.DataFrame
+            A DataFrame with one row per driver and stint:
+
+            - driverId: int64
+            - fullname: string
+            - stint: int64, starting at 1
+            - laps: int64
+            - median_ms, mean_ms, std_ms: float64
+            - fastest_ms: int64
+        """
+        race_id = self._get_race_id(season_year, round_number)
+        laps = self._get_race_laps(race_id)
+        driver_ids = laps[DriverRacePaceColumns.DRIVER_ID].to_numpy()
+        lap_numbers = laps[DriverRacePaceColumns.LAP].to_numpy()
+        lap_ms = laps[DriverRacePaceColumns.LAP_MS].to_numpy()
+
+        stints = self._get_stint_numbers(race_id, driver_ids, lap_numbers)
+        groups = SortedGroups(driver_ids, stints)
+        data = pd.DataFrame(
+            {
+                DriverRacePaceColumns.DRIVER_ID: groups.keys[0],
+                DriverRacePaceColumns.STINT: groups.keys[1],
+                DriverRacePaceColumns.LAPS: groups.counts,
+                DriverRacePaceColumns.MEDIAN_MS: groups.median(lap_ms),
+                DriverRacePaceColumns.MEAN_MS: groups.mean(lap_ms),
+                DriverRacePaceColumns.STD_MS: groups.std(lap_ms),
+                DriverRacePaceColumns.FASTEST_MS: groups.min(lap_ms),
+            }
+        )
+        data.insert(1, DriverRacePaceColumns.FULLNAME, self._get_fullnames(data))
+        return self._filter_drivers(data, driver_names).reset_index(drop=True)
+
+    def _get_race_id(self, season_year: int, round_number: int) -> int:
+        race_id = DatasetIndex.get_race_id(season_year, round_number)
+        if race_id is None:
+            raise RaceNotFoundException(season_year, round_number)
+        return race_id
+
+    def _get_fullnames(self, data: pd.DataFrame) -> pd.api.extensions.ExtensionArray:
+        fullnames = self._drivers.get_driver_fullnames().astype("string")
+        return fullnames.reindex(data[DriverRacePaceColumns.DRIVER_ID]).array
+
+    def _filter_drivers(
+        self,
+        data: pd.DataFrame,
+        driver_names: list[str] | None,
+    ) -> pd.DataFrame:
+        if not driver_names:
+            return data
+        if not isinstance(driver_names, list):
+            raise TypeError("Driver names must be a list")
+        fullnames = data[DriverRacePaceColumns.FULLNAME]
+        for driver in driver_names:
+            if not (fullnames == driver).any():
+                raise DriverNotFoundException(driver)
+        return data[fullnames.isin(driver_names)]
+
+    def _get_race_laps(self, race_id: int) -> pd.DataFrame:
+        laps, race_slices = DataRegistry.get_derived(
+            "lap_times_sorted",
+            DriverRacePace._build_laps,
+            LAP_TIMES_FILENAME,
+        )
+        return laps.iloc[race_slices.get(race_id, slice(0, 0))]
+
+    def _get_pace(self) -> tuple[pd.DataFrame, dict]:
+        return DataRegistry.get_derived(
+            "lap_times_pace",
+            DriverRacePace._build_pace,
+            LAP_TIMES_FILENAME,
+            RACES_FILENAME,
+            DRIVERS_FILENAME,
+        )
+
+    @staticmethod
+    @profile_stage()
+    def _build_laps() -> tuple[pd.DataFrame, dict]:
+        """
+        Timed laps as plain int64 columns, sorted by race, driver and lap
+        """
+        LOGGER.debug("Sorting lap times by race, driver and lap...")
+        laps = LapTimes().get_selected_columns(
+            LapTimesColumns.RACE_ID,
+            LapTimesColumns.DRIVER_ID,
+            LapTimesColumns.LAP,
+            LapTimesColumns.MILLISECONDS,
+        ).dropna()
+        columns = {
+            DriverRacePaceColumns.RACE_ID: laps[LapTimesColumns.RACE_ID],
+            DriverRacePaceColumns.DRIVER_ID: laps[LapTimesColumns.DRIVER_ID],
+            DriverRacePaceColumns.LAP: laps[LapTimesColumns.LAP],
+            DriverRacePaceColumns.LAP_MS: laps[LapTimesColumns.MILLISECONDS],
+        }
+        columns = {
+            name: column.to_numpy(dtype=np.int64) for name, column in columns.items()
+        }
+        order = np.lexsort(
+            (
+                columns[DriverRacePaceColumns.LAP],
+                columns[DriverRacePaceColumns.DRIVER_ID],
+                columns[DriverRacePaceColumns.RACE_ID],
+            )
+        )
+        laps = pd.DataFrame({name: column[order] for name, column in columns.items()})
+        return laps, IndexManager.get_group_slices(laps[DriverRacePaceColumns.RACE_ID])
+
+    @staticmethod
+    @profile_stage()
+    def _build_pace() -> tuple[pd.DataFrame, dict]:
+        LOGGER.debug("Computing race pace of every driver...")
+        laps, _ = DataRegistry.get_derived(
+            "lap_times_sorted",
+            DriverRacePace._build_laps,
+            LAP_TIMES_FILENAME,
+        )
+        lap_ms = laps[DriverRacePaceColumns.LAP_MS].to_numpy()
+        groups = SortedGroups(
+            laps[DriverRacePaceColumns.RACE_ID].to_numpy(),
+            laps[DriverRacePaceColumns.DRIVER_ID].to_numpy(),
+        )
+        race_ids, driver_ids = groups.keys
+
+        fastest = groups.min(lap_ms)
+        median = groups.median(lap_ms)
+        races = SortedGroups(race_ids)
+        race_fastest = np.repeat(races.min(fastest), races.counts)
+        race_best_median = np.repeat(races.min(median), races.counts)
+
+        pace = pd.DataFrame(
+            {
+                DriverRacePaceColumns.RACE_ID: race_ids,
+                DriverRacePaceColumns.DRIVER_ID: driver_ids,
+                DriverRacePaceColumns.LAPS: groups.counts,
+                DriverRacePaceColumns.MEDIAN_MS: median,
+                DriverRacePaceColumns.MEAN_MS: groups.mean(lap_ms),
+                DriverRacePaceColumns.STD_MS: groups.std(lap_ms),
+                DriverRacePaceColumns.IQR_MS: groups.quantile(lap_ms, 0.75)
+                - groups.quantile(lap_ms, 0.25),
+                DriverRacePaceColumns.FASTEST_MS: fastest,
+                DriverRacePaceColumns.FASTEST_DELTA_MS: fastest - race_fastest,
+                DriverRacePaceColumns.MEDIAN_DELTA_MS: median - race_best_median,
+            }
+        )
+        return DriverRacePace._attach_race_and_driver(pace), (
+            IndexManager.get_group_slices(pace[DriverRacePaceColumns.RACE_ID])
+        )
+
+    @staticmethod
+    def _attach_race_and_driver(pace: pd.DataFrame) -> pd.DataFrame:
+        race_columns = Races().get_selected_columns(
+            RacesColumns.YEAR,
+            RacesColumns.ROUND,
+        ).reindex(pace[DriverRacePaceColumns.RACE_ID])
+        fullnames = Drivers().get_driver_fullnames().astype("string")
+        pace.insert(1, DriverRacePaceColumns.YEAR, race_columns[RacesColumns.YEAR].array)
+        pace.insert(2, DriverRacePaceColumns.ROUND, race_columns[RacesColumns.ROUND].array)
+        pace.insert(
+            4,
+            DriverRacePaceColumns.FULLNAME,
+            fullnames.reindex(pace[DriverRacePaceColumns.DRIVER_ID]).array,
+        )
+        return pace
+
+    def _get_stint_numbers(
+        self,
+        race_id: int,
+        driver_ids: np.ndarray,
+        lap_numbers: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Stint of every lap, 1 + the number of the driver's pit stops made on
+        earlier laps
+        """
+        pit_keys = DataRegistry.get_derived(
+            "pit_stops_keys",
+            DriverRacePace._build_pit_stop_keys,
+            PIT_STOPS_FILENAME,
+        )
+        empty = np.zeros(0, dtype=np.int64)
+        pit_drivers, pit_laps = pit_keys.get(race_id, (empty, empty))
+        span = int(max(lap_numbers.max(initial=0), pit_laps.max(initial=0))) + 1
+        race_keys = DriverRacePace._get_driver_lap_keys(pit_drivers, pit_laps, span)
+        lap_keys = DriverRacePace._get_driver_lap_keys(driver_ids, lap_numbers, span)
+        driver_starts = DriverRacePace._get_driver_lap_keys(driver_ids, 0, span)
+        return (
+            np.searchsorted(race_keys, lap_keys, side="left")
+            - np.searchsorted(race_keys, driver_starts, side="left")
+            + 1
+        )
+
+    @staticmethod
+    def _build_pit_stop_keys() -> dict[int, tuple[np.ndarray, np.ndarray]]:
+        """
+        Driver ids and laps of the pit stops of each race, sorted by driver
+        then lap
+        """
+        pit_stops = PitStops().get_selected_columns(
+            PitStopsColumns.RACE_ID,
+            PitStopsColumns.DRIVER_ID,
+            PitStopsColumns.LAP,
+        ).dropna()
+        groups = SortedGroups(
+            pit_stops[PitStopsColumns.RACE_ID].to_numpy(dtype=np.int64),
+            pit_stops[PitStopsColumns.DRIVER_ID].to_numpy(dtype=np.int64),
+            pit_stops[PitStopsColumns.LAP].to_numpy(dtype=np.int64),
+        )
+        race_slices = IndexManager.get_group_slices(pd.Series(groups.keys[0]))
+        return {
+            race_id: (groups.keys[1][race_slice], groups.keys[2][race_slice])
+            for race_id, race_slice in race_slices.items()
+        }
+
+    @staticmethod
+    def _get_driver_lap_keys(
+        driver_ids: np.ndarray,
+        lap_numbers: np.ndarray | int,
+        span: int,
+    ) -> np.ndarray:
+        """
+        Keys ordered by driver then lap, span must exceed every lap number
+        """
+        return driver_ids.astype(np.int64) * span + lap_numbers
@@ -0,0 +1,134 @@
+from typing import Iterator
+import pandas as pd
+from formula1_analytics.config.config import LAP_TIMES_FILENAME
+from formula1_analytics.common.chunk_aggregator import ChunkAggregator
+from formula1_analytics.common.data_loader import DataLoader
+from formula1_analytics.common.f1_data import F1Data
+
+
+class LapTimesColumns:
+    RACE_ID = "raceId"
+    DRIVER_ID = "driverId"
+    LAP = "lap"
+    POSITION = "position"
+    TIME = "time"
+    MILLISECONDS = "milliseconds"
+
+    @staticmethod
+    def get_types() -> dict[str, str]:
+        return {
+            LapTimesColumns.RACE_ID: "Int64",
+            LapTimesColumns.DRIVER_ID: "Int64",
+            LapTimesColumns.LAP: "Int64",
+            LapTimesColumns.POSITION: "Int64",
+            LapTimesColumns.TIME: "string",
+            LapTimesColumns.MILLISECONDS: "Int64",
+        }
+
+    @staticmethod
+    def get_key_columns() -> list[str]:
+        return [LapTimesColumns.RACE_ID, LapTimesColumns.DRIVER_ID, LapTimesColumns.LAP]
+
+
+class LapTotalsColumns:
+    LAPS = "laps"
+    TOTAL_MS = "total_ms"
+    BEST_POSITION = "best_position"
+
+
+class LapTimes(F1Data):
+    """
+    Every timed lap of every race. lap_times.csv is not bundled with the
+    package, set F1_ANALYTICS_DATA_PATH to the directory holding it.
+
+    The table is large, after the first load it is read from the Feather
+    cache memory-mapped, iter_chunks streams it without loading it whole and
+    get_race_totals aggregates the stream.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(
+            LAP_TIMES_FILENAME,
+            None,
+            LapTimesColumns.get_types(),
+            key_columns=LapTimesColumns.get_key_columns(),
+        )
+
+    @staticmethod
+    def iter_chunks(
+        columns: list[str] | None = None,
+        chunksize: int | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        return DataLoader.iter_chunks(
+            LAP_TIMES_FILENAME,
+            None,
+            LapTimesColumns.get_types(),
+            columns,
+            chunksize,
+        )
+
+    @staticmethod
+    def get_race_totals(chunksize: int | None = None) -> pd.DataFrame:
+        """
+        Description
+        -----------
+        Get the lap totals of every driver in every race, streamed from the
+        source file in chunks, so the lap table is never loaded whole.
+
+        Parameters
+        ----------
+        chunksize : int, optional
+            Rows per chunk, by default config.CHUNK_SIZE.
+
+        Returns
+        -------
+        pd.DataFrame
+            A DataFrame indexed by (raceId, driverId), sorted:
+
+            - laps: Int64, the last lap the driver completed
+            - total_ms: Int64, the sum of the lap times
+            - best_position: Int64, the best position at the end of a lap
+        """
+        totals = ChunkAggregator.groupby_agg(
+            LapTimes.iter_chunks(
+                [
+                    LapTimesColumns.RACE_ID,
+                    LapTimesColumns.DRIVER_ID,
+                    LapTimesColumns.LAP,
+                    LapTimesColumns.POSITION,
+                    LapTimesColumns.MILLISECONDS,
+                ],
+                chunksize,
+            ),
+            [LapTimesColumns.RACE_ID, LapTimesColumns.DRIVER_ID],
+            {
+                LapTimesColumns.LAP: "max",
+                LapTimesColumns.MILLISECONDS: "sum",
+                LapTimesColumns.POSITION: "min",
+            },
+        )
+        return totals.rename(
+            columns={
+                LapTimesColumns.LAP: LapTotalsColumns.LAPS,
+                LapTimesColumns.MILLISECONDS: LapTotalsColumns.TOTAL_MS,
+                LapTimesColumns.POSITION: LapTotalsColumns.BEST_POSITION,
+            }
+        )
+
+    def get_race_ids(self) -> pd.Series:
+        return self._data[LapTimesColumns.RACE_ID]
+
+    def get_driver_ids(self) -> pd.Series:
+        return self._data[LapTimesColumns.DRIVER_ID]
+
+    def get_laps(self) -> pd.Series:
+        return self._data[LapTimesColumns.LAP]
+
+    def get_positions(self) -> pd.Series:
+        return self._data[LapTimesColumns.POSITION]
+
+    def get_times(self) -> pd.Series:
+        return self._data[LapTimesColumns.TIME]
+
+    def get_milliseconds(self) -> pd.Series:
+        return self._data[LapTimesColumns.MILLISECONDS]
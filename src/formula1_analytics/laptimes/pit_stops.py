@@ -0,0 +1,51 @@
+import pandas as pd
+from formula1_analytics.config.config import PIT_STOPS_FILENAME
+from formula1_analytics.common.f1_data import F1Data
+
+
+class PitStopsColumns:
+    RACE_ID = "raceId"
+    DRIVER_ID = "driverId"
+    STOP = "stop"
+    LAP = "lap"
+    TIME = "time"
+    DURATION = "duration"
+    MILLISECONDS = "milliseconds"
+
+    @staticmethod
+    def get_types() -> dict[str, str]:
+        return {
+            PitStopsColumns.RACE_ID: "Int64",
+            PitStopsColumns.DRIVER_ID: "Int64",
+            PitStopsColumns.STOP: "Int64",
+            PitStopsColumns.LAP: "Int64",
+            PitStopsColumns.TIME: "string",
+            PitStopsColumns.DURATION: "string",
+            PitStopsColumns.MILLISECONDS: "Int64",
+        }
+
+    @staticmethod
+    def get_key_columns() -> list[str]:
+        return [PitStopsColumns.RACE_ID, PitStopsColumns.DRIVER_ID, PitStopsColumns.STOP]
+
+
+class PitStops(F1Data):
+    def __init__(self) -> None:
+        super().__init__(
+            PIT_STOPS_FILENAME,
+            None,
+            PitStopsColumns.get_types(),
+            key_columns=PitStopsColumns.get_key_columns(),
+        )
+
+    def get_race_ids(self) -> pd.Series:
+        return self._data[PitStopsColumns.RACE_ID]
+
+    def get_driver_ids(self) -> pd.Series:
+        return self._data[PitStopsColumns.DRIVER_ID]
+
+    def get_laps(self) -> pd.Series:
+        return self._data[PitStopsColumns.LAP]
+
+    def get_milliseconds(self) -> pd.Series:
+        return self._data[PitStopsColumns.MILLISECONDS]
@@ -1,17 +1,82 @@
 import logging
+import threading
+import pandas as pd
+import formula1_analytics.config.config as cfg
 
+PACKAGE_LOGGER_NAME = "formula1_analytics"
 
-def get_logger(name: str):
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
+_configure_lock = threading.Lock()
+_configured = False
 
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
 
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
+def get_logger(name: str) -> logging.Logger:
+    """
+    Get a logger of the package. Level and handlers are set once on the
+    package logger from config, so calling this any number of times does
+    not add handlers.
+    """
+    configure_logging()
+    return logging.getLogger(name)
 
-    logger.addHandler(console_handler)
 
-    return logger
+def configure_logging(force: bool = False) -> None:
+    """
+    Set the package logger level and handlers from config, force applies
+    changed config values again
+    """
+    global _configured
+    with _configure_lock:
+        if _configured and not force:
+            return
+
+        logger = logging.getLogger(PACKAGE_LOGGER_NAME)
+        logger.setLevel(cfg.LOG_LEVEL)
+        for handler in [h for h in logger.handlers if getattr(h, "_f1_analytics", False)]:
+            logger.removeHandler(handler)
+            handler.close()
+
+        formatter = logging.Formatter(cfg.LOG_FORMAT)
+        for handler in _create_handlers():
+            handler._f1_analytics = True
+            handler.setFormatter(formatter)
+            logger.addHandler(handler)
+        _configured = True
+
+
+def _create_handlers() -> list[logging.Handler]:
+    handlers = []
+    for handler_name in cfg.LOG_HANDLERS:
+        if handler_name == "console":
+            handlers.append(logging.StreamHandler())
+        elif handler_name == "file":
+            handlers.append(logging.FileHandler(cfg.LOG_FILE))
+        else:
+            raise ValueError(f"Unknown log handler: {handler_name}")
+    return handlers
+
+
+class FrameSummary:
+    """
+    Lazily rendered summary of a DataFrame or Series (shape and first rows)
+    for log messages. Pass it as a logging argument, it is only rendered when
+    the record is emitted:
+
+        LOGGER.debug("Got results: \\n %s", FrameSummary(results))
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: pd.DataFrame | pd.Series) -> None:
+        self._data = data
+
+    def __str__(self) -> str:
+        rows = cfg.LOG_FRAME_ROWS
+        head = self._data.head(rows)
+        if isinstance(head, pd.DataFrame):
+            head = head.to_string(max_cols=cfg.LOG_FRAME_COLUMNS)
+        else:
+            head = head.to_string()
+        shape = "x".join(str(size) for size in self._data.shape)
+        if len(self._data) > rows:
+            return f"{head}\n... [{shape}]"
+        return f"{head}\n[{shape}]"
@@ -0,0 +1,58 @@
+import pandas as pd
+from formula1_analytics.config.config import QUALIFYING_FILENAME
+from formula1_analytics.common.f1_data import F1Data
+
+
+class QualifyingColumns:
+    QUALIFY_ID = "qualifyId"
+    RACE_ID = "raceId"
+    DRIVER_ID = "driverId"
+    CONSTRUCTOR_ID = "constructorId"
+    NUMBER = "number"
+    POSITION = "position"
+    Q1 = "q1"
+    Q2 = "q2"
+    Q3 = "q3"
+
+    @staticmethod
+    def get_types() -> dict[str, str]:
+        return {
+            QualifyingColumns.RACE_ID: "Int64",
+            QualifyingColumns.DRIVER_ID: "Int64",
+            QualifyingColumns.CONSTRUCTOR_ID: "Int64",
+            QualifyingColumns.NUMBER: "Int64",
+            QualifyingColumns.POSITION: "Int64",
+            QualifyingColumns.Q1: "string",
+            QualifyingColumns.Q2: "string",
+            QualifyingColumns.Q3: "string",
+        }
+
+
+class Qualifying(F1Data):
+    def __init__(self) -> None:
+        super().__init__(
+            QUALIFYING_FILENAME,
+            QualifyingColumns.QUALIFY_ID,
+            QualifyingColumns.get_types(),
+        )
+
+    def get_race_ids(self) -> pd.Series:
+        return self._data[QualifyingColumns.RACE_ID]
+
+    def get_driver_ids(self) -> pd.Series:
+        return self._data[QualifyingColumns.DRIVER_ID]
+
+    def get_constructor_ids(self) -> pd.Series:
+        return self._data[QualifyingColumns.CONSTRUCTOR_ID]
+
+    def get_positions(self) -> pd.Series:
+        return self._data[QualifyingColumns.POSITION]
+
+    def get_q1_times(self) -> pd.Series:
+        return self._data[QualifyingColumns.Q1]
+
+    def get_q2_times(self) -> pd.Series:
+        return self._data[QualifyingColumns.Q2]
+
+    def get_q3_times(self) -> pd.Series:
+        return self._data[QualifyingColumns.Q3]
@@ -1,7 +1,6 @@
 import pandas as pd
 from formula1_analytics.config.config import RACES_FILENAME
 from formula1_analytics.common.f1_data import F1Data
-from formula1_analytics.common.data_processor import DataProcessor
 
 
 class RacesColumns:
@@ -46,11 +45,19 @@ class RacesColumns:
             RacesColumns.SPRINT_TIME: "datetime64[ns]",
         }
 
+    @staticmethod
+    def get_category_columns() -> list[str]:
+        return [RacesColumns.NAME]
+
 
 class Races(F1Data):
     def __init__(self) -> None:
-        super().__init__(RACES_FILENAME, RacesColumns.RACE_ID)
-        DataProcessor().convert_types(self._data, RacesColumns.get_types())
+        super().__init__(
+            RACES_FILENAME,
+            RacesColumns.RACE_ID,
+            RacesColumns.get_types(),
+            RacesColumns.get_category_columns(),
+        )
 
     def get_race_ids(self) -> pd.Series:
         return self._data[RacesColumns.RACE_ID]
@@ -1,7 +1,6 @@
 import pandas as pd
 from formula1_analytics.config.config import RESULTS_FILENAME
 from formula1_analytics.common.f1_data import F1Data
-from formula1_analytics.common.data_processor import DataProcessor
 
 
 class ResultsColumns:
@@ -46,11 +45,19 @@ class ResultsColumns:
             ResultsColumns.STATUS_ID: "Int64",
         }
 
+    @staticmethod
+    def get_category_columns() -> list[str]:
+        return [ResultsColumns.POSITION_TEXT]
+
 
 class Results(F1Data):
     def __init__(self) -> None:
-        super().__init__(RESULTS_FILENAME, ResultsColumns.RESULT_ID)
-        DataProcessor().convert_types(self._data, ResultsColumns.get_types())
+        super().__init__(
+            RESULTS_FILENAME,
+            ResultsColumns.RESULT_ID,
+            ResultsColumns.get_types(),
+            ResultsColumns.get_category_columns(),
+        )
 
     def get_driver_ids(self) -> pd.Series:
         return self._data[ResultsColumns.DRIVER_ID]
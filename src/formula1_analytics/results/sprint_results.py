@@ -0,0 +1,77 @@
+import pandas as pd
+from formula1_analytics.config.config import SPRINT_RESULTS_FILENAME
+from formula1_analytics.common.f1_data import F1Data
+
+
+class SprintResultsColumns:
+    RESULT_ID = "resultId"
+    RACE_ID = "raceId"
+    DRIVER_ID = "driverId"
+    CONSTRUCTOR_ID = "constructorId"
+    NUMBER = "number"
+    GRID = "grid"
+    POSITION = "position"
+    POSITION_TEXT = "positionText"
+    POSITION_ORDER = "positionOrder"
+    POINTS = "points"
+    LAPS = "laps"
+    TIME = "time"
+    MILLISECONDS = "milliseconds"
+    FASTEST_LAP = "fastestLap"
+    FASTEST_LAP_TIME = "fastestLapTime"
+    STATUS_ID = "statusId"
+
+    @staticmethod
+    def get_types() -> dict[str, str]:
+        return {
+            SprintResultsColumns.RACE_ID: "Int64",
+            SprintResultsColumns.DRIVER_ID: "Int64",
+            SprintResultsColumns.CONSTRUCTOR_ID: "Int64",
+            SprintResultsColumns.NUMBER: "Int64",
+            SprintResultsColumns.GRID: "Int64",
+            SprintResultsColumns.POSITION: "Int64",
+            SprintResultsColumns.POSITION_TEXT: "string",
+            SprintResultsColumns.POSITION_ORDER: "Int64",
+            SprintResultsColumns.POINTS: "Float64",
+            SprintResultsColumns.LAPS: "Int64",
+            SprintResultsColumns.TIME: "string",
+            SprintResultsColumns.MILLISECONDS: "Int64",
+            SprintResultsColumns.FASTEST_LAP: "Int64",
+            SprintResultsColumns.FASTEST_LAP_TIME: "datetime64[ns]",
+            SprintResultsColumns.STATUS_ID: "Int64",
+        }
+
+    @staticmethod
+    def get_category_columns() -> list[str]:
+        return [SprintResultsColumns.POSITION_TEXT]
+
+
+class SprintResults(F1Data):
+    def __init__(self) -> None:
+        super().__init__(
+            SPRINT_RESULTS_FILENAME,
+            SprintResultsColumns.RESULT_ID,
+            SprintResultsColumns.get_types(),
+            SprintResultsColumns.get_category_columns(),
+        )
+
+    def get_race_ids(self) -> pd.Series:
+        return self._data[SprintResultsColumns.RACE_ID]
+
+    def get_driver_ids(self) -> pd.Series:
+        return self._data[SprintResultsColumns.DRIVER_ID]
+
+    def get_constructor_ids(self) -> pd.Series:
+        return self._data[SprintResultsColumns.CONSTRUCTOR_ID]
+
+    def get_positions(self) -> pd.Series:
+        return self._data[SprintResultsColumns.POSITION]
+
+    def get_positions_orders(self) -> pd.Series:
+        return self._data[SprintResultsColumns.POSITION_ORDER]
+
+    def get_points(self) -> pd.Series:
+        return self._data[SprintResultsColumns.POINTS]
+
+    def get_status_ids(self) -> pd.Series:
+        return self._data[SprintResultsColumns.STATUS_ID]
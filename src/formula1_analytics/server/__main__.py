@@ -0,0 +1,26 @@
+import argparse
+import formula1_analytics.config.config as cfg
+from formula1_analytics.logger import configure_logging
+from formula1_analytics.server.http_server import AnalyticsServer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve the analytics over HTTP")
+    parser.add_argument("--host", default=cfg.SERVER_HOST)
+    parser.add_argument("--port", type=int, default=cfg.SERVER_PORT)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=cfg.SERVER_MAX_WORKERS,
+        help="threads running the analytics",
+    )
+    parser.add_argument("--log-level", default="INFO")
+    args = parser.parse_args()
+
+    cfg.LOG_LEVEL = args.log_level
+    configure_logging(force=True)
+    AnalyticsServer(args.host, args.port, args.workers).run()
+
+
+if __name__ == "__main__":
+    main()
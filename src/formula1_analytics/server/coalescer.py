@@ -0,0 +1,64 @@
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, Callable, Hashable
+from formula1_analytics.logger import get_logger
+
+LOGGER = get_logger(__name__)
+
+
+class RequestCoalescer:
+    """
+    Runs blocking calls on an executor, sharing the call of identical
+    requests which are in flight at the same time.
+
+    The first request for a key submits the call, every request for the same
+    key arriving before it finishes awaits the same future, so 50 concurrent
+    requests for one season are computed once. Finished calls are not kept,
+    the next request for the key computes again (the analytics cache their
+    results themselves).
+    """
+
+    def __init__(self, executor: Executor) -> None:
+        self._executor = executor
+        self._in_flight: dict[Hashable, asyncio.Future] = {}
+        self.computed = 0
+        self.coalesced = 0
+
+    async def run(self, key: Hashable, function: Callable[..., Any], *args) -> Any:
+        """
+        Description
+        -----------
+        Get the result of function(*args), computed on the executor or shared
+        with an identical request in flight.
+
+        Parameters
+        ----------
+        key : Hashable
+            Identifies the request, requests with equal keys must have equal
+            results.
+        function : Callable[..., Any]
+            The blocking function.
+        *args
+            Arguments of the function.
+
+        Returns
+        -------
+        Any
+            The result of the function, its error is raised to every request
+            sharing the call.
+        """
+        future = self._in_flight.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._executor, function, *args)
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+            self.computed += 1
+        else:
+            LOGGER.debug("Coalescing request %r", key)
+            self.coalesced += 1
+        # A cancelled client must not cancel the call shared with the others
+        return await asyncio.shield(future)
+
+    def get_in_flight_count(self) -> int:
+        return len(self._in_flight)
@@ -0,0 +1,347 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Any, Callable
+from urllib.parse import parse_qs, urlsplit
+import formula1_analytics.config.config as cfg
+from formula1_analytics.logger import get_logger
+from formula1_analytics.drivers.driver_weather_perf import WeatherType
+from formula1_analytics.common.exceptions import (
+    InvalidSeasonException,
+    RaceNotFoundException,
+    SeasonNotFoundException,
+)
+from formula1_analytics.drivers.exceptions import DriverNotFoundException
+from formula1_analytics.server.coalescer import RequestCoalescer
+from formula1_analytics.server.service import JSON_CONTENT_TYPE, AnalyticsService
+
+LOGGER = get_logger(__name__)
+
+
+class BadRequestError(Exception):
+    def __init__(self, message: str) -> None:
+        self.message = message
+        super().__init__(self.message)
+
+
+def _get_int(
+    query: dict[str, list[str]],
+    name: str,
+    default: int | None = None,
+    minimum: int | None = None,
+) -> int:
+    values = query.get(name)
+    if not values:
+        if default is None:
+            raise BadRequestError(f"Missing query parameter '{name}'")
+        return default
+    try:
+        value = int(values[-1])
+    except ValueError:
+        raise BadRequestError(f"Query parameter '{name}' must be an integer")
+    if minimum is not None and value < minimum:
+        raise BadRequestError(f"Query parameter '{name}' must be at least {minimum}")
+    return value
+
+
+def _get_optional_int(query: dict[str, list[str]], name: str) -> int | None:
+    if not query.get(name):
+        return None
+    return _get_int(query, name)
+
+
+def _get_str(query: dict[str, list[str]], name: str, default: str | None = None) -> str | None:
+    values = query.get(name)
+    return values[-1] if values else default
+
+
+def _get_weather_type(query: dict[str, list[str]]) -> str:
+    weather_type = _get_str(query, "weather_type", WeatherType.RAINFALL)
+    if weather_type not in WeatherType.get_all_types():
+        raise BadRequestError(
+            f"Weather type must be one of: {', '.join(WeatherType.get_all_types())}"
+        )
+    return weather_type
+
+
+def _get_names(query: dict[str, list[str]], name: str) -> tuple[str, ...] | None:
+    """
+    Names given as a comma separated list and/or as repeated parameters
+    """
+    names = tuple(
+        part.strip()
+        for value in query.get(name, [])
+        for part in value.split(",")
+        if part.strip()
+    )
+    return names or None
+
+
+# Path of every endpoint, the AnalyticsService method it calls and how its
+# arguments are read from the query string
+_ROUTES: dict[str, tuple[str, Callable[[dict[str, list[str]]], tuple]]] = {
+    "/drivers/season-performance": (
+        "get_season_performance",
+        lambda query: (_get_int(query, "season"), _get_names(query, "drivers")),
+    ),
+    "/drivers/most-wins": (
+        "get_most_wins",
+        lambda query: (_get_int(query, "count", 10, minimum=1),),
+    ),
+    "/drivers/standings": (
+        "get_standings",
+        lambda query: (_get_int(query, "season"), _get_optional_int(query, "round")),
+    ),
+    "/drivers/weather-performance": (
+        "get_weather_performance",
+        lambda query: (
+            _get_int(query, "season"),
+            _get_names(query, "drivers"),
+            _get_weather_type(query),
+        ),
+    ),
+    "/plots/season-performance": (
+        "get_plot_season_performance",
+        lambda query: (_get_int(query, "season"), _get_names(query, "drivers")),
+    ),
+    "/plots/most-wins": (
+        "get_plot_most_wins",
+        lambda query: (_get_int(query, "count", 10, minimum=1),),
+    ),
+    "/plots/weather-performance": (
+        "get_plot_weather_performance",
+        lambda query: (
+            _get_int(query, "season"),
+            _get_str(query, "driver"),
+            _get_weather_type(query),
+        ),
+    ),
+}
+
+# Errors answered with a client error status, any other error is a server
+# error. The query parameters are validated when they are read, an error of
+# the analytics themselves is not the client's fault.
+_CLIENT_ERRORS = [
+    (BadRequestError, HTTPStatus.BAD_REQUEST),
+    (InvalidSeasonException, HTTPStatus.BAD_REQUEST),
+    (SeasonNotFoundException, HTTPStatus.NOT_FOUND),
+    (DriverNotFoundException, HTTPStatus.NOT_FOUND),
+    (RaceNotFoundException, HTTPStatus.NOT_FOUND),
+]
+
+
+class AnalyticsServer:
+    """
+    HTTP/1.1 query server of the analytics, built on asyncio streams.
+
+    GET endpoints (see _ROUTES) answer with JSON tables or PNG charts, plus
+    /health and /stats. The analytics run on a thread pool so the event loop
+    keeps accepting connections, the threads share the tables loaded at
+    start up. Identical requests in flight at the same time are computed
+    once, see RequestCoalescer.
+
+        python -m formula1_analytics.server --port 8050
+        curl 'http://127.0.0.1:8050/drivers/season-performance?season=2021'
+    """
+
+    def __init__(
+        self,
+        host: str | None = None,
+        port: int | None = None,
+        max_workers: int | None = None,
+        service: AnalyticsService | None = None,
+    ) -> None:
+        self._host = host or cfg.SERVER_HOST
+        self._port = cfg.SERVER_PORT if port is None else port
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or cfg.SERVER_MAX_WORKERS,
+            thread_name_prefix="analytics",
+        )
+        self._service = service or AnalyticsService()
+        self._coalescer = RequestCoalescer(self._executor)
+        self._server: asyncio.AbstractServer | None = None
+        self._request_count = 0
+
+    @property
+    def port(self) -> int:
+        """
+        The bound port, useful when the server was started on port 0
+        """
+        if self._server is None:
+            return self._port
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._service.warm_up)
+        self._server = await asyncio.start_server(
+            self._handle_connection,
+            self._host,
+            self._port,
+            limit=cfg.SERVER_MAX_HEADER_SIZE,
+        )
+        LOGGER.info("Serving on http://%s:%s", self._host, self.port)
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def run(self) -> None:
+        """
+        Serve until interrupted
+        """
+        try:
+            asyncio.run(self.serve_forever())
+        except KeyboardInterrupt:
+            LOGGER.info("Server stopped")
+        finally:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "requests": self._request_count,
+            "computed": self._coalescer.computed,
+            "coalesced": self._coalescer.coalesced,
+            "in_flight": self._coalescer.get_in_flight_count(),
+        }
+
+    async def _handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    head = await asyncio.wait_for(
+                        reader.readuntil(b"\r\n\r\n"), cfg.SERVER_KEEP_ALIVE_TIMEOUT
+                    )
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self._write_response(
+                        writer,
+                        HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+                        *self._get_error_body("Request head too large"),
+                        keep_alive=False,
+                    )
+                    break
+
+                method, target, version, headers = self._parse_head(head)
+                if version is None:
+                    await self._write_response(
+                        writer,
+                        HTTPStatus.BAD_REQUEST,
+                        *self._get_error_body("Malformed request"),
+                        keep_alive=False,
+                    )
+                    break
+                connection = headers.get("connection", "").lower()
+                keep_alive = (
+                    connection == "keep-alive"
+                    if version == "HTTP/1.0"
+                    else connection != "close"
+                )
+                # Bodies are not used by any endpoint
+                length = int(headers.get("content-length", "0") or 0)
+                if length:
+                    await reader.readexactly(length)
+
+                status, content_type, body = await self._dispatch(method, target)
+                await self._write_response(
+                    writer,
+                    status,
+                    content_type,
+                    b"" if method == "HEAD" else body,
+                    keep_alive=keep_alive,
+                    content_length=len(body),
+                )
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method: str, target: str) -> tuple[HTTPStatus, str, bytes]:
+        self._request_count += 1
+        if method not in ("GET", "HEAD"):
+            return (
+                HTTPStatus.METHOD_NOT_ALLOWED,
+                *self._get_error_body(f"Method {method} not allowed"),
+            )
+
+        url = urlsplit(target)
+        if url.path == "/health":
+            return HTTPStatus.OK, *self._get_json_body({"status": "ok"})
+        if url.path == "/stats":
+            return HTTPStatus.OK, *self._get_json_body(self.get_stats())
+        if url.path not in _ROUTES:
+            return HTTPStatus.NOT_FOUND, *self._get_error_body(f"Unknown path {url.path}")
+
+        method_name, get_arguments = _ROUTES[url.path]
+        try:
+            arguments = get_arguments(parse_qs(url.query))
+            content_type, body = await self._coalescer.run(
+                (url.path, arguments),
+                getattr(self._service, method_name),
+                *arguments,
+            )
+        except Exception as e:
+            return self._get_error_response(e)
+        return HTTPStatus.OK, content_type, body
+
+    @staticmethod
+    def _parse_head(head: bytes) -> tuple[str, str, str | None, dict[str, str]]:
+        lines = head.decode("latin-1").split("\r\n")
+        parts = lines[0].split(" ")
+        if len(parts) != 3 or not parts[2].startswith("HTTP/1."):
+            return "", "", None, {}
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            if name:
+                headers[name.strip().lower()] = value.strip()
+        return parts[0], parts[1], parts[2], headers
+
+    def _get_error_response(self, error: Exception) -> tuple[HTTPStatus, str, bytes]:
+        for error_type, status in _CLIENT_ERRORS:
+            if isinstance(error, error_type):
+                return status, *self._get_error_body(str(error))
+        LOGGER.error("Request failed", exc_info=error)
+        return HTTPStatus.INTERNAL_SERVER_ERROR, *self._get_error_body("Internal server error")
+
+    @staticmethod
+    def _get_json_body(data: Any) -> tuple[str, bytes]:
+        return JSON_CONTENT_TYPE, json.dumps(data).encode()
+
+    @staticmethod
+    def _get_error_body(message: str) -> tuple[str, bytes]:
+        return AnalyticsServer._get_json_body({"error": message})
+
+    @staticmethod
+    async def _write_response(
+        writer: asyncio.StreamWriter,
+        status: HTTPStatus,
+        content_type: str,
+        body: bytes,
+        keep_alive: bool,
+        content_length: int | None = None,
+    ) -> None:
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body) if content_length is None else content_length}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            "\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
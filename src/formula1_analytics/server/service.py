@@ -0,0 +1,117 @@
+import threading
+import time
+from typing import Any
+import pandas as pd
+from formula1_analytics.logger import get_logger
+from formula1_analytics.drivers.drivers import Drivers
+from formula1_analytics.drivers.drivers_plots import DriversPlots
+from formula1_analytics.drivers.drivers_most_wins import DriversMostWins
+from formula1_analytics.drivers.drivers_season_perf import DriversSeasonPerf
+from formula1_analytics.drivers.drivers_standings_index import DriversStandingsIndex
+from formula1_analytics.drivers.driver_weather_perf import DriverWeatherPerf, WeatherType
+from formula1_analytics.races.races import Races
+from formula1_analytics.results.results import Results
+from formula1_analytics.weather.weather import Weather
+
+LOGGER = get_logger(__name__)
+
+JSON_CONTENT_TYPE = "application/json"
+PNG_CONTENT_TYPE = "image/png"
+
+
+class AnalyticsService:
+    """
+    Blocking endpoints of the query server, each returns the content type
+    and the body of the response.
+
+    The tables are shared by every thread through the DataRegistry, the
+    analytics instances are kept per thread since some of them hold the
+    state of the call in progress.
+    """
+
+    _tables = [Drivers, Races, Results, Weather]
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+
+    def warm_up(self) -> None:
+        """
+        Load the shared tables and build the derived structures the
+        endpoints use, so the first requests do not pay for them
+        """
+        start = time.perf_counter()
+        for table in self._tables:
+            table()
+        self._get_analytic(DriversSeasonPerf).get_all_seasons()
+        self._get_analytic(DriversMostWins).get_data(1)
+        LOGGER.info("Warmed up in %.3f s", time.perf_counter() - start)
+
+    def get_season_performance(
+        self,
+        season_year: int,
+        driver_names: tuple[str, ...] | None = None,
+    ) -> tuple[str, bytes]:
+        data = self._get_analytic(DriversSeasonPerf).get_data(
+            season_year, list(driver_names) if driver_names else None
+        )
+        return JSON_CONTENT_TYPE, self._to_json(data)
+
+    def get_most_wins(self, count: int) -> tuple[str, bytes]:
+        data = self._get_analytic(DriversMostWins).get_data(count)
+        return JSON_CONTENT_TYPE, self._to_json(data)
+
+    def get_standings(
+        self,
+        season_year: int,
+        round_number: int | None = None,
+    ) -> tuple[str, bytes]:
+        data = self._get_analytic(DriversStandingsIndex).get_standings(season_year, round_number)
+        return JSON_CONTENT_TYPE, self._to_json(data)
+
+    def get_weather_performance(
+        self,
+        season_year: int,
+        driver_names: tuple[str, ...] | None = None,
+        weather_type: str = WeatherType.RAINFALL,
+    ) -> tuple[str, bytes]:
+        data = self._get_analytic(DriverWeatherPerf).get_data(
+            season_year, list(driver_names) if driver_names else None, weather_type
+        )
+        return JSON_CONTENT_TYPE, self._to_json(data)
+
+    def get_plot_season_performance(
+        self,
+        season_year: int,
+        driver_names: tuple[str, ...] | None = None,
+    ) -> tuple[str, bytes]:
+        image = DriversPlots.plot_drivers_season_performance(
+            season_year, list(driver_names) if driver_names else None
+        )
+        return PNG_CONTENT_TYPE, image
+
+    def get_plot_most_wins(self, count: int) -> tuple[str, bytes]:
+        return PNG_CONTENT_TYPE, DriversPlots.get_plot_drivers_most_wins(count)
+
+    def get_plot_weather_performance(
+        self,
+        season_year: int,
+        driver_name: str | None = None,
+        weather_type: str = WeatherType.RAINFALL,
+    ) -> tuple[str, bytes]:
+        image = DriversPlots.get_plot_drivers_weather_perf(
+            season_year, driver_name, weather_type
+        )
+        return PNG_CONTENT_TYPE, image
+
+    def _get_analytic(self, analytic: type) -> Any:
+        instances = getattr(self._local, "instances", None)
+        if instances is None:
+            instances = self._local.instances = {}
+        instance = instances.get(analytic)
+        if instance is None:
+            instance = instances[analytic] = analytic()
+        return instance
+
+    @staticmethod
+    def _to_json(data: pd.DataFrame) -> bytes:
+        return data.to_json(orient="split", date_format="iso").encode()
@@ -0,0 +1,31 @@
+import pandas as pd
+from formula1_analytics.config.config import STATUS_FILENAME
+from formula1_analytics.common.f1_data import F1Data
+
+
+class StatusColumns:
+    STATUS_ID = "statusId"
+    STATUS = "status"
+
+    @staticmethod
+    def get_types() -> dict[str, str]:
+        return {
+            StatusColumns.STATUS: "string",
+        }
+
+    @staticmethod
+    def get_category_columns() -> list[str]:
+        return [StatusColumns.STATUS]
+
+
+class Status(F1Data):
+    def __init__(self) -> None:
+        super().__init__(
+            STATUS_FILENAME,
+            StatusColumns.STATUS_ID,
+            StatusColumns.get_types(),
+            StatusColumns.get_category_columns(),
+        )
+
+    def get_statuses(self) -> pd.Series:
+        return self._data[StatusColumns.STATUS]
@@ -1,6 +1,5 @@
 import pandas as pd
 from formula1_analytics.logger import get_logger
-from formula1_analytics.common.data_processor import DataProcessor
 from formula1_analytics.common.f1_data import F1Data
 from formula1_analytics.config.config import WEATHER_FILENAME
 
@@ -32,10 +31,18 @@ class WeatherColumns:
             WeatherColumns.YEAR: "Int64",
         }
 
+    @staticmethod
+    def get_key_columns() -> list[str]:
+        return [WeatherColumns.YEAR, WeatherColumns.ROUND]
+
 class Weather(F1Data):
     def __init__(self) -> None:
-        super().__init__(WEATHER_FILENAME, None)
-        DataProcessor().convert_types(self._data, WeatherColumns.get_types())
+        super().__init__(
+            WEATHER_FILENAME,
+            None,
+            WeatherColumns.get_types(),
+            key_columns=WeatherColumns.get_key_columns(),
+        )
 
     def get_time(self) -> pd.Series:
         return self._data[WeatherColumns.TIME]
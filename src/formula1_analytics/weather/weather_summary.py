@@ -0,0 +1,125 @@
+import pandas as pd
+from formula1_analytics.logger import get_logger
+from formula1_analytics.common.data_registry import DataRegistry
+from formula1_analytics.config.config import WEATHER_FILENAME
+from formula1_analytics.weather.weather import Weather, WeatherColumns
+
+LOGGER = get_logger(__name__)
+
+
+class WeatherSummaryColumns:
+    YEAR = WeatherColumns.YEAR
+    ROUND = WeatherColumns.ROUND
+    RAIN_FRACTION = "RainFraction"
+    ANY_RAIN = "AnyRain"
+
+    MEAN = "mean"
+    MIN = "min"
+    MAX = "max"
+
+    @staticmethod
+    def get_numeric_columns() -> list[str]:
+        return [
+            WeatherColumns.AIR_TEMP,
+            WeatherColumns.HUMIDITY,
+            WeatherColumns.PRESSURE,
+            WeatherColumns.TRACK_TEMP,
+            WeatherColumns.WIND_DIRECTION,
+            WeatherColumns.WIND_SPEED,
+        ]
+
+    @staticmethod
+    def get_stat_column(column: str, stat: str) -> str:
+        """
+        Get the name of the summary column, e.g. "AirTemp_mean"
+        """
+        return f"{column}_{stat}"
+
+
+class WeatherSummary:
+    """
+    Weather samples aggregated to one row per race (Year, Round).
+
+    The summary is built once from Weather and shared through the
+    DataRegistry, it is rebuilt only when the weather table is reloaded.
+    Races appended by a refresh are summarized and added to it.
+    """
+
+    _data: pd.DataFrame
+
+    def __init__(self) -> None:
+        self._data = DataRegistry.get_derived(
+            "weather_summary",
+            WeatherSummary._build,
+            WEATHER_FILENAME,
+            updater=WeatherSummary._update,
+        )
+
+    def get_data(self) -> pd.DataFrame:
+        return self._data
+
+    def get_selected_columns(
+        self,
+        *args,
+    ) -> pd.DataFrame:
+        return self._data[list(args)]
+
+    @staticmethod
+    def _build() -> pd.DataFrame:
+        LOGGER.debug("Building per race weather summary...")
+        summary = WeatherSummary._summarize(Weather().get_data())
+        LOGGER.debug("Built weather summary for %s races", len(summary))
+        return summary
+
+    @staticmethod
+    def _update(
+        summary: pd.DataFrame,
+        since_versions: tuple[int, ...],
+    ) -> pd.DataFrame | None:
+        appended = DataRegistry.get_appended(WEATHER_FILENAME, since_versions[0])
+        if appended is None:
+            return None
+        if appended.empty:
+            return summary
+
+        keys = [WeatherSummaryColumns.YEAR, WeatherSummaryColumns.ROUND]
+        races = WeatherSummary._summarize(appended)
+        # A refresh appends whole races, samples of a summarized race mean
+        # the table changed otherwise
+        if pd.MultiIndex.from_frame(races[keys]).isin(
+            pd.MultiIndex.from_frame(summary[keys])
+        ).any():
+            return None
+        LOGGER.debug("Adding %s races to the weather summary", len(races))
+        return (
+            pd.concat([summary, races])
+            .sort_values(keys, kind="stable")
+            .reset_index(drop=True)
+        )
+
+    @staticmethod
+    def _summarize(weather: pd.DataFrame) -> pd.DataFrame:
+        grouped = weather.groupby(
+            [WeatherSummaryColumns.YEAR, WeatherSummaryColumns.ROUND],
+            sort=True,
+        )
+
+        aggregations = {
+            WeatherSummaryColumns.get_stat_column(column, stat): pd.NamedAgg(
+                column=column, aggfunc=stat
+            )
+            for column in WeatherSummaryColumns.get_numeric_columns()
+            for stat in (
+                WeatherSummaryColumns.MEAN,
+                WeatherSummaryColumns.MIN,
+                WeatherSummaryColumns.MAX,
+            )
+        }
+        aggregations[WeatherSummaryColumns.RAIN_FRACTION] = pd.NamedAgg(
+            column=WeatherColumns.RAINFALL, aggfunc="mean"
+        )
+        aggregations[WeatherSummaryColumns.ANY_RAIN] = pd.NamedAgg(
+            column=WeatherColumns.RAINFALL, aggfunc="any"
+        )
+
+        return grouped.agg(**aggregations).reset_index()